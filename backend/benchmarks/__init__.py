@@ -0,0 +1 @@
+"""Performance benchmarks, run as modules (python -m backend.benchmarks.<name>)."""
@@ -0,0 +1,111 @@
+"""Mixed read/write throughput of the engine profiles.
+
+Usage: python -m backend.benchmarks.engine_profiles [--threads 8] [--seconds 5]
+
+Each thread runs the service layer against a fresh SQLite file: four rental
+listings and car lookups for every rental booked and completed.
+"""
+import argparse
+import random
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from fastapi import HTTPException
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from backend.config import ENGINE_PROFILES
+from backend.db import Base, create_db_engine
+from backend.models import Car, CarStatus, Customer, RentalStatus
+from backend.schemas import RentalCreate, RentalFilter, RentalUpdate
+from backend.services.car_service import CarService
+from backend.services.rental_service import RentalService
+
+CARS = 200
+
+
+def seed(SessionLocal) -> None:
+    """Create cars and a customer to book them."""
+    db = SessionLocal()
+    db.add_all(
+        Car(make="Make", model=f"Model {i}", year=2020, imageUrl="https://example.com/car.jpg",
+            status=CarStatus.AVAILABLE, dailyRate=50.0)
+        for i in range(CARS)
+    )
+    db.add(Customer(name="Bench", email="bench@example.com", licenseNumber="BENCH-1"))
+    db.commit()
+    db.close()
+
+
+def worker(SessionLocal, deadline: float, counts: list, index: int) -> None:
+    """Run the mixed workload until the deadline, counting operations."""
+    rng = random.Random(index)
+    db = SessionLocal()
+    ops = errors = 0
+    while time.perf_counter() < deadline:
+        try:
+            if rng.random() < 0.8:
+                CarService.get_by_id(db, rng.randint(1, CARS))
+                RentalService.get_page(db, RentalFilter(), limit=20)
+            else:
+                car_id = rng.randint(1, CARS)
+                start = date(2025, 1, 1) + timedelta(days=rng.randint(0, 365))
+                rental = RentalService.create(db, RentalCreate(
+                    carId=car_id, customerId=1, startDate=start,
+                    endDate=start + timedelta(days=3), status=RentalStatus.ACTIVE,
+                ))
+                RentalService.update(db, rental.id, RentalUpdate(status=RentalStatus.COMPLETED))
+            ops += 1
+        except (HTTPException, OperationalError):
+            # Car already rented by another thread, or the database was locked
+            db.rollback()
+            errors += 1
+        finally:
+            db.expunge_all()
+    db.close()
+    counts[index] = (ops, errors)
+
+
+def run(profile_name: str, threads: int, seconds: float) -> float:
+    """Run the workload under one profile and return operations per second."""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_db_engine(url, ENGINE_PROFILES[profile_name])
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(autoflush=False, bind=engine)
+        seed(SessionLocal)
+
+        counts = [(0, 0)] * threads
+        deadline = time.perf_counter() + seconds
+        pool = [threading.Thread(target=worker, args=(SessionLocal, deadline, counts, i)) for i in range(threads)]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+        engine.dispose()
+
+    ops = sum(c[0] for c in counts)
+    errors = sum(c[1] for c in counts)
+    print(f"{profile_name:12s} {ops / seconds:10.0f} ops/s  ({errors} rejected)")
+    return ops / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--profiles", nargs="+", default=["development", "production"])
+    args = parser.parse_args()
+
+    results = {name: run(name, args.threads, args.seconds) for name in args.profiles}
+    if "development" in results and len(results) > 1:
+        for name, rate in results.items():
+            if name != "development":
+                print(f"{name}: {rate / results['development']:.2f}x development")
+
+
+if __name__ == "__main__":
+    main()
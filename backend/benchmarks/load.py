@@ -0,0 +1,300 @@
+"""HTTP load test of the API, served in process over ASGI.
+
+Usage:
+    python -m backend.benchmarks.load run [--concurrency 16] [--duration 10]
+        [--write-ratio 0.1] [--output results.json] [--baseline PATH]
+    python -m backend.benchmarks.load compare OLD.json NEW.json
+
+`run` builds a fresh SQLite database, then drives backend.main.app through
+httpx's ASGI transport with `--concurrency` virtual users for `--duration`
+seconds. Each user mixes reads (car, rental and customer listings, car
+lookups, availability searches) with writes (booking a car, then
+completing the rental), and the report gives requests per second and
+p50/p95/p99 latency per endpoint. Results are written as JSON tagged with
+the commit, so two commits can be compared with `compare`, or a run with
+the baseline stored in the repo (`--baseline`, see BASELINE).
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Baseline stored in the repo, refreshed with `run --output` on a quiet machine
+BASELINE = Path(__file__).parent / "baselines" / "load.json"
+
+# Read endpoints and their weights in the read mix
+READS: Tuple[Tuple[str, int], ...] = (
+    ("list cars", 25),
+    ("get car", 30),
+    ("available cars", 10),
+    ("list rentals", 20),
+    ("list customers", 15),
+)
+
+# Statuses counted as rejected rather than errors: a car booked by another user
+REJECTED = {"create rental": (400, 409)}
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Get a percentile of sorted values (nearest rank)."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class Recorder:
+    """Latencies and outcomes of the requests of one run, per endpoint."""
+
+    def __init__(self) -> None:
+        self.latencies: Dict[str, List[float]] = {}
+        self.errors: Dict[str, int] = {}
+        self.rejected: Dict[str, int] = {}
+        self.recording = False
+
+    def add(self, name: str, latency: float, status: int, expected: int) -> None:
+        if not self.recording:
+            return
+        self.latencies.setdefault(name, []).append(latency)
+        if status in REJECTED.get(name, ()):
+            self.rejected[name] = self.rejected.get(name, 0) + 1
+        elif status != expected:
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def summary(self, seconds: float) -> Dict[str, Dict[str, Any]]:
+        """Summarize each endpoint, plus all requests as "total"."""
+        everything = [latency for latencies in self.latencies.values() for latency in latencies]
+        groups = {**{name: self.latencies[name] for name in sorted(self.latencies)}, "total": everything}
+        summary = {}
+        for name, latencies in groups.items():
+            latencies = sorted(latencies)
+            summary[name] = {
+                "requests": len(latencies),
+                "errors": sum(self.errors.values()) if name == "total" else self.errors.get(name, 0),
+                "rejected": sum(self.rejected.values()) if name == "total" else self.rejected.get(name, 0),
+                "rps": round(len(latencies) / seconds, 1),
+                "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 3),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+            }
+        return summary
+
+
+async def timed(client, recorder: Recorder, name: str, expected: int, method: str, url: str, **kwargs):
+    """Send one request and record its latency and status."""
+    started = time.perf_counter()
+    response = await client.request(method, url, **kwargs)
+    recorder.add(name, time.perf_counter() - started, response.status_code, expected)
+    return response
+
+
+async def virtual_user(client, recorder: Recorder, args, index: int, deadline: float) -> None:
+    """Run the request mix until the deadline."""
+    rng = random.Random(args.seed * 1000 + index)
+    names = [name for name, _ in READS]
+    weights = [weight for _, weight in READS]
+    while time.perf_counter() < deadline:
+        if rng.random() < args.write_ratio:
+            start = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+            response = await timed(client, recorder, "create rental", 201, "POST", "/api/rentals", json={
+                "carId": rng.randint(1, args.cars),
+                "customerId": 1,
+                "startDate": start.isoformat(),
+                "endDate": (start + timedelta(days=rng.randint(1, 14))).isoformat(),
+                "status": "ACTIVE",
+            })
+            if response.status_code == 201:
+                await timed(
+                    client, recorder, "complete rental", 200, "PUT",
+                    f"/api/rentals/{response.json()['id']}", json={"status": "COMPLETED"}
+                )
+            continue
+
+        name = rng.choices(names, weights)[0]
+        if name == "list cars":
+            await timed(client, recorder, name, 200, "GET", "/api/cars", params={"limit": 50})
+        elif name == "get car":
+            await timed(client, recorder, name, 200, "GET", f"/api/cars/{rng.randint(1, args.cars)}")
+        elif name == "available cars":
+            start = date(2025, 1, 1) + timedelta(days=rng.randrange(365))
+            await timed(client, recorder, name, 200, "GET", "/api/cars/available", params={
+                "start": start.isoformat(), "end": (start + timedelta(days=7)).isoformat(), "limit": 50
+            })
+        elif name == "list rentals":
+            await timed(client, recorder, name, 200, "GET", "/api/rentals", params={"limit": 50, "sort": "-startDate"})
+        else:
+            await timed(client, recorder, name, 200, "GET", "/api/customers", params={"limit": 50})
+
+
+async def drive(app, args) -> Dict[str, Dict[str, Any]]:
+    """Warm up, then run the virtual users and summarize the measured phase."""
+    import httpx
+
+    recorder = Recorder()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load") as client:
+        for phase, seconds in (("warmup", args.warmup), ("measure", args.duration)):
+            recorder.recording = phase == "measure"
+            deadline = time.perf_counter() + seconds
+            await asyncio.gather(*(
+                virtual_user(client, recorder, args, i, deadline) for i in range(args.concurrency)
+            ))
+    return recorder.summary(args.duration)
+
+
+def git_commit() -> Optional[str]:
+    """Get the current commit, with "+dirty" for uncommitted changes."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True).stdout
+        return commit + ("+dirty" if dirty.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args) -> Dict[str, Any]:
+    """Run the load test on a fresh database and return the results document."""
+    with tempfile.TemporaryDirectory() as tmp:
+        # Settings are read on import, so configure them before importing the app
+        os.environ["ORENTO_DATABASE_URL"] = f"sqlite:///{Path(tmp) / 'load.db'}"
+        os.environ["ORENTO_DB_PROFILE"] = args.profile
+        os.environ["ORENTO_DB_MODE"] = args.db_mode
+
+        from backend.benchmarks.serialization import seed
+        from backend.db import SessionLocal, dispose_async_engine, engine, init_db
+        from backend.main import app
+
+        init_db()
+        with SessionLocal() as db:
+            seed(db, args.cars)
+
+        async def main():
+            try:
+                return await drive(app, args)
+            finally:
+                await dispose_async_engine()
+
+        endpoints = asyncio.run(main())
+        engine.dispose()
+
+    return {
+        "commit": git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "concurrency": args.concurrency,
+            "duration": args.duration,
+            "write_ratio": args.write_ratio,
+            "cars": args.cars,
+            "profile": args.profile,
+            "db_mode": args.db_mode,
+            "seed": args.seed,
+        },
+        "endpoints": endpoints,
+    }
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Print a results document as a table."""
+    params = ", ".join(f"{key}={value}" for key, value in results["params"].items())
+    print(f"commit {results['commit']}  ({params})")
+    print(f"{'endpoint':16s} {'requests':>9s} {'errors':>7s} {'rps':>9s} {'p50 ms':>9s} {'p95 ms':>9s} {'p99 ms':>9s}")
+    for name, stats in results["endpoints"].items():
+        print(
+            f"{name:16s} {stats['requests']:9d} {stats['errors']:7d} {stats['rps']:9.1f} "
+            f"{stats['p50_ms']:9.2f} {stats['p95_ms']:9.2f} {stats['p99_ms']:9.2f}"
+        )
+
+
+def change(old: float, new: float) -> float:
+    """Get the relative change from old to new, in percent."""
+    return (new / old - 1) * 100 if old else 0.0
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], threshold: float) -> int:
+    """Print per-endpoint changes from old to new; return the number of regressions.
+
+    A regression is p95 latency up, or requests per second down, by more
+    than `threshold` percent.
+    """
+    print(f"{old['commit']} -> {new['commit']}")
+    differing = {key for key in old["params"].keys() | new["params"].keys() if old["params"].get(key) != new["params"].get(key)}
+    if differing:
+        print(f"warning: runs used different parameters: {', '.join(sorted(differing))}")
+    print(f"{'endpoint':16s} {'rps':>18s} {'p50 ms':>20s} {'p95 ms':>20s} {'p99 ms':>20s}")
+    regressions = 0
+    checks: List[Tuple[str, Callable[[float], bool]]] = [
+        ("rps", lambda pct: pct < -threshold),
+        ("p50_ms", lambda pct: False),
+        ("p95_ms", lambda pct: pct > threshold),
+        ("p99_ms", lambda pct: False),
+    ]
+    for name, stats in new["endpoints"].items():
+        before = old["endpoints"].get(name)
+        if before is None:
+            print(f"{name:16s} (new)")
+            continue
+        cells = []
+        regressed = False
+        for key, is_regression in checks:
+            pct = change(before[key], stats[key])
+            regressed |= is_regression(pct)
+            cells.append(f"{stats[key]:9.1f} {pct:+7.1f}%  ")
+        regressions += regressed
+        print(f"{name:16s} " + " ".join(cells) + ("REGRESSION" if regressed else ""))
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the load test")
+    run_parser.add_argument("--concurrency", type=int, default=16, help="Virtual users")
+    run_parser.add_argument("--duration", type=float, default=10.0, help="Measured seconds")
+    run_parser.add_argument("--warmup", type=float, default=2.0, help="Unmeasured seconds before")
+    run_parser.add_argument("--write-ratio", type=float, default=0.1, help="Share of iterations that book and complete a rental")
+    run_parser.add_argument("--cars", type=int, default=1000, help="Cars (and past rentals) in the database")
+    run_parser.add_argument("--profile", default="production", help="Engine profile (ORENTO_DB_PROFILE)")
+    run_parser.add_argument("--db-mode", default="sync", choices=("sync", "async"))
+    run_parser.add_argument("--seed", type=int, default=1)
+    run_parser.add_argument("--output", type=Path, help="Write the results JSON here")
+    run_parser.add_argument("--baseline", type=Path, nargs="?", const=BASELINE, help="Compare with a results file (default: the repo baseline)")
+    run_parser.add_argument("--threshold", type=float, default=20.0, help="Regression threshold in percent")
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("old", type=Path)
+    compare_parser.add_argument("new", type=Path)
+    compare_parser.add_argument("--threshold", type=float, default=20.0, help="Regression threshold in percent")
+
+    args = parser.parse_args()
+    if args.command == "compare":
+        regressions = compare(json.loads(args.old.read_text()), json.loads(args.new.read_text()), args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    results = run(args)
+    print_results(results)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        print()
+        regressions = compare(json.loads(args.baseline.read_text()), results, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""Overhead of the query stats and metrics middleware.
+
+Usage: python -m backend.benchmarks.metrics_overhead [--requests 200] [--rounds 30]
+
+Serves the same requests through an app without instrumentation and one
+with QueryStatsMiddleware and MetricsMiddleware (as backend.main runs),
+in alternating short rounds over httpx's ASGI transport, and reports the
+median round of each; the overhead is the median of the paired rounds'
+ratios, which keeps machine noise out of a difference of a few percent.
+It also times the middleware alone around a no-op ASGI app.
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy.orm import sessionmaker
+
+from backend.benchmarks.serialization import seed
+from backend.config import ENGINE_PROFILES
+from backend.db import Base, create_db_engine, get_db, get_read_db
+from backend.instrumentation import QueryStatsMiddleware
+from backend.metrics import MetricsMiddleware
+from backend.routers import api_routers
+
+# Requests of one round, cycled
+PATHS = ("/api/cars?limit=20", "/api/cars/1", "/api/rentals?limit=20", "/api/customers/1")
+
+
+def build_app(SessionLocal, instrumented: bool) -> FastAPI:
+    """Build an API app on the benchmark database."""
+    app = FastAPI()
+    for router in api_routers("sync"):
+        app.include_router(router)
+
+    def override_get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    if instrumented:
+        app.add_middleware(QueryStatsMiddleware)
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def run_round(app: FastAPI, requests: int) -> float:
+    """Serve `requests` requests one after another; return the mean latency in ms."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+        for i in range(requests):
+            response = await client.get(PATHS[i % len(PATHS)])
+            assert response.status_code == 200, response.text
+        return (time.perf_counter() - started) / requests * 1000
+
+
+async def middleware_cost(calls: int = 100_000) -> float:
+    """Time the two middleware around a no-op app; return microseconds per request."""
+    route = type("Route", (), {"path": "/api/cars"})
+
+    async def endpoint(scope, receive, send):
+        scope["route"] = route
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    timings = []
+    for app in (endpoint, MetricsMiddleware(QueryStatsMiddleware(endpoint))):
+        started = time.perf_counter()
+        for _ in range(calls):
+            await app({"type": "http", "method": "GET", "path": "/api/cars"}, None, send)
+        timings.append((time.perf_counter() - started) / calls * 1e6)
+    return timings[1] - timings[0]
+
+
+async def run(args) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", ENGINE_PROFILES["test"])
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(autoflush=False, bind=engine)
+        with SessionLocal() as db:
+            seed(db, args.rows)
+
+        apps = {"plain": build_app(SessionLocal, False), "metrics": build_app(SessionLocal, True)}
+        for app in apps.values():
+            await run_round(app, len(PATHS) * 10)  # warm up
+        rounds = {name: [] for name in apps}
+        for i in range(args.rounds):
+            # Alternate which app goes first
+            for name in (("plain", "metrics") if i % 2 == 0 else ("metrics", "plain")):
+                rounds[name].append(await run_round(apps[name], args.requests))
+        engine.dispose()
+
+    for name, latencies in rounds.items():
+        print(f"{name:8s} {statistics.median(latencies):7.3f} ms/request")
+    ratios = [instrumented / plain for plain, instrumented in zip(rounds["plain"], rounds["metrics"])]
+    print(f"overhead {(statistics.median(ratios) - 1) * 100:+.1f}%")
+    print(f"middleware alone: {await middleware_cost():.1f} us/request")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=30)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,355 @@
+"""Micro-benchmarks of the service, schema and cost calculation layers.
+
+Usage:
+    python -m backend.benchmarks.micro run [--filter 'services/*'] [--output results.json]
+        [--baseline PATH] [--threshold 20] [--threshold-for 'services/*=30']
+    python -m backend.benchmarks.micro compare OLD.json NEW.json [--normalize]
+
+`run` times each benchmark in isolation: service methods against an
+in-memory SQLite database filled by backend.datagen, schema validation
+(including the validate_year and validate_end_date validators) and CarRead
+serialization, and total cost calculation. Each benchmark is calibrated to
+run for at least `--min-time` seconds per sample, and the best and median
+of `--repeat` samples, taken in rounds over all benchmarks, are reported
+per call. Results are JSON tagged with the commit, like
+backend.benchmarks.load, so a slowdown shows up in the benchmark, and
+layer, that caused it.
+
+A calibration loop of fixed pure-Python work is timed in the same rounds
+and stored apart from the benchmarks, as a measure of the machine's speed.
+
+A benchmark regresses when its median time per call rises by more than its
+threshold: `--threshold` percent, or the last matching `--threshold-for
+PATTERN=PERCENT` (fnmatch on the benchmark name), or THRESHOLDS.
+"""
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from fnmatch import fnmatch
+from itertools import count
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.benchmarks.load import change, git_commit
+
+# Baseline stored in the repo, refreshed with `run --output` on a quiet machine
+BASELINE = Path(__file__).parent / "baselines" / "micro.json"
+
+# Default regression thresholds in percent, by benchmark name pattern; the
+# last match wins. Database round trips vary more than pure Python
+THRESHOLDS: Tuple[Tuple[str, float], ...] = (
+    ("*", 25.0),
+    ("services/*", 30.0),
+)
+
+# Name of the calibration loop in the measured samples; never judged
+CALIBRATION = "calibration"
+
+CAR = {
+    "make": "Toyota",
+    "model": "Corolla",
+    "year": 2022,
+    "imageUrl": "https://images.example.com/cars/toyota-corolla.jpg",
+    "status": "AVAILABLE",
+    "dailyRate": 45.5,
+}
+RENTAL = {"carId": 1, "customerId": 1, "startDate": "2025-03-01", "endDate": "2025-03-08", "status": "COMPLETED"}
+
+
+@dataclass
+class Benchmark:
+    """A named function to time; the name's first part is its layer."""
+    name: str
+    fn: Callable[[], Any]
+
+
+def calibration_loop() -> int:
+    """Fixed pure-Python work, independent of the code under test."""
+    total = 0
+    for i in range(1000):
+        total += i * i % 7
+    return total
+
+
+def calibrate(fn: Callable[[], Any], min_time: float) -> int:
+    """Get the number of calls that takes at least `min_time` seconds."""
+    loops = 1
+    while True:
+        if sample(fn, loops) * loops >= min_time:
+            return loops
+        loops *= 2
+
+
+def sample(fn: Callable[[], Any], loops: int) -> float:
+    """Call fn `loops` times; return the seconds per call."""
+    started = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - started) / loops
+
+
+def measure(selected: List[Benchmark], repeat: int, min_time: float) -> Dict[str, Dict[str, Any]]:
+    """Time the benchmarks; return the loops per sample and best and median microseconds per call.
+
+    Samples are taken in rounds over all benchmarks rather than benchmark
+    by benchmark, so a slow spell of the machine spreads over all of them
+    instead of skewing a few.
+    """
+    loops = {benchmark.name: calibrate(benchmark.fn, min_time) for benchmark in selected}
+    samples: Dict[str, List[float]] = {benchmark.name: [] for benchmark in selected}
+    for _ in range(repeat):
+        for benchmark in selected:
+            samples[benchmark.name].append(sample(benchmark.fn, loops[benchmark.name]))
+    return {
+        name: {
+            "loops": loops[name],
+            "best_us": round(min(times) * 1e6, 3),
+            "median_us": round(statistics.median(times) * 1e6, 3),
+        }
+        for name, times in samples.items()
+    }
+
+
+def benchmarks(db, cars: int, customers: int) -> List[Benchmark]:
+    """Build the benchmarks against a session on the generated database."""
+    from backend.models import Car, RentalStatus
+    from backend.schemas import CarCreate, CarRead, CustomerCreate, RentalCreate, RentalFilter, RentalUpdate
+    from backend.serialization import list_serializer
+    from backend.services.car_service import CarService
+    from backend.services.customer_service import CustomerService
+    from backend.services.pricing_service import PricingService
+    from backend.services.rental_service import RentalService
+
+    # Rotate through rows so lookups do not always hit the same pages
+    car_ids = count()
+    customer_ids = count()
+
+    def next_car() -> int:
+        return next(car_ids) % cars + 1
+
+    def next_customer() -> int:
+        return next(customer_ids) % customers + 1
+
+    def create_delete_car():
+        car = CarService.create(db, CarCreate(**CAR))
+        CarService.delete(db, car.id)
+
+    emails = count()
+
+    def create_delete_customer():
+        i = next(emails)
+        customer = CustomerService.create(db, CustomerCreate(
+            name="Bench Customer", email=f"bench.{i}@example.com", phone="+1-555-0100", licenseNumber=f"BENCH-{i}"
+        ))
+        CustomerService.delete(db, customer.id)
+
+    # A car of its own keeps rental writes away from the generated bookings
+    spare = CarService.create(db, CarCreate(**{**CAR, "model": "Spare"}))
+    rental_data = RentalCreate(**{**RENTAL, "carId": spare.id, "status": RentalStatus.COMPLETED})
+
+    def create_delete_rental():
+        rental = RentalService.create(db, rental_data)
+        RentalService.delete(db, rental.id)
+
+    bench_rental = RentalService.create(db, rental_data)
+    end_dates = (date(2025, 3, 8), date(2025, 3, 15))
+    updates = count()
+
+    def update_rental():
+        RentalService.update(db, bench_rental.id, RentalUpdate(endDate=end_dates[next(updates) % 2]))
+
+    window = (date(2025, 7, 1), date(2025, 7, 8))
+    orm_car = db.get(Car, 1)
+    car_records = CarService.get_page(db, limit=50)[0]
+    car_read = CarRead.model_validate(orm_car)
+    car_list = list_serializer(CarRead)
+    invalid_rental = {**RENTAL, "endDate": "2025-02-01"}
+
+    def rental_create_invalid():
+        try:
+            RentalCreate.model_validate(invalid_rental)
+        except ValueError:
+            pass
+
+    start, end = date(2025, 3, 1), date(2025, 3, 15)
+    return [
+        Benchmark("services/car.get_by_id", lambda: CarService.get_by_id(db, next_car())),
+        Benchmark("services/car.get_page", lambda: CarService.get_page(db, limit=50)),
+        Benchmark("services/car.get_available", lambda: CarService.get_available(db, *window, limit=50)),
+        Benchmark("services/car.create+delete", create_delete_car),
+        Benchmark("services/customer.get_by_id", lambda: CustomerService.get_by_id(db, next_customer())),
+        Benchmark("services/customer.get_page", lambda: CustomerService.get_page(db, limit=50)),
+        Benchmark("services/customer.create+delete", create_delete_customer),
+        Benchmark("services/rental.get_by_id", lambda: RentalService.get_by_id(db, bench_rental.id)),
+        Benchmark("services/rental.get_page", lambda: RentalService.get_page(db, RentalFilter(), limit=50)),
+        Benchmark("services/rental.create+delete", create_delete_rental),
+        Benchmark("services/rental.update", update_rental),
+        Benchmark("schemas/CarCreate", lambda: CarCreate.model_validate(CAR)),
+        Benchmark("schemas/CarCreate.validate_year", lambda: CarCreate.validate_year(2022)),
+        Benchmark("schemas/RentalCreate", lambda: RentalCreate.model_validate(RENTAL)),
+        Benchmark("schemas/RentalCreate.invalid_end_date", rental_create_invalid),
+        Benchmark("schemas/CarRead.from_orm", lambda: CarRead.model_validate(orm_car)),
+        Benchmark("schemas/CarRead.dump_json", car_read.model_dump_json),
+        Benchmark("schemas/CarRead.list_50", lambda: car_list.dump(car_records)),
+        Benchmark("cost/calculate_total_cost", lambda: RentalService._calculate_total_cost(start, end, 45.5)),
+        Benchmark("cost/pricing_calendar", lambda: PricingService.calculate_total_cost(db, start, end, 45.5)),
+    ]
+
+
+def run(args) -> Dict[str, Any]:
+    """Run the matching benchmarks on a fresh in-memory database and return the results document."""
+    from sqlalchemy.orm import Session
+
+    from backend.cache import caches
+    from backend.config import ENGINE_PROFILES
+    from backend.datagen import DatasetSpec, generate
+    from backend.db import create_db_engine
+
+    engine = create_db_engine("sqlite://", ENGINE_PROFILES["test"])
+    spec = DatasetSpec(cars=args.cars, customers=args.customers, rentals=args.rentals, seed=args.seed)
+    generate(engine, spec, rollups=True, progress=lambda message: None)
+
+    with Session(engine, autoflush=False) as db:
+        selected = [
+            benchmark for benchmark in benchmarks(db, args.cars, args.customers)
+            if not args.filter or any(fnmatch(benchmark.name, pattern) for pattern in args.filter)
+        ]
+        results = measure([*selected, Benchmark(CALIBRATION, calibration_loop)], args.repeat, args.min_time)
+    calibration = results.pop(CALIBRATION)
+    engine.dispose()
+    for cache in caches.values():
+        cache.clear()
+
+    return {
+        "commit": git_commit(),
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": {
+            "cars": args.cars,
+            "customers": args.customers,
+            "rentals": args.rentals,
+            "seed": args.seed,
+            "repeat": args.repeat,
+            "min_time": args.min_time,
+        },
+        "calibration": calibration,
+        "benchmarks": results,
+    }
+
+
+def parse_threshold(value: str) -> Tuple[str, float]:
+    """Parse a PATTERN=PERCENT threshold."""
+    pattern, sep, percent = value.rpartition("=")
+    try:
+        if not sep or not pattern:
+            raise ValueError
+        return pattern, float(percent)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected PATTERN=PERCENT, got {value!r}")
+
+
+def threshold_for(name: str, thresholds: List[Tuple[str, float]]) -> float:
+    """Get a benchmark's threshold: the last matching pattern's."""
+    matching = [percent for pattern, percent in thresholds if fnmatch(name, pattern)]
+    return matching[-1]
+
+
+def compare(old: Dict[str, Any], new: Dict[str, Any], thresholds: List[Tuple[str, float]], normalize: bool = False) -> int:
+    """Print per-benchmark changes from old to new; return the number of regressions.
+
+    Changes are judged on the raw median time per call. With `normalize`,
+    they are judged relative to the drift: the change of the calibration
+    loop, which is how much faster or slower the machine was. The drift is
+    measured apart from the benchmarks, so a regression cannot shift it.
+    """
+    print(f"{old['commit']} -> {new['commit']}")
+    differing = {key for key in old["params"].keys() | new["params"].keys() if old["params"].get(key) != new["params"].get(key)}
+    if differing:
+        print(f"warning: runs used different parameters: {', '.join(sorted(differing))}")
+    drift = 1.0
+    if normalize and "calibration" in old and "calibration" in new:
+        drift = new["calibration"]["median_us"] / old["calibration"]["median_us"]
+        print(f"drift {change(1.0, drift):+.1f}% (change of the calibration loop; changes below are relative to it)")
+    elif normalize:
+        print("warning: a run has no calibration loop; comparing raw changes")
+    print(f"{'benchmark':40s} {'best us':>11s} {'median us':>20s} {'limit':>7s}")
+    regressions = 0
+    for name, stats in new["benchmarks"].items():
+        before = old["benchmarks"].get(name)
+        if before is None:
+            print(f"{name:40s} (new)")
+            continue
+        limit = threshold_for(name, thresholds)
+        median = change(before["median_us"] * drift, stats["median_us"])
+        regressed = median > limit
+        regressions += regressed
+        print(
+            f"{name:40s} {stats['best_us']:11.2f} {stats['median_us']:11.2f} {median:+7.1f}% "
+            f"{limit:6.0f}% " + ("REGRESSION" if regressed else "")
+        )
+    return regressions
+
+
+def print_results(results: Dict[str, Any]) -> None:
+    """Print a results document as a table."""
+    params = ", ".join(f"{key}={value}" for key, value in results["params"].items())
+    print(f"commit {results['commit']}  ({params})")
+    print(f"{'benchmark':40s} {'loops':>8s} {'best us':>12s} {'median us':>12s}")
+    for name, stats in results["benchmarks"].items():
+        print(f"{name:40s} {stats['loops']:8d} {stats['best_us']:12.2f} {stats['median_us']:12.2f}")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the micro-benchmarks")
+    run_parser.add_argument("--filter", action="append", help="Only run benchmarks matching this pattern (repeatable)")
+    run_parser.add_argument("--repeat", type=int, default=15, help="Samples per benchmark")
+    run_parser.add_argument("--min-time", type=float, default=0.02, help="Minimum seconds per sample")
+    run_parser.add_argument("--cars", type=int, default=1000)
+    run_parser.add_argument("--customers", type=int, default=5000)
+    run_parser.add_argument("--rentals", type=int, default=50_000)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--output", type=Path, help="Write the results JSON here")
+    run_parser.add_argument("--baseline", type=Path, nargs="?", const=BASELINE, help="Compare with a results file (default: the repo baseline)")
+
+    compare_parser = commands.add_parser("compare", help="Compare two results files")
+    compare_parser.add_argument("old", type=Path)
+    compare_parser.add_argument("new", type=Path)
+
+    for command in (run_parser, compare_parser):
+        command.add_argument("--normalize", action="store_true", help="Judge changes relative to the calibration loop's drift")
+        command.add_argument("--threshold", type=float, help="Regression threshold in percent for every benchmark")
+        command.add_argument(
+            "--threshold-for", type=parse_threshold, action="append", default=[], metavar="PATTERN=PERCENT",
+            help="Regression threshold for benchmarks matching a pattern, e.g. 'cost/*=10' (repeatable)"
+        )
+
+    args = parser.parse_args(argv)
+    thresholds = list(THRESHOLDS) if args.threshold is None else [("*", args.threshold)]
+    thresholds += args.threshold_for
+
+    if args.command == "compare":
+        regressions = compare(json.loads(args.old.read_text()), json.loads(args.new.read_text()), thresholds, args.normalize)
+        sys.exit(1 if regressions else 0)
+
+    results = run(args)
+    print_results(results)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.baseline:
+        print()
+        regressions = compare(json.loads(args.baseline.read_text()), results, thresholds, args.normalize)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Cost of list reads as ORM instances versus Core column records.
+
+Usage: python -m backend.benchmarks.records [--rows 100000]
+
+Reads every car and rental through the ORM (the previous list path) and
+through the record selects the services use now, reporting wall time and
+the peak and retained memory of each read.
+"""
+import argparse
+import gc
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy.orm import sessionmaker
+
+from backend.benchmarks.serialization import seed
+from backend.config import ENGINE_PROFILES
+from backend.db import Base, create_db_engine
+from backend.models import Car, Rental
+from backend.services.car_service import CarService
+from backend.services.rental_service import RentalService
+
+
+def measure(label: str, SessionLocal, read) -> None:
+    """Print time, peak and retained memory of one read on a fresh session."""
+    db = SessionLocal()
+    gc.collect()
+    started = time.perf_counter()
+    rows = read(db)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    rows = None
+    rows = read(db)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:8s} {elapsed * 1000:8.1f} ms   peak {peak / 2**20:7.1f} MiB   retained {retained / 2**20:7.1f} MiB")
+    db.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", ENGINE_PROFILES["test"])
+        Base.metadata.create_all(engine)
+        SessionLocal = sessionmaker(bind=engine)
+        with SessionLocal() as db:
+            seed(db, args.rows)
+
+        for name, model, service in (("cars", Car, CarService), ("rentals", Rental, RentalService)):
+            print(f"{name} x {args.rows}")
+            measure("orm", SessionLocal, lambda db: db.query(model).order_by(model.id).all())
+            measure("records", SessionLocal, lambda db: service.get_page(db)[0])
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
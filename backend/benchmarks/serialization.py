@@ -0,0 +1,91 @@
+"""Serialization cost of large list responses.
+
+Usage: python -m backend.benchmarks.serialization [--rows 100000]
+
+Serializes the same ORM rows with FastAPI's response_model path (validate
+then dump JSON), the older jsonable_encoder path and backend.serialization,
+and checks that the fast path produces identical bytes.
+"""
+import argparse
+import json
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from backend.config import ENGINE_PROFILES
+from backend.db import Base, create_db_engine
+from backend.models import Car, CarStatus, Customer, Rental, RentalStatus
+from backend.schemas import CarRead, RentalRead
+from backend.serialization import list_serializer
+
+
+def seed(db, rows: int) -> None:
+    """Insert `rows` cars and rentals."""
+    db.execute(insert(Customer), [{"name": "Bench", "email": "bench@example.com", "licenseNumber": "BENCH-1"}])
+    db.execute(insert(Car), [
+        {"make": "Make", "model": f"Model {i}", "year": 2020, "imageUrl": "https://example.com/car.jpg",
+         "status": CarStatus.AVAILABLE, "dailyRate": 40 + (i % 100) * 0.25}
+        for i in range(rows)
+    ])
+    start = date(2024, 1, 1)
+    db.execute(insert(Rental), [
+        {"carId": i + 1, "customerId": 1, "startDate": start + timedelta(days=i % 365),
+         "endDate": start + timedelta(days=i % 365 + 3), "status": RentalStatus.COMPLETED,
+         "totalCost": 120.75}
+        for i in range(rows)
+    ])
+    db.commit()
+
+
+def best_of(repeat: int, fn) -> float:
+    """Best wall time of `repeat` calls, in milliseconds."""
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return min(times) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", ENGINE_PROFILES["test"])
+        Base.metadata.create_all(engine)
+        db = sessionmaker(bind=engine)()
+        seed(db, args.rows)
+
+        for model, schema in ((Car, CarRead), (Rental, RentalRead)):
+            rows = db.query(model).all()
+            adapter = TypeAdapter(List[schema])
+            response_model = lambda: adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+            encoder = lambda: json.dumps(
+                jsonable_encoder(adapter.validate_python(rows, from_attributes=True)),
+                ensure_ascii=False, separators=(",", ":")
+            ).encode()
+            fast = lambda: list_serializer(schema).dump(rows)
+            assert fast() == response_model(), f"{schema.__name__} payloads differ"
+
+            baseline = best_of(args.repeat, response_model)
+            print(f"{schema.__name__} x {len(rows)}")
+            print(f"  jsonable_encoder   {best_of(1, encoder):8.1f} ms")
+            print(f"  response_model     {baseline:8.1f} ms")
+            fast_ms = best_of(args.repeat, fast)
+            print(f"  fast serializer    {fast_ms:8.1f} ms  ({baseline / fast_ms:.1f}x)")
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Table version counters, conditional GET support and in-process caches."""
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import HTTPException, Request, Response
+
+from backend.config import settings
+
+
+class TableVersions:
+    """Per-table counters bumped by the services after every committed write.
+
+    Counters live in the process, so writes made elsewhere (another worker
+    process, a script writing to the database file) are not seen. The token
+    changes on every start, so ETags from another process or an earlier run
+    never match.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._versions: Dict[str, int] = {}
+        self.token = uuid.uuid4().hex[:12]
+
+    def get(self, *tables: str) -> Tuple[int, ...]:
+        """Get the current versions of the tables."""
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def bump(self, *tables: str) -> None:
+        """Mark the tables as changed."""
+        with self._lock:
+            for table in tables:
+                self._versions[table] = self._versions.get(table, 0) + 1
+
+    def etag(self, *tables: str) -> str:
+        """Get a strong ETag for data read from the tables."""
+        versions = ".".join(str(version) for version in self.get(*tables))
+        return f'"{self.token}-{versions}"'
+
+
+table_versions = TableVersions()
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+class ConditionalGet:
+    """Dependency adding an ETag to GET responses and answering 304 Not Modified.
+
+    The ETag is built from the versions of the tables the endpoint reads, so
+    an unchanged resource is answered before a database session is used.
+    Add it to the route's `dependencies` so it runs before the endpoint's
+    own dependencies. Reads that may be served by a lagging replica get no
+    ETag, like the caches not storing replica reads, so stale rows are
+    never labelled with the current versions.
+    """
+
+    def __init__(self, *tables: str) -> None:
+        self.tables = tables
+
+    def __call__(self, request: Request, response: Response) -> None:
+        # Imported here: backend.db imports backend.metrics, which imports this module
+        from backend.db import may_read_replica
+
+        if may_read_replica(request):
+            return
+        etag = table_versions.etag(*self.tables)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and etag_matches(if_none_match, etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+
+
+# Named caches by name
+caches: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after `ttl` seconds.
+
+    Writers invalidate keys after committing. A value loaded while any
+    invalidation happened is not stored, so a read that started before a
+    commit cannot put stale data back into the cache. Values read from a
+    replica should not be stored either (`store=False`), so clients reading
+    their own writes from the primary never get lagging data. A disabled
+    cache stores nothing and counts every lookup as a miss. Named caches are
+    listed in `caches`, for metrics.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, enabled: bool = True, name: Optional[str] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._epoch = 0
+        if name is not None:
+            caches[name] = self
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def token(self) -> int:
+        """Get a token to pass to `set` for a value about to be loaded."""
+        return self._epoch
+
+    def set(self, key: Hashable, value: Any, token: int) -> None:
+        """Store a value unless the cache was invalidated since `token`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            if token != self._epoch:
+                return
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, load: Callable[[], Any], store: bool = True) -> Any:
+        """Get a cached value, loading it on a miss and storing it if `store`."""
+        value = self.get(key)
+        if value is None:
+            token = self.token()
+            value = load()
+            if store:
+                self.set(key, value, token)
+        return value
+
+    async def aget_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]], store: bool = True) -> Any:
+        """Like `get_or_load`, awaiting `load` on a miss."""
+        value = self.get(key)
+        if value is None:
+            token = self.token()
+            value = await load()
+            if store:
+                self.set(key, value, token)
+        return value
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop the keys from the cache."""
+        with self._lock:
+            self._epoch += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the size and hit/miss counters of the cache."""
+        lookups = self.hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hitRatio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+# Car snapshots by id, plus the serialized full car list
+car_cache = TTLCache(
+    maxsize=settings.car_cache_size,
+    ttl=settings.car_cache_ttl,
+    enabled=settings.car_cache_enabled,
+    name="car"
+)
+
+# Car search facet counts by filter selection, dropped on every car write
+car_facet_cache = TTLCache(
+    maxsize=1024,
+    ttl=settings.car_cache_ttl,
+    enabled=settings.car_cache_enabled,
+    name="car_facets"
+)
@@ -0,0 +1,73 @@
+"""Maintenance commands, run with `python -m backend.cli <command>`."""
+import argparse
+import sys
+from dataclasses import replace
+from datetime import date
+from typing import List, Optional
+
+import backend.models  # noqa: F401 - registers the tables for init_db
+from backend.config import settings
+from backend.datagen import DatasetSpec, generate
+from backend.db import SessionLocal, create_db_engine, init_db
+from backend.services.analytics_service import AnalyticsService
+
+
+def rebuild_rollups(args: argparse.Namespace) -> None:
+    """Recompute the analytics rollups from the rentals table."""
+    init_db()
+    db = SessionLocal()
+    try:
+        rows = AnalyticsService.rebuild(db)
+    finally:
+        db.close()
+    print(f"Rebuilt {rows} rollup rows.")
+
+
+def generate_dataset(args: argparse.Namespace) -> None:
+    """Fill a database with a synthetic dataset."""
+    spec = DatasetSpec(
+        cars=args.cars,
+        customers=args.customers,
+        rentals=args.rentals,
+        start=args.start,
+        end=args.end,
+        seed=args.seed
+    )
+    # Synthetic data needs no durability while loading
+    engine = create_db_engine(args.database_url, replace(settings.engine, synchronous="OFF"))
+    try:
+        counts = generate(engine, spec, replace=args.replace, rollups=not args.no_rollups)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    finally:
+        engine.dispose()
+    print("Generated " + ", ".join(f"{count} {name}" for name, count in counts.items()) + ".")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Parse the command line and run the command."""
+    parser = argparse.ArgumentParser(prog="python -m backend.cli", description="O-Rento maintenance commands")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-rollups", help="Backfill the analytics rollups from all rentals")
+    rebuild.set_defaults(handler=rebuild_rollups)
+
+    defaults = DatasetSpec()
+    gen = commands.add_parser("generate", help="Fill a database with a deterministic synthetic dataset")
+    gen.add_argument("--cars", type=int, default=defaults.cars)
+    gen.add_argument("--customers", type=int, default=defaults.customers)
+    gen.add_argument("--rentals", type=int, default=defaults.rentals)
+    gen.add_argument("--start", type=date.fromisoformat, default=defaults.start, help="First day of the rental history")
+    gen.add_argument("--end", type=date.fromisoformat, default=defaults.end, help="Day the history ends; active rentals run past it")
+    gen.add_argument("--seed", type=int, default=defaults.seed)
+    gen.add_argument("--database-url", default=settings.database_url, help="Defaults to ORENTO_DATABASE_URL")
+    gen.add_argument("--replace", action="store_true", help="Drop and recreate all tables first")
+    gen.add_argument("--no-rollups", action="store_true", help="Skip building the analytics rollups")
+    gen.set_defaults(handler=generate_dataset)
+
+    args = parser.parse_args(argv)
+    args.handler(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Application settings read from environment variables."""
+import os
+from dataclasses import dataclass, field, fields, replace
+from typing import Dict, Optional, Tuple
+
+DB_MODES = ("sync", "async")
+
+
+@dataclass(frozen=True)
+class EngineProfile:
+    """SQLite pragmas and connection pool settings for the database engines.
+
+    Pragmas left as None keep SQLite's own default. Pool settings only
+    apply to file databases; in-memory databases use a single connection
+    per thread.
+    """
+    journal_mode: Optional[str] = None
+    synchronous: Optional[str] = None
+    mmap_size: Optional[int] = None
+    # Page cache size; negative values are KiB, positive values pages
+    cache_size: Optional[int] = None
+    # Milliseconds a connection waits for a lock before raising "database is locked"
+    busy_timeout: Optional[int] = 5000
+    pool_size: int = 5
+    max_overflow: int = 10
+    # Seconds after which pooled connections are replaced; -1 never
+    pool_recycle: int = -1
+
+
+ENGINE_PROFILES: Dict[str, EngineProfile] = {
+    # SQLite defaults: rollback journal and a full fsync on every commit
+    "development": EngineProfile(),
+    # WAL lets readers run alongside the writer, and synchronous=NORMAL only
+    # syncs at checkpoints, which is still durable against application
+    # crashes. Reads are served from a 256 MiB memory map and a 64 MiB cache
+    "production": EngineProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        busy_timeout=5000,
+        pool_size=20,
+        max_overflow=20,
+        pool_recycle=3600,
+    ),
+    # Throwaway databases; durability does not matter
+    "test": EngineProfile(
+        synchronous="OFF",
+        busy_timeout=5000,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Runtime configuration.
+
+    - ORENTO_DATABASE_URL: SQLAlchemy URL of the database
+    - ORENTO_DB_MODE: "sync" (threadpool endpoints, default) or "async"
+      (AsyncSession endpoints on aiosqlite)
+    - ORENTO_DB_PROFILE: engine profile from ENGINE_PROFILES, default
+      "development". Single profile values can be overridden with
+      ORENTO_DB_<FIELD>, e.g. ORENTO_DB_POOL_SIZE=50
+    - ORENTO_DATABASE_REPLICA_URLS: comma-separated URLs of read replicas;
+      reads use the primary database when empty
+    - ORENTO_READ_YOUR_WRITES_SECONDS: how long a client reads from the
+      primary after a write, default 5
+    - ORENTO_CAR_CACHE: "0" disables the in-process car and car facet caches
+    - ORENTO_CAR_CACHE_TTL / ORENTO_CAR_CACHE_SIZE: seconds a cached car is
+      trusted (default 60) and the maximum number of cached entries
+      (default 10000)
+    - ORENTO_FAST_JSON: "0" serializes list responses through FastAPI's
+      response_model path instead of backend.serialization
+    - ORENTO_DEBUG: "1" adds SQL query stats headers to responses and the
+      /debug/queries per-route stats endpoint
+    """
+    database_url: str = "sqlite:///./orento.db"
+    db_mode: str = "sync"
+    db_profile: str = "development"
+    engine: EngineProfile = field(default_factory=EngineProfile)
+    replica_urls: Tuple[str, ...] = ()
+    read_your_writes_seconds: int = 5
+    car_cache_enabled: bool = True
+    car_cache_ttl: float = 60.0
+    car_cache_size: int = 10000
+    fast_json: bool = True
+    debug: bool = False
+
+
+def load_engine_profile(name: str) -> EngineProfile:
+    """Get a named engine profile with ORENTO_DB_<FIELD> overrides applied."""
+    if name not in ENGINE_PROFILES:
+        raise ValueError(f"ORENTO_DB_PROFILE must be one of {', '.join(ENGINE_PROFILES)}, got {name!r}")
+    overrides = {}
+    for profile_field in fields(EngineProfile):
+        value = os.environ.get(f"ORENTO_DB_{profile_field.name.upper()}")
+        if value is None:
+            continue
+        if profile_field.name in ("journal_mode", "synchronous"):
+            overrides[profile_field.name] = value.upper()
+        else:
+            overrides[profile_field.name] = int(value)
+    return replace(ENGINE_PROFILES[name], **overrides)
+
+
+def load_settings() -> Settings:
+    """Build settings from the environment, falling back to defaults."""
+    defaults = Settings()
+    db_mode = os.environ.get("ORENTO_DB_MODE", defaults.db_mode).lower()
+    if db_mode not in DB_MODES:
+        raise ValueError(f"ORENTO_DB_MODE must be one of {', '.join(DB_MODES)}, got {db_mode!r}")
+    db_profile = os.environ.get("ORENTO_DB_PROFILE", defaults.db_profile).lower()
+    return Settings(
+        database_url=os.environ.get("ORENTO_DATABASE_URL", defaults.database_url),
+        db_mode=db_mode,
+        db_profile=db_profile,
+        engine=load_engine_profile(db_profile),
+        replica_urls=tuple(
+            url.strip()
+            for url in os.environ.get("ORENTO_DATABASE_REPLICA_URLS", "").split(",")
+            if url.strip()
+        ),
+        read_your_writes_seconds=int(
+            os.environ.get("ORENTO_READ_YOUR_WRITES_SECONDS", defaults.read_your_writes_seconds)
+        ),
+        car_cache_enabled=os.environ.get("ORENTO_CAR_CACHE", "1").lower() not in ("0", "false", "no"),
+        car_cache_ttl=float(os.environ.get("ORENTO_CAR_CACHE_TTL", defaults.car_cache_ttl)),
+        car_cache_size=int(os.environ.get("ORENTO_CAR_CACHE_SIZE", defaults.car_cache_size)),
+        fast_json=os.environ.get("ORENTO_FAST_JSON", "1").lower() not in ("0", "false", "no"),
+        debug=os.environ.get("ORENTO_DEBUG", "0").lower() in ("1", "true", "yes"),
+    )
+
+
+settings = load_settings()
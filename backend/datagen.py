@@ -0,0 +1,264 @@
+"""Deterministic synthetic datasets for benchmarking and profiling.
+
+Run with `python -m backend.cli generate`. The same arguments (including
+--end) and seed always produce the same database.
+"""
+import random
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from backend.db import Base
+from backend.models import Car, CarStatus, Customer, Rental, RentalStatus
+from backend.services.analytics_service import AnalyticsService
+from backend.services.rental_service import RentalService
+
+# Rows per INSERT executemany; each table is loaded in one transaction
+BATCH_SIZE = 20_000
+
+# Makes, their models and typical daily rates
+MODELS = {
+    "Toyota": {"Corolla": 39.0, "Camry": 49.0, "RAV4": 59.0, "Prius": 45.0},
+    "Honda": {"Civic": 42.0, "Accord": 52.0, "CR-V": 58.0},
+    "Ford": {"Focus": 32.0, "Fusion": 44.0, "Escape": 55.0, "Mustang": 85.0},
+    "Tesla": {"Model 3": 89.0, "Model Y": 99.0},
+    "BMW": {"3 Series": 95.0, "X5": 140.0},
+    "Volkswagen": {"Golf": 38.0, "Passat": 47.0, "Tiguan": 57.0},
+    "Hyundai": {"Elantra": 36.0, "Tucson": 52.0},
+    "Kia": {"Rio": 29.0, "Sportage": 50.0},
+}
+
+FIRST_NAMES = ("Alice", "Bob", "Charlie", "Diana", "Ethan", "Fatima", "George", "Hana", "Ivan", "Julia",
+               "Kofi", "Lena", "Mateo", "Nina", "Omar", "Priya", "Quinn", "Rosa", "Sven", "Tara")
+LAST_NAMES = ("Johnson", "Smith", "Davis", "Garcia", "Nguyen", "Kowalski", "Okafor", "Rossi", "Tanaka",
+              "Müller", "Haddad", "Silva", "Andersen", "Novak", "Ivanova", "Murphy", "Cohen", "Kim")
+
+# Rental lengths in days and their weights: weekend trips, weeks, fortnights, months
+DURATIONS = ((1, 3), (4, 7), (8, 14), (15, 30))
+DURATION_WEIGHTS = (45, 35, 15, 5)
+
+# Summer and December are busy, January and February quiet
+MONTH_DEMAND = (0.6, 0.65, 0.8, 0.9, 1.0, 1.3, 1.5, 1.5, 1.0, 0.85, 0.8, 1.2)
+
+CANCELLED_SHARE = 0.04
+MAINTENANCE_SHARE = 0.03
+# Share of cars out on a rental at the end of the generated period
+ACTIVE_SHARE = 0.3
+
+
+@dataclass
+class DatasetSpec:
+    """Size, period and seed of a generated dataset."""
+    cars: int = 1000
+    customers: int = 10_000
+    rentals: int = 100_000
+    start: date = date(2021, 1, 1)
+    end: date = date(2026, 1, 1)
+    seed: int = 42
+
+
+def _rentals_per_car(spec: DatasetSpec, rng: random.Random) -> List[int]:
+    """Split the rentals over the cars, some cars being much more popular than others.
+
+    A car gets at most one rental start per two days of the period, so
+    bookings keep gaps between them.
+    """
+    days = (spec.end - spec.start).days
+    cap = days // 2
+    if spec.rentals > spec.cars * cap:
+        raise ValueError(
+            f"{spec.rentals} rentals do not fit {spec.cars} cars over {days} days; "
+            f"use more cars or a longer period (at most {spec.cars * cap})"
+        )
+    popularity = [rng.lognormvariate(0, 0.5) for _ in range(spec.cars)]
+    total = sum(popularity)
+    counts = [min(cap, int(spec.rentals * weight / total)) for weight in popularity]
+    # Hand out what rounding and the cap left over, most popular cars first
+    order = sorted(range(spec.cars), key=lambda i: -popularity[i])
+    missing = spec.rentals - sum(counts)
+    while missing:
+        for i in order:
+            if missing and counts[i] < cap:
+                counts[i] += 1
+                missing -= 1
+    return counts
+
+
+def _start_offsets(count: int, spec: DatasetSpec, rng: random.Random) -> List[int]:
+    """Pick `count` distinct start days for one car, by seasonal demand and growth."""
+    days = (spec.end - spec.start).days
+    chosen = set()
+    while len(chosen) < count:
+        offset = rng.randrange(days)
+        day = spec.start + timedelta(days=offset)
+        # Business grows over the period; Fridays and Saturdays are popular
+        demand = MONTH_DEMAND[day.month - 1] * (0.6 + 0.4 * offset / days)
+        if day.weekday() in (4, 5):
+            demand *= 1.3
+        if rng.random() * 1.95 < demand:
+            chosen.add(offset)
+    return sorted(chosen)
+
+
+def _pack(offset: int, car_id: int, days: int, flags: int) -> int:
+    """Pack a rental into an int that sorts by start day, to keep 1M+ rentals compact."""
+    return (offset << 48) | (car_id << 16) | (days << 2) | flags
+
+
+def _unpack(packed: int) -> Tuple[int, int, int, int]:
+    """Unpack a rental into (start offset, car id, days, flags)."""
+    return packed >> 48, (packed >> 16) & 0xFFFFFFFF, (packed >> 2) & 0x3FFF, packed & 0b11
+
+
+# Rental flags
+_CANCELLED = 1
+_ACTIVE = 2
+
+
+def _plan_rentals(spec: DatasetSpec, rng: random.Random) -> List[int]:
+    """Plan non-overlapping rentals per car, as packed ints sorted by start day."""
+    days = (spec.end - spec.start).days
+    planned = []
+    for car_index, count in enumerate(_rentals_per_car(spec, rng)):
+        car_id = car_index + 1
+        offsets = _start_offsets(count, spec, rng)
+        for i, offset in enumerate(offsets):
+            low, high = rng.choices(DURATIONS, DURATION_WEIGHTS)[0]
+            # End before the car's next booking, or the end of the period
+            room = (offsets[i + 1] if i + 1 < count else days) - offset
+            length = min(rng.randint(low, high), room)
+            flags = _CANCELLED if rng.random() < CANCELLED_SHARE else 0
+            if i + 1 == count and not flags and rng.random() < ACTIVE_SHARE:
+                # Still out at the end of the period
+                length = room + rng.randint(1, 7)
+                flags = _ACTIVE
+            planned.append(_pack(offset, car_id, length, flags))
+    planned.sort()
+    return planned
+
+
+def _batches(rows: Iterator[dict]) -> Iterator[List[dict]]:
+    """Group rows into lists of BATCH_SIZE."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _load(engine: Engine, table, rows: Iterator[dict]) -> int:
+    """Insert rows in batches within one transaction, with the table's indexes dropped.
+
+    Indexes are rebuilt once at the end, which is much faster than
+    maintaining them row by row.
+    """
+    inserted = 0
+    with engine.begin() as conn:
+        for index in table.indexes:
+            index.drop(conn)
+        for batch in _batches(rows):
+            conn.execute(insert(table), batch)
+            inserted += len(batch)
+        for index in table.indexes:
+            index.create(conn)
+    return inserted
+
+
+def generate(
+    engine: Engine,
+    spec: DatasetSpec,
+    replace: bool = False,
+    rollups: bool = True,
+    progress: Callable[[str], None] = print
+) -> Dict[str, int]:
+    """Build a dataset in the engine's database; returns the row counts.
+
+    Refuses to write into a database that already has cars, customers or
+    rentals unless `replace` is set, which drops and recreates all tables.
+    """
+    if replace:
+        Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        for model in (Car, Customer, Rental):
+            if db.scalar(select(func.count()).select_from(model)):
+                raise ValueError("The database already has data; pass replace=True (--replace) to overwrite it")
+
+    rng = random.Random(spec.seed)
+    started = time.perf_counter()
+    rentals = _plan_rentals(spec, rng)
+    progress(f"Planned {len(rentals)} rentals in {time.perf_counter() - started:.1f}s")
+
+    # Cars: rented if their last rental is still active
+    makes = list(MODELS)
+    rented = {_unpack(packed)[1] for packed in rentals if packed & 0b11 == _ACTIVE}
+    rates = {}
+
+    def car_rows():
+        for car_id in range(1, spec.cars + 1):
+            make = rng.choice(makes)
+            model, base_rate = rng.choice(list(MODELS[make].items()))
+            year = spec.end.year - min(int(rng.expovariate(0.35)), 12)
+            rate = round(base_rate * rng.uniform(0.85, 1.2) * (1 + 0.02 * (year - spec.end.year + 5)), 2)
+            rates[car_id] = rate
+            if car_id in rented:
+                status = CarStatus.RENTED
+            elif rng.random() < MAINTENANCE_SHARE:
+                status = CarStatus.MAINTENANCE
+            else:
+                status = CarStatus.AVAILABLE
+            slug = f"{make}-{model}".lower().replace(" ", "-")
+            yield {"make": make, "model": model, "year": year, "status": status, "dailyRate": rate,
+                   "imageUrl": f"https://images.example.com/cars/{slug}.jpg"}
+
+    def customer_rows():
+        for customer_id in range(1, spec.customers + 1):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            yield {
+                "name": f"{first} {last}",
+                "email": f"{first}.{last}.{customer_id}@example.com".lower(),
+                "phone": f"+1-{rng.randint(200, 999)}-555-{rng.randint(0, 9999):04d}",
+                "licenseNumber": f"{first[0]}{last[0]}-{customer_id:08d}".upper(),
+            }
+
+    def rental_rows():
+        for packed in rentals:
+            offset, car_id, length, flags = _unpack(packed)
+            start_date = spec.start + timedelta(days=offset)
+            end_date = start_date + timedelta(days=length)
+            # Repeat customers: low ids rent far more often
+            customer_id = 1 + int(spec.customers * rng.random() ** 2)
+            yield {
+                "carId": car_id,
+                "customerId": customer_id,
+                "startDate": start_date,
+                "endDate": end_date,
+                "status": (RentalStatus.CANCELLED if flags == _CANCELLED
+                           else RentalStatus.ACTIVE if flags == _ACTIVE else RentalStatus.COMPLETED),
+                "totalCost": RentalService._calculate_total_cost(start_date, end_date, rates[car_id]),
+            }
+
+    counts = {}
+    for name, table, rows in (
+        ("cars", Car.__table__, car_rows()),
+        ("customers", Customer.__table__, customer_rows()),
+        ("rentals", Rental.__table__, rental_rows()),
+    ):
+        started = time.perf_counter()
+        counts[name] = _load(engine, table, rows)
+        progress(f"Inserted {counts[name]} {name} in {time.perf_counter() - started:.1f}s")
+
+    if rollups:
+        started = time.perf_counter()
+        with Session(engine) as db:
+            counts["rollups"] = AnalyticsService.rebuild(db)
+        progress(f"Built {counts['rollups']} analytics rollup rows in {time.perf_counter() - started:.1f}s")
+    return counts
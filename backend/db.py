@@ -1,26 +1,211 @@
 """Database configuration and session management."""
-from sqlalchemy import create_engine
+import itertools
+from typing import Any, Dict, List, Sequence
+
+from fastapi import Request, Response
+from sqlalchemy import create_engine, event, inspect
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-# SQLite database URL for development
-SQLALCHEMY_DATABASE_URL = "sqlite:///./orento.db"
+from backend.config import EngineProfile, settings
+from backend.instrumentation import instrument_engine
+from backend.metrics import observe_pool_checkouts
+
+# Database URL, e.g. sqlite:///./orento.db for development
+SQLALCHEMY_DATABASE_URL = settings.database_url
+
+
+def is_memory_database(url: str) -> bool:
+    """Check whether a SQLite URL points to an in-memory database."""
+    parsed = make_url(url)
+    return parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+
+
+def engine_options(url: str, profile: EngineProfile) -> Dict[str, Any]:
+    """Get create_engine keyword arguments for a URL and engine profile."""
+    options: Dict[str, Any] = {}
+    if make_url(url).get_backend_name() == "sqlite":
+        # Connections are shared across the threadpool
+        options["connect_args"] = {"check_same_thread": False}
+        if is_memory_database(url):
+            # In-memory databases use a connection per thread, without a queue
+            return options
+    options.update(
+        pool_size=profile.pool_size,
+        max_overflow=profile.max_overflow,
+        pool_recycle=profile.pool_recycle,
+    )
+    return options
+
+
+def pragma_statements(profile: EngineProfile) -> list:
+    """Get the PRAGMA statements that apply an engine profile to a connection."""
+    statements = []
+    for name in ("journal_mode", "synchronous"):
+        value = getattr(profile, name)
+        if value is not None:
+            if not value.isalpha():
+                raise ValueError(f"Invalid {name}: {value!r}")
+            statements.append(f"PRAGMA {name}={value}")
+    for name in ("mmap_size", "cache_size", "busy_timeout"):
+        value = getattr(profile, name)
+        if value is not None:
+            statements.append(f"PRAGMA {name}={int(value)}")
+    return statements
+
+
+def apply_profile(engine: Engine, profile: EngineProfile) -> None:
+    """Run the profile's PRAGMA statements on every new SQLite connection."""
+    if engine.dialect.name != "sqlite":
+        return
+    statements = pragma_statements(profile)
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def create_db_engine(url: str, profile: EngineProfile) -> Engine:
+    """Create an engine configured by an engine profile, with query and pool metrics."""
+    engine = create_engine(url, **engine_options(url, profile))
+    apply_profile(engine, profile)
+    instrument_engine(engine)
+    observe_pool_checkouts(engine)
+    return engine
+
 
-# Create engine with check_same_thread=False for SQLite
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False}
-)
+# Engine configured by the ORENTO_DB_PROFILE engine profile
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL, settings.engine)
 
-# Create SessionLocal class
+# Create SessionLocal class, bound to the primary database
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 # Create Base class for models
 Base = declarative_base()
 
+# Request header and cookie asking for reads from the primary database, so a
+# client sees its own writes before they reach the replicas
+READ_YOUR_WRITES_HEADER = "X-Read-Your-Writes"
+READ_YOUR_WRITES_COOKIE = "orento_ryw"
+
+# Session factories of the read replicas, used round-robin
+ReplicaSessionLocals: List[sessionmaker] = []
+_replica_counter = itertools.count()
+
+
+def configure_replicas(urls: Sequence[str]) -> None:
+    """Create engines and session factories for the read replica URLs.
+
+    SQLite replicas can be copies of the database file or read-only URI
+    connections, e.g. sqlite:///file:orento.db?mode=ro&uri=true.
+    """
+    for replica in ReplicaSessionLocals:
+        replica.kw["bind"].dispose()
+    ReplicaSessionLocals[:] = [
+        sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            bind=create_db_engine(url, settings.engine),
+            info={"replica": True}
+        )
+        for url in urls
+    ]
+
+
+configure_replicas(settings.replica_urls)
+
+# Async engine and session factory, created on first use so the asyncio
+# extras (greenlet, aiosqlite) are only required when async mode is enabled
+_async_engines = []
+_AsyncSessionLocal = None
+_AsyncReplicaSessionLocals = []
+
+
+def async_database_url(url: str) -> str:
+    """Get the async-driver equivalent of a sync database URL."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.get_driver_name() != "aiosqlite":
+        parsed = parsed.set(drivername="sqlite+aiosqlite")
+    return parsed.render_as_string(hide_password=False)
+
+
+def _create_async_sessionmaker(url: str, replica: bool = False):
+    """Create an async engine for a sync database URL and its session factory."""
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+    url = async_database_url(url)
+    options = engine_options(url, settings.engine)
+    # aiosqlite runs each connection on its own thread
+    options.pop("connect_args", None)
+    async_engine = create_async_engine(url, **options)
+    apply_profile(async_engine.sync_engine, settings.engine)
+    instrument_engine(async_engine.sync_engine)
+    observe_pool_checkouts(async_engine.sync_engine)
+    _async_engines.append(async_engine)
+    return async_sessionmaker(
+        async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+        info={"replica": replica}
+    )
+
 
-def get_db():
-    """Dependency to get database session."""
+def get_async_sessionmaker():
+    """Get the AsyncSession factory, creating the async engine if needed."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = _create_async_sessionmaker(SQLALCHEMY_DATABASE_URL)
+        _AsyncReplicaSessionLocals.extend(
+            _create_async_sessionmaker(url, replica=True) for url in settings.replica_urls
+        )
+    return _AsyncSessionLocal
+
+
+def is_replica_session(db) -> bool:
+    """Check whether a (sync or async) session reads from a replica."""
+    return bool(db.info.get("replica"))
+
+
+def reads_from_primary(request: Request) -> bool:
+    """Check whether the client asked to read its own writes."""
+    header = request.headers.get(READ_YOUR_WRITES_HEADER, "").lower()
+    return header in ("1", "true", "yes") or READ_YOUR_WRITES_COOKIE in request.cookies
+
+
+def may_read_replica(request: Request) -> bool:
+    """Check whether a read for the request may be served by a replica."""
+    return bool(ReplicaSessionLocals or _AsyncReplicaSessionLocals) and not reads_from_primary(request)
+
+
+def _pick(primary, replicas: Sequence, request: Request):
+    """Choose the primary or the next replica session factory for a read."""
+    if not replicas or reads_from_primary(request):
+        return primary
+    return replicas[next(_replica_counter) % len(replicas)]
+
+
+def _mark_write(response: Response) -> None:
+    """Send the read-your-writes cookie when reads may go to a replica."""
+    if ReplicaSessionLocals and settings.read_your_writes_seconds > 0:
+        response.set_cookie(
+            READ_YOUR_WRITES_COOKIE,
+            "1",
+            max_age=settings.read_your_writes_seconds,
+            httponly=True,
+            samesite="lax"
+        )
+
+
+def get_db(response: Response):
+    """Dependency to get a session on the primary database, for writes."""
+    _mark_write(response)
     db = SessionLocal()
     try:
         yield db
@@ -28,6 +213,50 @@ def get_db():
         db.close()
 
 
+def get_read_db(request: Request):
+    """Dependency to get a session for reads, on a replica if configured."""
+    db = _pick(SessionLocal, ReplicaSessionLocals, request)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db(response: Response):
+    """Dependency to get an async session on the primary database, for writes."""
+    _mark_write(response)
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def get_async_read_db(request: Request):
+    """Dependency to get an async session for reads, on a replica if configured."""
+    primary = get_async_sessionmaker()
+    async with _pick(primary, _AsyncReplicaSessionLocals, request)() as db:
+        yield db
+
+
+async def dispose_async_engine():
+    """Close the async engines' connections, if they were created."""
+    for async_engine in _async_engines:
+        await async_engine.dispose()
+
+
 def init_db():
     """Initialize database tables."""
     Base.metadata.create_all(bind=engine)
+    # create_all skips tables that already exist, including their indexes,
+    # so add indexes introduced after the database file was created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    # Likewise the customer search index, which is then filled from the
+    # customers already stored
+    from backend.models import CUSTOMER_SEARCH_DDL, CUSTOMER_SEARCH_TABLE
+    if engine.dialect.name == "sqlite" and not inspect(engine).has_table(CUSTOMER_SEARCH_TABLE):
+        with engine.begin() as connection:
+            for statement in CUSTOMER_SEARCH_DDL:
+                connection.exec_driver_sql(statement)
+            connection.exec_driver_sql(
+                f"INSERT INTO {CUSTOMER_SEARCH_TABLE}({CUSTOMER_SEARCH_TABLE}) VALUES ('rebuild')"
+            )
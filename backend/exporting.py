@@ -0,0 +1,51 @@
+"""Streaming CSV and NDJSON encoders for bulk exports."""
+import csv
+import enum
+import io
+import json
+from datetime import date
+from typing import Any, Iterable, Iterator, Sequence
+
+from backend.schemas import DataFormat
+
+MEDIA_TYPES = {
+    DataFormat.CSV: "text/csv",
+    DataFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def _plain(value: Any) -> Any:
+    """Convert a column value to its JSON/CSV representation."""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def encode_rows(
+    columns: Sequence[str],
+    batches: Iterable[Sequence[Sequence[Any]]],
+    fmt: DataFormat
+) -> Iterator[str]:
+    """Encode batches of rows into response chunks, one chunk per batch.
+
+    The CSV header is yielded before the first batch is fetched, so clients
+    receive the first byte as soon as the response starts.
+    """
+    if fmt == DataFormat.CSV:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+        yield buffer.getvalue()
+        for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows([_plain(v) for v in row] for row in batch)
+            yield buffer.getvalue()
+    else:
+        for batch in batches:
+            yield "".join(
+                json.dumps(dict(zip(columns, map(_plain, row))), separators=(",", ":")) + "\n"
+                for row in batch
+            )
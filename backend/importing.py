@@ -0,0 +1,134 @@
+"""Streaming parsers for bulk imports of NDJSON and CSV request bodies."""
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Type
+
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel, ValidationError
+
+from backend.schemas import DataFormat, ImportResult, ImportRowError
+
+# Rows inserted per transaction
+BATCH_SIZE = 1000
+
+# Per-row errors listed in an import result; the rest are only counted
+MAX_REPORTED_ERRORS = 1000
+
+
+def resolve_format(request: Request, fmt: Optional[DataFormat]) -> DataFormat:
+    """Pick the body format from the query parameter or the Content-Type."""
+    if fmt is not None:
+        return fmt
+    content_type = request.headers.get("content-type", "")
+    if content_type.startswith(("text/csv", "application/csv")):
+        return DataFormat.CSV
+    return DataFormat.NDJSON
+
+
+async def iter_lines(request: Request) -> AsyncIterator[str]:
+    """Yield the lines of the request body as it streams in."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    pending = ""
+    async for chunk in request.stream():
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending.rstrip("\r")
+
+
+async def iter_records(
+    request: Request,
+    fmt: DataFormat
+) -> AsyncIterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Yield (row number, record, parse error) for each non-blank data row.
+
+    Rows are numbered from 1, not counting a CSV header line. CSV fields
+    left empty are omitted so schema defaults apply. Quoted CSV fields cannot
+    span multiple lines.
+    """
+    header: Optional[List[str]] = None
+    row = 0
+    async for line in iter_lines(request):
+        if not line.strip():
+            continue
+        if fmt == DataFormat.CSV:
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [name.strip() for name in values]
+                continue
+            row += 1
+            if len(values) != len(header):
+                yield row, None, f"expected {len(header)} fields, got {len(values)}"
+                continue
+            yield row, {k: v for k, v in zip(header, values) if v != ""}, None
+        else:
+            row += 1
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as exc:
+                yield row, None, f"invalid JSON: {exc.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield row, None, "expected a JSON object"
+                continue
+            yield row, record, None
+
+
+def validation_messages(exc: ValidationError) -> List[str]:
+    """Flatten a pydantic validation error into readable messages."""
+    return [
+        f"{'.'.join(str(part) for part in error['loc'])}: {error['msg']}"
+        for error in exc.errors()
+    ]
+
+
+def record_error(result: ImportResult, row: int, messages: List[str]) -> None:
+    """Count a rejected row and list it if the error report has room."""
+    result.failed += 1
+    if len(result.errors) < MAX_REPORTED_ERRORS:
+        result.errors.append(ImportRowError(row=row, errors=messages))
+
+
+async def run_import(
+    request: Request,
+    fmt: DataFormat,
+    schema: Type[BaseModel],
+    insert_batch: Callable[[List[Tuple[int, BaseModel]]], List[Tuple[int, str]]]
+) -> ImportResult:
+    """Stream, validate and insert the rows of a bulk import body.
+
+    Each row is validated with `schema`. Valid rows are collected into
+    batches of (row number, model) and handed to `insert_batch`, which runs
+    in the threadpool, inserts the batch in one transaction and returns the
+    (row number, message) pairs it rejected.
+    """
+    result = ImportResult()
+    batch: List[Tuple[int, BaseModel]] = []
+
+    async def flush() -> None:
+        rejected = await run_in_threadpool(insert_batch, batch)
+        result.inserted += len(batch) - len(rejected)
+        for row, message in rejected:
+            record_error(result, row, [message])
+
+    async for row, record, error in iter_records(request, fmt):
+        if error is not None:
+            record_error(result, row, [error])
+            continue
+        try:
+            batch.append((row, schema.model_validate(record)))
+        except ValidationError as exc:
+            record_error(result, row, validation_messages(exc))
+            continue
+        if len(batch) >= BATCH_SIZE:
+            await flush()
+            batch = []
+    if batch:
+        await flush()
+    result.errors.sort(key=lambda error: error.row)
+    return result
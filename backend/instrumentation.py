@@ -0,0 +1,176 @@
+"""Per-request SQL query counting and timing."""
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Response headers carrying a request's query stats in debug mode
+QUERY_COUNT_HEADER = "X-DB-Query-Count"
+QUERY_TIME_HEADER = "X-DB-Query-Time-Ms"
+SLOWEST_QUERY_HEADER = "X-DB-Slowest-Query"
+DEBUG_HEADERS = (QUERY_COUNT_HEADER, QUERY_TIME_HEADER, SLOWEST_QUERY_HEADER)
+
+# Longest statement text kept for the slowest query
+MAX_STATEMENT_LENGTH = 200
+
+
+@dataclass
+class QueryStats:
+    """Queries executed while serving one request."""
+    count: int = 0
+    time: float = 0.0
+    slowest_time: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        """Add one executed statement."""
+        self.count += 1
+        self.time += elapsed
+        if elapsed >= self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+
+# Stats of the request being served. Sync endpoints and dependencies run in
+# the threadpool with a copy of the request's context, so they record into
+# the same object.
+_request_stats: ContextVar[Optional[QueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Get the query stats of the request being served, if any."""
+    return _request_stats.get()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Record every statement the engine executes into the current request's stats.
+
+    For async engines, pass `async_engine.sync_engine`. Statements executed
+    outside a request (startup, scripts) are not recorded.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def record_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        stats = _request_stats.get()
+        if stats is not None:
+            stats.record(statement, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def drop_query_timer(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_started"):
+            conn.info["query_started"].pop()
+
+
+def _header_statement(statement: str) -> str:
+    """Get a statement as a single-line, latin-1 header value."""
+    text = " ".join(statement.split())
+    if len(text) > MAX_STATEMENT_LENGTH:
+        text = text[:MAX_STATEMENT_LENGTH - 3] + "..."
+    return text.encode("latin-1", "replace").decode("latin-1")
+
+
+class RouteQueryStats:
+    """Query stats aggregated per route across requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: Dict[str, Dict[str, Any]] = {}
+
+    def record(self, route: str, stats: QueryStats) -> None:
+        """Add one request's stats to its route."""
+        with self._lock:
+            totals = self._routes.get(route)
+            if totals is None:
+                totals = self._routes[route] = {
+                    "requests": 0, "queries": 0, "maxQueries": 0,
+                    "sqlTime": 0.0, "slowestTime": 0.0, "slowestStatement": None,
+                }
+            totals["requests"] += 1
+            totals["queries"] += stats.count
+            totals["maxQueries"] = max(totals["maxQueries"], stats.count)
+            totals["sqlTime"] += stats.time
+            if stats.count and stats.slowest_time >= totals["slowestTime"]:
+                totals["slowestTime"] = stats.slowest_time
+                totals["slowestStatement"] = stats.slowest_statement
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Get the per-route totals, most queries first."""
+        with self._lock:
+            routes = [
+                {
+                    "route": route,
+                    **totals,
+                    "avgQueries": totals["queries"] / totals["requests"],
+                }
+                for route, totals in self._routes.items()
+            ]
+        return sorted(routes, key=lambda r: (-r["queries"], r["route"]))
+
+    def clear(self) -> None:
+        """Drop all totals."""
+        with self._lock:
+            self._routes.clear()
+
+
+route_query_stats = RouteQueryStats()
+
+
+def route_path(scope: Dict[str, Any]) -> str:
+    """Get a request's route template, e.g. "/api/cars/{car_id}", or "unmatched"."""
+    return getattr(scope.get("route"), "path", None) or "unmatched"
+
+
+def route_name(scope: Dict[str, Any]) -> str:
+    """Get a request's route as "METHOD /path/{param}", or "unmatched"."""
+    path = route_path(scope)
+    return path if path == "unmatched" else f"{scope['method']} {path}"
+
+
+class QueryStatsMiddleware:
+    """ASGI middleware collecting the query stats of each HTTP request.
+
+    Stats are aggregated per route in `route_query_stats`. With `headers`
+    (debug mode) the response also carries the query count, total SQL time
+    and slowest statement executed before the response started.
+    """
+
+    def __init__(self, app, headers: bool = False) -> None:
+        self.app = app
+        self.headers = headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _request_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((QUERY_COUNT_HEADER.lower().encode(), str(stats.count).encode()))
+                headers.append((QUERY_TIME_HEADER.lower().encode(), f"{stats.time * 1000:.3f}".encode()))
+                if stats.slowest_statement is not None:
+                    headers.append((
+                        SLOWEST_QUERY_HEADER.lower().encode(),
+                        _header_statement(stats.slowest_statement).encode("latin-1")
+                    ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers if self.headers else send)
+        finally:
+            _request_stats.reset(token)
+            route_query_stats.record(route_name(scope), stats)
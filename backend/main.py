@@ -3,9 +3,13 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
-from backend.db import init_db, SessionLocal
+from backend.config import settings
+from backend.db import init_db, dispose_async_engine, SessionLocal
+from backend.instrumentation import DEBUG_HEADERS, QueryStatsMiddleware
+from backend.metrics import MetricsMiddleware
+from backend.pagination import NEXT_CURSOR_HEADER
 from backend.seed import seed_database
-from backend.routers import cars, customers, rentals
+from backend.routers import api_routers, metrics
 
 
 @asynccontextmanager
@@ -26,6 +30,7 @@ async def lifespan(app: FastAPI):
     
     # Shutdown: Cleanup if needed
     print("Shutting down...")
+    await dispose_async_engine()
 
 
 # Create FastAPI application
@@ -43,12 +48,24 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, *DEBUG_HEADERS],
 )
 
-# Include routers
-app.include_router(cars.router)
-app.include_router(customers.router)
-app.include_router(rentals.router)
+# Count and time SQL queries per request; ORENTO_DEBUG adds them as headers
+app.add_middleware(QueryStatsMiddleware, headers=settings.debug)
+
+# Request latency, status and in-flight metrics, served at /metrics
+app.add_middleware(MetricsMiddleware)
+
+# Include routers for the configured database mode (ORENTO_DB_MODE)
+for router in api_routers(settings.db_mode):
+    app.include_router(router)
+
+app.include_router(metrics.router)
+
+if settings.debug:
+    from backend.routers import debug
+    app.include_router(debug.router)
 
 
 @app.get("/")
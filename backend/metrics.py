@@ -0,0 +1,233 @@
+"""In-process metrics in the Prometheus text exposition format."""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+from sqlalchemy.engine import Engine
+
+from backend.cache import caches
+from backend.instrumentation import route_path, route_query_stats
+
+# Content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Request latency buckets, in seconds
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Pool checkout buckets, in seconds; checkouts are usually well under a millisecond
+CHECKOUT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.1, 0.5, 1.0, 5.0)
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """Escape a label value."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """Format a label set, e.g. {method="GET",route="/api/cars"}."""
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    """Base class of labelled metrics: a name, help text and label names."""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def header(self) -> List[str]:
+        """Get the HELP and TYPE lines."""
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(Metric):
+    """Monotonic counter per label set."""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        """Add to the counter of a label set."""
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}" for labels, value in values
+        ]
+
+
+class Gauge(Counter):
+    """Value per label set that can go up and down."""
+    kind = "gauge"
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        """Subtract from the gauge of a label set."""
+        self.inc(labels, -amount)
+
+
+class Histogram(Metric):
+    """Bucketed observations per label set, with their sum and count."""
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+        # Per label set: per-bucket (not cumulative) counts, the last one +Inf, and the sum
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        """Record one observation."""
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][bucket] += 1
+            series[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        lines = self.header()
+        names = self.labelnames + ("le",)
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_labels(names, labels + (_number(bound),))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+http_requests = Counter(
+    "orento_http_requests_total", "HTTP requests by route and status code.", ("method", "route", "status")
+)
+http_latency = Histogram(
+    "orento_http_request_duration_seconds", "HTTP request latency by route.", ("method", "route")
+)
+http_in_flight = Gauge(
+    "orento_http_requests_in_flight", "HTTP requests being served.", ("method",)
+)
+pool_checkout = Histogram(
+    "orento_db_pool_checkout_seconds",
+    "Time to get a database connection from the pool, including waiting for one.",
+    buckets=CHECKOUT_BUCKETS
+)
+
+REQUEST_METRICS = (http_requests, http_latency, http_in_flight, pool_checkout)
+
+
+def observe_pool_checkouts(engine: Engine) -> None:
+    """Time every connection checkout of an engine (for async engines, its sync_engine).
+
+    Wraps Engine.raw_connection, which every Connection uses to check out
+    its DBAPI connection, so the timing survives engine.dispose().
+    """
+    raw_connection = engine.raw_connection
+
+    def timed_raw_connection():
+        started = time.perf_counter()
+        try:
+            return raw_connection()
+        finally:
+            pool_checkout.observe(time.perf_counter() - started)
+
+    engine.raw_connection = timed_raw_connection
+
+
+class MetricsMiddleware:
+    """ASGI middleware recording latency, status codes and in-flight requests.
+
+    Requests are labelled with their route template ("unmatched" for 404s
+    outside any route), so label sets stay bounded.
+    """
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_in_flight.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_in_flight.dec((method,))
+            route = route_path(scope)
+            http_latency.observe(elapsed, (method, route))
+            http_requests.inc((method, route, str(status)))
+
+
+def _cache_metrics() -> List[str]:
+    """Render the named caches' sizes, hits, misses and hit ratios."""
+    stats = {name: cache.stats() for name, cache in sorted(caches.items())}
+    lines = []
+    for key, metric, kind, documentation in (
+        ("size", "orento_cache_entries", "gauge", "Entries held by the cache."),
+        ("hits", "orento_cache_hits_total", "counter", "Cache lookups answered from the cache."),
+        ("misses", "orento_cache_misses_total", "counter", "Cache lookups that missed."),
+        ("hitRatio", "orento_cache_hit_ratio", "gauge", "Share of cache lookups that hit."),
+    ):
+        lines += [f"# HELP {metric} {documentation}", f"# TYPE {metric} {kind}"]
+        lines += [f"{metric}{_labels(('cache',), (name,))} {_number(values[key])}" for name, values in stats.items()]
+    return lines
+
+
+def _query_metrics() -> List[str]:
+    """Render the per-route SQL query totals of backend.instrumentation."""
+    routes = route_query_stats.snapshot()
+    lines = [
+        "# HELP orento_db_queries_total SQL statements executed by route.",
+        "# TYPE orento_db_queries_total counter",
+    ]
+    lines += [f"orento_db_queries_total{_labels(('route',), (r['route'],))} {r['queries']}" for r in routes]
+    lines += [
+        "# HELP orento_db_query_seconds_total Time spent executing SQL statements by route.",
+        "# TYPE orento_db_query_seconds_total counter",
+    ]
+    lines += [f"orento_db_query_seconds_total{_labels(('route',), (r['route'],))} {_number(r['sqlTime'])}" for r in routes]
+    return lines
+
+
+def render() -> str:
+    """Render all metrics in the Prometheus text format."""
+    lines = []
+    for metric in REQUEST_METRICS:
+        lines += metric.render()
+    lines += _cache_metrics()
+    lines += _query_metrics()
+    return "\n".join(lines) + "\n"
@@ -1,5 +1,5 @@
 """SQLAlchemy ORM models."""
-from sqlalchemy import Column, Integer, String, Float, Date, ForeignKey, Enum as SQLEnum
+from sqlalchemy import DDL, Column, Integer, String, Float, Date, ForeignKey, Index, Enum as SQLEnum, event
 from sqlalchemy.orm import relationship
 import enum
 
@@ -20,6 +20,13 @@ class RentalStatus(str, enum.Enum):
     CANCELLED = "CANCELLED"
 
 
+class PricingRuleKind(str, enum.Enum):
+    """Pricing rule kind enumeration."""
+    WEEKEND = "WEEKEND"
+    SEASONAL = "SEASONAL"
+    LONG_TERM = "LONG_TERM"
+
+
 class Car(Base):
     """Car entity model."""
     __tablename__ = "cars"
@@ -32,6 +39,13 @@ class Car(Base):
     status = Column(SQLEnum(CarStatus), nullable=False, default=CarStatus.AVAILABLE)
     dailyRate = Column(Float, nullable=False)
 
+    # Covering index for faceted search: facet counts group and filter on
+    # these columns only, so they are read from this index instead of the
+    # wider table rows, and make (and model) filters seek into it
+    __table_args__ = (
+        Index("ix_cars_facets", "make", "model", "year", "status", "dailyRate"),
+    )
+
 
 class Customer(Base):
     """Customer entity model."""
@@ -44,6 +58,41 @@ class Customer(Base):
     licenseNumber = Column(String(50), nullable=False, unique=True)
 
 
+# Full-text index of customers for search and typeahead: an FTS5 table over
+# the customers table's own rows (external content), kept in sync by
+# triggers so every write, including bulk imports, updates it
+CUSTOMER_SEARCH_TABLE = "customers_fts"
+CUSTOMER_SEARCH_COLUMNS = ("name", "email", "phone", "licenseNumber")
+
+_search_columns = ", ".join(CUSTOMER_SEARCH_COLUMNS)
+_old_values = ", ".join(f"old.{column}" for column in CUSTOMER_SEARCH_COLUMNS)
+_new_values = ", ".join(f"new.{column}" for column in CUSTOMER_SEARCH_COLUMNS)
+CUSTOMER_SEARCH_DDL = (
+    # Tokens are words split at punctuation, with diacritics folded, so
+    # emails, phone numbers and license numbers match by their parts
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {CUSTOMER_SEARCH_TABLE} USING fts5("
+    f"{_search_columns}, content='customers', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER IF NOT EXISTS customers_fts_insert AFTER INSERT ON customers BEGIN "
+    f"INSERT INTO {CUSTOMER_SEARCH_TABLE}(rowid, {_search_columns}) VALUES (new.id, {_new_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS customers_fts_delete AFTER DELETE ON customers BEGIN "
+    f"INSERT INTO {CUSTOMER_SEARCH_TABLE}({CUSTOMER_SEARCH_TABLE}, rowid, {_search_columns}) "
+    f"VALUES ('delete', old.id, {_old_values}); END",
+    f"CREATE TRIGGER IF NOT EXISTS customers_fts_update AFTER UPDATE ON customers BEGIN "
+    f"INSERT INTO {CUSTOMER_SEARCH_TABLE}({CUSTOMER_SEARCH_TABLE}, rowid, {_search_columns}) "
+    f"VALUES ('delete', old.id, {_old_values}); "
+    f"INSERT INTO {CUSTOMER_SEARCH_TABLE}(rowid, {_search_columns}) VALUES (new.id, {_new_values}); END",
+)
+
+for _statement in CUSTOMER_SEARCH_DDL:
+    event.listen(Customer.__table__, "after_create", DDL(_statement).execute_if(dialect="sqlite"))
+event.listen(
+    Customer.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {CUSTOMER_SEARCH_TABLE}").execute_if(dialect="sqlite")
+)
+
+
 class Rental(Base):
     """Rental entity model."""
     __tablename__ = "rentals"
@@ -59,3 +108,60 @@ class Rental(Base):
     # Relationships
     car = relationship("Car")
     customer = relationship("Customer")
+
+    # Composite indexes backing the list filters and sort orders. SQLite
+    # appends the rowid (our id) to every index entry, so each of these also
+    # serves as the keyset pagination order (key, id).
+    __table_args__ = (
+        Index("ix_rentals_status_start", "status", "startDate"),
+        Index("ix_rentals_car_start", "carId", "startDate"),
+        # Interval index for availability checks: the status column sits
+        # between carId and the dates so an overlap probe only visits the
+        # car's ACTIVE bookings, not its whole rental history, and is answered
+        # from the index alone.
+        Index("ix_rentals_car_interval", "carId", "status", "startDate", "endDate"),
+        Index("ix_rentals_customer_start", "customerId", "startDate"),
+        Index("ix_rentals_start", "startDate"),
+        Index("ix_rentals_end", "endDate"),
+    )
+
+
+class RentalDailyRollup(Base):
+    """Per-day, per-car rental totals for analytics.
+
+    Maintained incrementally by RentalService: each non-cancelled rental
+    adds one row per rented day (minimum one, like cost calculation) with
+    its totalCost spread evenly over those days. Rebuild with
+    `python -m backend.cli rebuild-rollups`.
+    """
+    __tablename__ = "rental_daily_rollups"
+
+    day = Column(Date, primary_key=True)
+    carId = Column(Integer, ForeignKey("cars.id"), primary_key=True)
+    revenue = Column(Float, nullable=False, default=0.0)
+    # Rentals covering the day; more than one only for overlapping history
+    rentals = Column(Integer, nullable=False, default=0)
+
+    # The primary key serves day ranges; this serves per-car ranges
+    __table_args__ = (
+        Index("ix_rollups_car_day", "carId", "day"),
+    )
+
+
+class PricingRule(Base):
+    """Pricing rule model, compiled into a calendar by backend.pricing.
+
+    WEEKEND rules multiply the rate of Saturdays and Sundays, SEASONAL rules
+    the rate of days from startDate to endDate (both inclusive). LONG_TERM
+    rules multiply the total of rentals of at least minDays days; only the
+    rule with the highest minDays reached applies.
+    """
+    __tablename__ = "pricing_rules"
+
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(100), nullable=False)
+    kind = Column(SQLEnum(PricingRuleKind), nullable=False)
+    multiplier = Column(Float, nullable=False)
+    startDate = Column(Date, nullable=True)
+    endDate = Column(Date, nullable=True)
+    minDays = Column(Integer, nullable=True)
@@ -0,0 +1,118 @@
+"""Keyset (cursor) pagination helpers."""
+import base64
+import binascii
+import json
+import math
+from datetime import date
+from typing import Any, List, Optional, Sequence, Tuple
+
+from fastapi import HTTPException, Response
+from sqlalchemy import literal, tuple_
+
+# Response header carrying the cursor of the next page
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+# Upper bound for the `limit` query parameter
+MAX_PAGE_SIZE = 1000
+
+# Range of integer cursor values, those a signed 64-bit column can hold
+CURSOR_INT_RANGE = (-2 ** 63, 2 ** 63 - 1)
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key values of the last row into an opaque cursor."""
+    payload = [v.isoformat() if isinstance(v, date) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[Any]) -> List[Any]:
+    """Decode a cursor back into sort key values typed like the key columns."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("cursor does not match the sort keys")
+        return [_coerce(key, value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError, OverflowError, binascii.Error):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _coerce(key: Any, value: Any) -> Any:
+    """Convert a JSON cursor value to the Python type of its column."""
+    if value is None:
+        raise ValueError("cursor values cannot be null")
+    python_type = key.type.python_type
+    if python_type is date:
+        return date.fromisoformat(value)
+    value = python_type(value)
+    if isinstance(value, float) and not math.isfinite(value):
+        raise ValueError("cursor values must be finite")
+    if isinstance(value, int) and not CURSOR_INT_RANGE[0] <= value <= CURSOR_INT_RANGE[1]:
+        raise ValueError("cursor value out of range")
+    return value
+
+
+def keyset(
+    query,
+    keys: Sequence[Any],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+):
+    """Restrict a Query or Select to the keyset page after `cursor`.
+
+    `keys` are the ordering columns and must end with a unique column (the
+    primary key) so every row has a distinct position. Rows after the cursor
+    are selected with a row-value comparison, which lets the database seek
+    straight into a matching index instead of skipping over earlier rows, so
+    every page costs the same regardless of depth. One row more than `limit`
+    is selected so `split_page` can tell whether another page exists.
+    """
+    if cursor is not None:
+        values = decode_cursor(cursor, keys)
+        if len(keys) == 1:
+            lhs, rhs = keys[0], literal(values[0], keys[0].type)
+        else:
+            lhs = tuple_(*keys)
+            rhs = tuple_(*[literal(v, k.type) for k, v in zip(keys, values)])
+        query = query.filter(lhs < rhs if descending else lhs > rhs)
+
+    query = query.order_by(*[k.desc() if descending else k.asc() for k in keys])
+    if limit is not None:
+        query = query.limit(limit + 1)
+    return query
+
+
+def split_page(
+    rows: List[Any],
+    keys: Sequence[Any],
+    limit: Optional[int] = None
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim rows fetched by `keyset` to the page and compute the next cursor."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor([getattr(rows[-1], k.key) for k in keys])
+
+
+def paginate(
+    query,
+    keys: Sequence[Any],
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    descending: bool = False,
+) -> Tuple[List[Any], Optional[str]]:
+    """Apply keyset pagination to a query and fetch the page.
+
+    Returns the rows of the page and the cursor of the next page, or None if
+    this is the last page. Without a limit all remaining rows are returned.
+    """
+    rows = keyset(query, keys, limit=limit, cursor=cursor, descending=descending).all()
+    return split_page(rows, keys, limit)
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the next page cursor to the client, if there is one."""
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
@@ -0,0 +1,114 @@
+"""Pricing calendar compiled from the pricing rules."""
+from bisect import bisect_right
+from datetime import date, timedelta
+from typing import Any, List, Sequence, Tuple
+
+from backend.models import PricingRuleKind
+
+# date.weekday() of Saturday; Saturday and Sunday are weekend days
+SATURDAY = 5
+
+
+def weekend_days(start: date, end: date) -> int:
+    """Count the Saturdays and Sundays in [start, end) in constant time."""
+    days = (end - start).days
+    if days <= 0:
+        return 0
+    weeks, rest = divmod(days, 7)
+    weekday = start.weekday()
+    return 2 * weeks + sum(1 for i in range(rest) if (weekday + i) % 7 >= SATURDAY)
+
+
+class PricingCalendar:
+    """Pricing rules compiled for fast rental pricing.
+
+    A rental of `days` days starting on `start` costs
+
+        (days * rate + extra * rate) * long_term
+
+    where `extra` is the sum over its days of (day multiplier - 1). The
+    seasonal rules are compiled into segments over which their product is
+    constant, with the seasonal extra accumulated up to each segment, so
+    `extra` takes a binary search and a few weekend counts for the days the
+    rental covers, however long the seasons are. Without rules `extra` is
+    exactly 0.0 and `long_term` 1.0, so the cost is exactly days * rate.
+    """
+
+    def __init__(self, rules: Sequence[Any]) -> None:
+        self.weekend = 1.0
+        seasons = []
+        tiers = {}
+        for rule in rules:
+            if rule.kind == PricingRuleKind.WEEKEND:
+                self.weekend *= rule.multiplier
+            elif rule.kind == PricingRuleKind.SEASONAL:
+                seasons.append(rule)
+            elif rule.kind == PricingRuleKind.LONG_TERM:
+                tiers[rule.minDays] = tiers.get(rule.minDays, 1.0) * rule.multiplier
+        self.rules = len(rules)
+        self._tier_days = sorted(tiers)
+        self._tier_multipliers = [tiers[days] for days in self._tier_days]
+
+        # Segment i is [bounds[i], bounds[i + 1]) with seasonal multiplier
+        # factors[i]; cumulative[i] is the seasonal extra of [bounds[0], bounds[i])
+        spans = [(rule.startDate, rule.endDate + timedelta(days=1), rule.multiplier) for rule in seasons]
+        self._bounds: List[date] = sorted({day for start, end, _ in spans for day in (start, end)})
+        self._factors: List[float] = []
+        self._cumulative: List[float] = [0.0]
+        for start, end in zip(self._bounds, self._bounds[1:]):
+            factor = 1.0
+            for first, last, multiplier in spans:
+                if first <= start and end <= last:
+                    factor *= multiplier
+            self._factors.append(factor)
+            self._cumulative.append(self._cumulative[-1] + self._segment_extra(start, end, factor))
+
+    def _weekend_extra(self, start: date, end: date) -> float:
+        """Get the extra of the weekend rule alone over [start, end)."""
+        if self.weekend == 1.0 or end <= start:
+            return 0.0
+        return weekend_days(start, end) * (self.weekend - 1.0)
+
+    def _segment_extra(self, start: date, end: date, factor: float) -> float:
+        """Get the seasonal extra of [start, end) at a constant seasonal multiplier.
+
+        On top of the weekend rule a day adds (factor - 1) times its weekend
+        multiplier.
+        """
+        return (factor - 1.0) * ((end - start).days + self._weekend_extra(start, end))
+
+    def _seasonal_extra(self, day: date) -> float:
+        """Get the seasonal extra of [bounds[0], day), clamped to the seasonal span."""
+        if not self._bounds or day <= self._bounds[0]:
+            return 0.0
+        if day >= self._bounds[-1]:
+            return self._cumulative[-1]
+        i = bisect_right(self._bounds, day) - 1
+        return self._cumulative[i] + self._segment_extra(self._bounds[i], day, self._factors[i])
+
+    def extra(self, start: date, days: int) -> float:
+        """Get the sum of (day multiplier - 1) over `days` days from `start`."""
+        end = start + timedelta(days=days)
+        if not self._bounds:
+            return self._weekend_extra(start, end)
+        return (
+            self._weekend_extra(start, end)
+            + self._seasonal_extra(end)
+            - self._seasonal_extra(start)
+        )
+
+    def long_term(self, days: int) -> float:
+        """Get the multiplier of the longest LONG_TERM tier reached by `days`."""
+        tier = bisect_right(self._tier_days, days)
+        return self._tier_multipliers[tier - 1] if tier else 1.0
+
+    def adjustments(self, ranges: Sequence[Tuple[date, date]]) -> Tuple[List[int], List[float], List[float]]:
+        """Get the day counts, extras and long-term multipliers of date ranges."""
+        days = [max((end - start).days, 1) for start, end in ranges]
+        extras = [self.extra(start, count) for (start, _), count in zip(ranges, days)]
+        return days, extras, [self.long_term(count) for count in days]
+
+    def price(self, start: date, end: date, daily_rate: float) -> float:
+        """Get the total cost of a rental; like the base cost, minimum one day."""
+        days = max((end - start).days, 1)
+        return (days * daily_rate + self.extra(start, days) * daily_rate) * self.long_term(days)
@@ -0,0 +1,64 @@
+"""Immutable row records for read-only list queries.
+
+List endpoints select only the response columns through Core and map each
+row to a named tuple, instead of building ORM instances that the session
+tracks in its identity map only to serialize and discard them. Record
+fields match the Read schemas, so records serialize exactly like the ORM
+objects.
+"""
+from datetime import date
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Type
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from backend.models import CarStatus, RentalStatus
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class CarRecord(NamedTuple):
+    """Read-only car row."""
+    id: int
+    make: str
+    model: str
+    year: int
+    imageUrl: str
+    status: CarStatus
+    dailyRate: float
+
+
+class CustomerRecord(NamedTuple):
+    """Read-only customer row."""
+    id: int
+    name: str
+    email: str
+    phone: Optional[str]
+    licenseNumber: str
+
+
+class RentalRecord(NamedTuple):
+    """Read-only rental row."""
+    id: int
+    carId: int
+    customerId: int
+    startDate: date
+    endDate: date
+    status: RentalStatus
+    totalCost: float
+
+
+def record_select(record: Type[NamedTuple], model: Any) -> Select:
+    """Select the columns of `model` named by the record's fields."""
+    return select(*[getattr(model, name) for name in record._fields])
+
+
+def fetch_records(db: Session, stmt: Select, record: Type[NamedTuple]) -> List[Any]:
+    """Execute a record select and map the rows to records."""
+    return list(map(record._make, db.execute(stmt)))
+
+
+async def fetch_records_async(db: "AsyncSession", stmt: Select, record: Type[NamedTuple]) -> List[Any]:
+    """Execute a record select on an AsyncSession and map the rows to records."""
+    return list(map(record._make, await db.execute(stmt)))
@@ -1 +1,46 @@
-# Routers package
+"""API routers, selected by database mode."""
+from typing import List
+
+from fastapi import APIRouter
+
+
+def merge_routes(base: APIRouter, override: APIRouter) -> APIRouter:
+    """Combine two routers, letting `override` replace routes of `base`.
+
+    Routes are matched by path and methods and replaced in place, so the
+    merged router keeps the base route order (static paths such as
+    /export still come before /{id}).
+    """
+    replacements = {(route.path, frozenset(route.methods)): route for route in override.routes}
+    merged = APIRouter()
+    for route in base.routes:
+        merged.routes.append(replacements.get((route.path, frozenset(route.methods)), route))
+    return merged
+
+
+def api_routers(db_mode: str = "sync") -> List[APIRouter]:
+    """Get the routers serving /api for the given database mode.
+
+    In async mode the CRUD, list and availability endpoints run on
+    AsyncSession. Endpoints without an async implementation (bulk import
+    and export, analytics, quotes, pricing rules) stay on the sync session
+    and run in the threadpool.
+    """
+    from backend.routers import analytics, cars, customers, pricing_rules, quotes, rentals
+
+    if db_mode != "async":
+        return [
+            cars.router, customers.router, rentals.router,
+            analytics.router, quotes.router, pricing_rules.router,
+        ]
+
+    from backend.routers import async_cars, async_customers, async_rentals
+
+    return [
+        merge_routes(cars.router, async_cars.router),
+        merge_routes(customers.router, async_customers.router),
+        merge_routes(rentals.router, async_rentals.router),
+        analytics.router,
+        quotes.router,
+        pricing_rules.router,
+    ]
@@ -0,0 +1,47 @@
+"""Analytics router with revenue and utilization endpoints."""
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+from typing import List, Tuple
+from datetime import date
+
+from backend.cache import ConditionalGet
+from backend.db import get_read_db
+from backend.schemas import CarRevenue, DailyRevenue, FleetUtilization, MakeRevenue
+from backend.services.analytics_service import AnalyticsService
+
+router = APIRouter(prefix="/api/analytics", tags=["analytics"])
+
+# Rollups change with rentals; per-car and per-make figures also read cars
+analytics_etag = ConditionalGet("rentals", "cars")
+
+
+def date_range(
+    start: date = Query(..., description="First day of the range (inclusive)"),
+    end: date = Query(..., description="Day after the range (exclusive)")
+) -> Tuple[date, date]:
+    """Parse the start and end query parameters."""
+    return start, end
+
+
+@router.get("/daily", response_model=List[DailyRevenue], dependencies=[Depends(analytics_etag)])
+def get_daily_revenue(dates: Tuple[date, date] = Depends(date_range), db: Session = Depends(get_read_db)):
+    """Get revenue and utilization for every day in the range."""
+    return AnalyticsService.get_daily(db, *dates)
+
+
+@router.get("/cars", response_model=List[CarRevenue], dependencies=[Depends(analytics_etag)])
+def get_car_revenue(dates: Tuple[date, date] = Depends(date_range), db: Session = Depends(get_read_db)):
+    """Get revenue and utilization per rented car over the range."""
+    return AnalyticsService.get_by_car(db, *dates)
+
+
+@router.get("/makes", response_model=List[MakeRevenue], dependencies=[Depends(analytics_etag)])
+def get_make_revenue(dates: Tuple[date, date] = Depends(date_range), db: Session = Depends(get_read_db)):
+    """Get revenue and utilization per make over the range."""
+    return AnalyticsService.get_by_make(db, *dates)
+
+
+@router.get("/utilization", response_model=FleetUtilization, dependencies=[Depends(analytics_etag)])
+def get_fleet_utilization(dates: Tuple[date, date] = Depends(date_range), db: Session = Depends(get_read_db)):
+    """Get fleet-wide revenue and utilization over the range."""
+    return AnalyticsService.get_utilization(db, *dates)
@@ -0,0 +1,89 @@
+"""Async car router, replacing the sync CRUD endpoints in async mode."""
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+
+from backend.cache import ConditionalGet
+from backend.db import get_async_db, get_async_read_db
+from backend.pagination import MAX_PAGE_SIZE, set_next_cursor
+from backend.serialization import json_response, list_response
+from backend.schemas import CarCreate, CarUpdate, CarRead, CarSearchFilter, CarSearchResult
+from backend.services.async_car_service import AsyncCarService
+from backend.services.car_service import SEARCH_PAGE_SIZE
+
+router = APIRouter(prefix="/api/cars", tags=["cars"])
+
+
+@router.get("", response_model=List[CarRead], dependencies=[Depends(ConditionalGet("cars"))])
+async def get_all_cars(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all cars"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get all cars, or one page of them when a limit is given."""
+    if limit is None and cursor is None:
+        # The full list is served pre-serialized from the car cache
+        return json_response(await AsyncCarService.get_all_json(db), response)
+    cars, next_cursor = await AsyncCarService.get_page(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return list_response(CarRead, cars, response)
+
+
+@router.get("/available", response_model=List[CarRead], dependencies=[Depends(ConditionalGet("cars", "rentals"))])
+async def get_available_cars(
+    response: Response,
+    start: date = Query(..., description="First day of the rental window"),
+    end: date = Query(..., description="End of the rental window (exclusive)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all available cars"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get cars that can be booked for the whole date window."""
+    cars, next_cursor = await AsyncCarService.get_available(db, start, end, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return list_response(CarRead, cars, response)
+
+
+@router.get("/search", response_model=CarSearchResult, dependencies=[Depends(ConditionalGet("cars"))])
+async def search_cars(
+    response: Response,
+    filters: CarSearchFilter = Depends(),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Search cars by make, model, year, status and price band, with facet counts.
+
+    Each facet's counts apply every filter but its own, so they show what
+    choosing another value of that facet would match.
+    """
+    result, next_cursor = await AsyncCarService.search(db, filters, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return result
+
+
+@router.get("/{car_id}", response_model=CarRead, dependencies=[Depends(ConditionalGet("cars"))])
+async def get_car(car_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """Get a car by ID."""
+    return await AsyncCarService.get_snapshot(db, car_id)
+
+
+@router.post("", response_model=CarRead, status_code=201)
+async def create_car(car_data: CarCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a new car."""
+    return await AsyncCarService.create(db, car_data)
+
+
+@router.put("/{car_id}", response_model=CarRead)
+async def update_car(car_id: int, car_data: CarUpdate, db: AsyncSession = Depends(get_async_db)):
+    """Update an existing car."""
+    return await AsyncCarService.update(db, car_id, car_data)
+
+
+@router.delete("/{car_id}", status_code=204)
+async def delete_car(car_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Delete a car."""
+    await AsyncCarService.delete(db, car_id)
+    return None
@@ -0,0 +1,63 @@
+"""Async customer router, replacing the sync CRUD endpoints in async mode."""
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from backend.cache import ConditionalGet
+from backend.db import get_async_db, get_async_read_db
+from backend.pagination import MAX_PAGE_SIZE, set_next_cursor
+from backend.serialization import list_response
+from backend.schemas import CustomerCreate, CustomerUpdate, CustomerRead
+from backend.services.async_customer_service import AsyncCustomerService
+from backend.services.customer_service import MAX_SEARCH_LIMIT, SEARCH_LIMIT
+
+router = APIRouter(prefix="/api/customers", tags=["customers"])
+
+
+@router.get("", response_model=List[CustomerRead], dependencies=[Depends(ConditionalGet("customers"))])
+async def get_all_customers(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all customers"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get all customers, or one page of them when a limit is given."""
+    customers, next_cursor = await AsyncCustomerService.get_page(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return list_response(CustomerRead, customers, response)
+
+
+@router.get("/search", response_model=List[CustomerRead], dependencies=[Depends(ConditionalGet("customers"))])
+async def search_customers(
+    response: Response,
+    q: str = Query(..., max_length=100, description="Search text; each word matches the start of a word in name, email, phone or license number"),
+    limit: int = Query(SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT, description="Maximum number of results"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Search customers for typeahead, best matches first."""
+    return list_response(CustomerRead, await AsyncCustomerService.search(db, q, limit), response)
+
+
+@router.get("/{customer_id}", response_model=CustomerRead, dependencies=[Depends(ConditionalGet("customers"))])
+async def get_customer(customer_id: int, db: AsyncSession = Depends(get_async_read_db)):
+    """Get a customer by ID."""
+    return await AsyncCustomerService.get_by_id(db, customer_id)
+
+
+@router.post("", response_model=CustomerRead, status_code=201)
+async def create_customer(customer_data: CustomerCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a new customer."""
+    return await AsyncCustomerService.create(db, customer_data)
+
+
+@router.put("/{customer_id}", response_model=CustomerRead)
+async def update_customer(customer_id: int, customer_data: CustomerUpdate, db: AsyncSession = Depends(get_async_db)):
+    """Update an existing customer."""
+    return await AsyncCustomerService.update(db, customer_id, customer_data)
+
+
+@router.delete("/{customer_id}", status_code=204)
+async def delete_customer(customer_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Delete a customer."""
+    await AsyncCustomerService.delete(db, customer_id)
+    return None
@@ -0,0 +1,67 @@
+"""Async rental router, replacing the sync CRUD endpoints in async mode."""
+from fastapi import APIRouter, Depends, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+
+from backend.db import get_async_db, get_async_read_db
+from backend.pagination import MAX_PAGE_SIZE, set_next_cursor
+from backend.serialization import list_response
+from backend.routers.rentals import parse_expand, rentals_etag
+from backend.schemas import RentalCreate, RentalUpdate, RentalRead, RentalExpandedRead, RentalFilter
+from backend.services.async_rental_service import AsyncRentalService
+
+router = APIRouter(prefix="/api/rentals", tags=["rentals"])
+
+
+@router.get(
+    "",
+    response_model=List[RentalExpandedRead],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(rentals_etag)]
+)
+async def get_all_rentals(
+    response: Response,
+    filters: RentalFilter = Depends(),
+    expand: Tuple[str, ...] = Depends(parse_expand),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all rentals"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get rentals matching the filters, or one page of them when a limit is given."""
+    rentals, next_cursor = await AsyncRentalService.get_page(db, filters, limit=limit, cursor=cursor, expand=expand)
+    set_next_cursor(response, next_cursor)
+    return list_response(RentalExpandedRead if expand else RentalRead, rentals, response, exclude_unset=True)
+
+
+@router.get(
+    "/{rental_id}",
+    response_model=RentalExpandedRead,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(rentals_etag)]
+)
+async def get_rental(
+    rental_id: int,
+    expand: Tuple[str, ...] = Depends(parse_expand),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """Get a rental by ID."""
+    return await AsyncRentalService.get_by_id(db, rental_id, expand=expand)
+
+
+@router.post("", response_model=RentalRead, status_code=201)
+async def create_rental(rental_data: RentalCreate, db: AsyncSession = Depends(get_async_db)):
+    """Create a new rental."""
+    return await AsyncRentalService.create(db, rental_data)
+
+
+@router.put("/{rental_id}", response_model=RentalRead)
+async def update_rental(rental_id: int, rental_data: RentalUpdate, db: AsyncSession = Depends(get_async_db)):
+    """Update an existing rental."""
+    return await AsyncRentalService.update(db, rental_id, rental_data)
+
+
+@router.delete("/{rental_id}", status_code=204)
+async def delete_rental(rental_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Delete a rental."""
+    await AsyncRentalService.delete(db, rental_id)
+    return None
@@ -1,25 +1,92 @@
 """Car router with CRUD endpoints."""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import date
 
-from backend.db import get_db
-from backend.schemas import CarCreate, CarUpdate, CarRead
-from backend.services.car_service import CarService
+from backend.cache import ConditionalGet
+from backend.db import get_db, get_read_db
+from backend.importing import resolve_format, run_import
+from backend.pagination import MAX_PAGE_SIZE, set_next_cursor
+from backend.serialization import json_response, list_response
+from backend.schemas import CarCreate, CarUpdate, CarRead, CarSearchFilter, CarSearchResult, DataFormat, ImportResult
+from backend.services.car_service import SEARCH_PAGE_SIZE, CarService
 
 router = APIRouter(prefix="/api/cars", tags=["cars"])
 
 
-@router.get("", response_model=List[CarRead])
-def get_all_cars(db: Session = Depends(get_db)):
-    """Get all cars."""
-    return CarService.get_all(db)
+@router.get("", response_model=List[CarRead], dependencies=[Depends(ConditionalGet("cars"))])
+def get_all_cars(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all cars"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """Get all cars, or one page of them when a limit is given."""
+    if limit is None and cursor is None:
+        # The full list is served pre-serialized from the car cache
+        return json_response(CarService.get_all_json(db), response)
+    cars, next_cursor = CarService.get_page(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return list_response(CarRead, cars, response)
 
 
-@router.get("/{car_id}", response_model=CarRead)
-def get_car(car_id: int, db: Session = Depends(get_db)):
+@router.get("/available", response_model=List[CarRead], dependencies=[Depends(ConditionalGet("cars", "rentals"))])
+def get_available_cars(
+    response: Response,
+    start: date = Query(..., description="First day of the rental window"),
+    end: date = Query(..., description="End of the rental window (exclusive)"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all available cars"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """Get cars that can be booked for the whole date window."""
+    cars, next_cursor = CarService.get_available(db, start, end, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return list_response(CarRead, cars, response)
+
+
+@router.get("/search", response_model=CarSearchResult, dependencies=[Depends(ConditionalGet("cars"))])
+def search_cars(
+    response: Response,
+    filters: CarSearchFilter = Depends(),
+    limit: int = Query(SEARCH_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """Search cars by make, model, year, status and price band, with facet counts.
+
+    Each facet's counts apply every filter but its own, so they show what
+    choosing another value of that facet would match.
+    """
+    result, next_cursor = CarService.search(db, filters, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return result
+
+
+@router.post("/import", response_model=ImportResult)
+async def import_cars(
+    request: Request,
+    format: Optional[DataFormat] = Query(None, description="Body format; defaults to the Content-Type (text/csv or NDJSON)"),
+    db: Session = Depends(get_db)
+):
+    """Bulk import cars streamed as NDJSON or CSV.
+
+    Rows are validated like POST /api/cars and inserted in batches, one
+    transaction per batch. Invalid rows are skipped and reported by row number.
+    """
+    return await run_import(
+        request,
+        resolve_format(request, format),
+        CarCreate,
+        lambda rows: CarService.bulk_create(db, rows)
+    )
+
+
+@router.get("/{car_id}", response_model=CarRead, dependencies=[Depends(ConditionalGet("cars"))])
+def get_car(car_id: int, db: Session = Depends(get_read_db)):
     """Get a car by ID."""
-    return CarService.get_by_id(db, car_id)
+    return CarService.get_snapshot(db, car_id)
 
 
 @router.post("", response_model=CarRead, status_code=201)
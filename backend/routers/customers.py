@@ -1,23 +1,66 @@
 """Customer router with CRUD endpoints."""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 
-from backend.db import get_db
-from backend.schemas import CustomerCreate, CustomerUpdate, CustomerRead
-from backend.services.customer_service import CustomerService
+from backend.cache import ConditionalGet
+from backend.db import get_db, get_read_db
+from backend.importing import resolve_format, run_import
+from backend.pagination import MAX_PAGE_SIZE, set_next_cursor
+from backend.serialization import list_response
+from backend.schemas import CustomerCreate, CustomerUpdate, CustomerRead, DataFormat, ImportResult
+from backend.services.customer_service import MAX_SEARCH_LIMIT, SEARCH_LIMIT, CustomerService
 
 router = APIRouter(prefix="/api/customers", tags=["customers"])
 
 
-@router.get("", response_model=List[CustomerRead])
-def get_all_customers(db: Session = Depends(get_db)):
-    """Get all customers."""
-    return CustomerService.get_all(db)
+@router.get("", response_model=List[CustomerRead], dependencies=[Depends(ConditionalGet("customers"))])
+def get_all_customers(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all customers"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """Get all customers, or one page of them when a limit is given."""
+    customers, next_cursor = CustomerService.get_page(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, next_cursor)
+    return list_response(CustomerRead, customers, response)
 
 
-@router.get("/{customer_id}", response_model=CustomerRead)
-def get_customer(customer_id: int, db: Session = Depends(get_db)):
+@router.post("/import", response_model=ImportResult)
+async def import_customers(
+    request: Request,
+    format: Optional[DataFormat] = Query(None, description="Body format; defaults to the Content-Type (text/csv or NDJSON)"),
+    db: Session = Depends(get_db)
+):
+    """Bulk import customers streamed as NDJSON or CSV.
+
+    Rows are validated like POST /api/customers. Each batch is checked for
+    duplicate emails and license numbers, within itself and against existing
+    customers, then inserted in one transaction. Invalid and conflicting rows
+    are skipped and reported by row number.
+    """
+    return await run_import(
+        request,
+        resolve_format(request, format),
+        CustomerCreate,
+        lambda rows: CustomerService.bulk_create(db, rows)
+    )
+
+
+@router.get("/search", response_model=List[CustomerRead], dependencies=[Depends(ConditionalGet("customers"))])
+def search_customers(
+    response: Response,
+    q: str = Query(..., max_length=100, description="Search text; each word matches the start of a word in name, email, phone or license number"),
+    limit: int = Query(SEARCH_LIMIT, ge=1, le=MAX_SEARCH_LIMIT, description="Maximum number of results"),
+    db: Session = Depends(get_read_db)
+):
+    """Search customers for typeahead, best matches first."""
+    return list_response(CustomerRead, CustomerService.search(db, q, limit), response)
+
+
+@router.get("/{customer_id}", response_model=CustomerRead, dependencies=[Depends(ConditionalGet("customers"))])
+def get_customer(customer_id: int, db: Session = Depends(get_read_db)):
     """Get a customer by ID."""
     return CustomerService.get_by_id(db, customer_id)
 
@@ -0,0 +1,19 @@
+"""Debug router, included only with ORENTO_DEBUG."""
+from fastapi import APIRouter
+
+from backend.instrumentation import route_query_stats
+
+router = APIRouter(prefix="/debug", tags=["debug"])
+
+
+@router.get("/queries")
+def get_query_stats():
+    """Get SQL query counts and times aggregated per route, most queries first."""
+    return route_query_stats.snapshot()
+
+
+@router.delete("/queries", status_code=204)
+def reset_query_stats():
+    """Reset the per-route query stats."""
+    route_query_stats.clear()
+    return None
@@ -0,0 +1,12 @@
+"""Metrics router serving the Prometheus scrape endpoint."""
+from fastapi import APIRouter, Response
+
+from backend import metrics
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics():
+    """Get the process's metrics in the Prometheus text format."""
+    return Response(metrics.render(), media_type=metrics.CONTENT_TYPE)
@@ -0,0 +1,42 @@
+"""Pricing rule router with CRUD endpoints."""
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from typing import List
+
+from backend.cache import ConditionalGet
+from backend.db import get_db, get_read_db
+from backend.schemas import PricingRuleCreate, PricingRuleUpdate, PricingRuleRead
+from backend.services.pricing_service import PricingService
+
+router = APIRouter(prefix="/api/pricing-rules", tags=["pricing"])
+
+
+@router.get("", response_model=List[PricingRuleRead], dependencies=[Depends(ConditionalGet("pricing_rules"))])
+def get_all_pricing_rules(db: Session = Depends(get_read_db)):
+    """Get all pricing rules."""
+    return PricingService.get_all(db)
+
+
+@router.get("/{rule_id}", response_model=PricingRuleRead, dependencies=[Depends(ConditionalGet("pricing_rules"))])
+def get_pricing_rule(rule_id: int, db: Session = Depends(get_read_db)):
+    """Get a pricing rule by ID."""
+    return PricingService.get_by_id(db, rule_id)
+
+
+@router.post("", response_model=PricingRuleRead, status_code=201)
+def create_pricing_rule(rule_data: PricingRuleCreate, db: Session = Depends(get_db)):
+    """Create a new pricing rule; it applies to rentals created or repriced afterwards."""
+    return PricingService.create(db, rule_data)
+
+
+@router.put("/{rule_id}", response_model=PricingRuleRead)
+def update_pricing_rule(rule_id: int, rule_data: PricingRuleUpdate, db: Session = Depends(get_db)):
+    """Update an existing pricing rule."""
+    return PricingService.update(db, rule_id, rule_data)
+
+
+@router.delete("/{rule_id}", status_code=204)
+def delete_pricing_rule(rule_id: int, db: Session = Depends(get_db)):
+    """Delete a pricing rule."""
+    PricingService.delete(db, rule_id)
+    return None
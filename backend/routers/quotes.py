@@ -0,0 +1,21 @@
+"""Quote router pricing cars over candidate date ranges."""
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+from typing import List
+
+from backend.db import get_read_db
+from backend.serialization import list_response
+from backend.schemas import QuoteRequest, QuoteRead
+from backend.services.quote_service import QuoteService
+
+router = APIRouter(prefix="/api/quotes", tags=["quotes"])
+
+
+@router.post("", response_model=List[QuoteRead])
+def create_quotes(request: QuoteRequest, response: Response, db: Session = Depends(get_read_db)):
+    """Price every requested car (or every car) over every date range.
+
+    Prices are computed like rental totals; nothing is booked, and car
+    availability is not checked.
+    """
+    return list_response(QuoteRead, QuoteService.quote(db, request), response)
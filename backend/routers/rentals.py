@@ -1,25 +1,87 @@
 """Rental router with CRUD endpoints."""
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional, Tuple
 
-from backend.db import get_db
-from backend.schemas import RentalCreate, RentalUpdate, RentalRead
-from backend.services.rental_service import RentalService
+from backend.cache import ConditionalGet
+from backend.db import get_db, get_read_db
+from backend.exporting import MEDIA_TYPES, encode_rows
+from backend.pagination import MAX_PAGE_SIZE, set_next_cursor
+from backend.serialization import list_response
+from backend.schemas import RentalCreate, RentalUpdate, RentalRead, RentalExpandedRead, RentalFilter, DataFormat
+from backend.services.rental_service import RentalService, RENTAL_EXPANSIONS, EXPORT_COLUMNS
 
 router = APIRouter(prefix="/api/rentals", tags=["rentals"])
 
+# Rental reads can embed cars and customers, so their ETag covers all three tables
+rentals_etag = ConditionalGet("rentals", "cars", "customers")
 
-@router.get("", response_model=List[RentalRead])
-def get_all_rentals(db: Session = Depends(get_db)):
-    """Get all rentals."""
-    return RentalService.get_all(db)
 
+def parse_expand(
+    expand: Optional[str] = Query(None, description="Comma-separated relations to embed: car, customer")
+) -> Tuple[str, ...]:
+    """Parse the expand query parameter into relationship names."""
+    if not expand:
+        return ()
+    names = tuple(dict.fromkeys(name.strip() for name in expand.split(",") if name.strip()))
+    unknown = [name for name in names if name not in RENTAL_EXPANSIONS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Cannot expand: {', '.join(unknown)}")
+    return names
 
-@router.get("/{rental_id}", response_model=RentalRead)
-def get_rental(rental_id: int, db: Session = Depends(get_db)):
+
+@router.get(
+    "",
+    response_model=List[RentalExpandedRead],
+    response_model_exclude_unset=True,
+    dependencies=[Depends(rentals_etag)]
+)
+def get_all_rentals(
+    response: Response,
+    filters: RentalFilter = Depends(),
+    expand: Tuple[str, ...] = Depends(parse_expand),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size; omit to get all rentals"),
+    cursor: Optional[str] = Query(None, description="Cursor from the X-Next-Cursor header of the previous page"),
+    db: Session = Depends(get_read_db)
+):
+    """Get rentals matching the filters, or one page of them when a limit is given."""
+    rentals, next_cursor = RentalService.get_page(db, filters, limit=limit, cursor=cursor, expand=expand)
+    set_next_cursor(response, next_cursor)
+    return list_response(RentalExpandedRead if expand else RentalRead, rentals, response, exclude_unset=True)
+
+
+@router.get("/export", response_class=StreamingResponse)
+def export_rentals(
+    filters: RentalFilter = Depends(),
+    format: DataFormat = Query(DataFormat.CSV, description="Output format"),
+    db: Session = Depends(get_read_db)
+):
+    """Stream all rentals matching the filters as CSV or NDJSON.
+
+    Rows are read and written in batches, so memory use stays flat
+    regardless of how many rentals match.
+    """
+    return StreamingResponse(
+        encode_rows(EXPORT_COLUMNS, RentalService.iter_export(db, filters), format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="rentals.{format.value}"'}
+    )
+
+
+@router.get(
+    "/{rental_id}",
+    response_model=RentalExpandedRead,
+    response_model_exclude_unset=True,
+    dependencies=[Depends(rentals_etag)]
+)
+def get_rental(
+    rental_id: int,
+    expand: Tuple[str, ...] = Depends(parse_expand),
+    db: Session = Depends(get_read_db)
+):
     """Get a rental by ID."""
-    return RentalService.get_by_id(db, rental_id)
+    return RentalService.get_by_id(db, rental_id, expand=expand)
 
 
 @router.post("", response_model=RentalRead, status_code=201)
@@ -1,9 +1,11 @@
 """Pydantic schemas for validation."""
-from pydantic import BaseModel, HttpUrl, EmailStr, Field, field_validator, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, HttpUrl, EmailStr, Field, field_validator, model_validator, ConfigDict
+from sqlalchemy import inspect
+from typing import Any, List, Optional, Union
 from datetime import date, datetime
+import enum
 
-from backend.models import CarStatus, RentalStatus
+from backend.models import CarStatus, PricingRuleKind, Rental, RentalStatus
 
 
 # ============= Car Schemas =============
@@ -60,6 +62,49 @@ class CarRead(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 
+class PriceBand(str, enum.Enum):
+    """Daily rate bands for faceted car search, lower bound inclusive."""
+    UNDER_50 = "0-50"
+    FROM_50 = "50-100"
+    FROM_100 = "100-200"
+    FROM_200 = "200+"
+
+
+class CarSearchFilter(BaseModel):
+    """Query parameters for faceted car search; omitted filters match every car."""
+    make: Optional[str] = None
+    model: Optional[str] = None
+    year: Optional[int] = None
+    status: Optional[CarStatus] = None
+    priceBand: Optional[PriceBand] = None
+
+
+class FacetCount(BaseModel):
+    """Schema for the number of cars with one facet value."""
+    value: Union[int, str]
+    count: int
+
+
+class CarFacets(BaseModel):
+    """Schema for the facet counts of a car search.
+
+    The counts of each facet apply every filter but that facet's own, so
+    they show how many cars each alternative value would match.
+    """
+    make: List[FacetCount]
+    model: List[FacetCount]
+    year: List[FacetCount]
+    status: List[FacetCount]
+    priceBand: List[FacetCount]
+
+
+class CarSearchResult(BaseModel):
+    """Schema for faceted car search response."""
+    total: int
+    items: List[CarRead]
+    facets: CarFacets
+
+
 # ============= Customer Schemas =============
 
 class CustomerCreate(BaseModel):
@@ -129,3 +174,191 @@ class RentalRead(BaseModel):
     totalCost: float
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class RentalExpandedRead(RentalRead):
+    """Schema for rental response with optionally embedded car and customer."""
+    car: Optional[CarRead] = None
+    customer: Optional[CustomerRead] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def only_loaded_relationships(cls, data: Any) -> Any:
+        """Embed relationships only if they were eager-loaded, never lazy-load them."""
+        if not isinstance(data, Rental):
+            return data
+        unloaded = inspect(data).unloaded
+        values = {name: getattr(data, name) for name in RentalRead.model_fields}
+        for name in ("car", "customer"):
+            if name not in unloaded:
+                values[name] = getattr(data, name)
+        return values
+
+
+class RentalSort(str, enum.Enum):
+    """Sort orders for rental listings; a leading '-' means descending."""
+    ID = "id"
+    ID_DESC = "-id"
+    START_DATE = "startDate"
+    START_DATE_DESC = "-startDate"
+    END_DATE = "endDate"
+    END_DATE_DESC = "-endDate"
+
+
+class RentalFilter(BaseModel):
+    """Query parameters for filtering and sorting rental listings."""
+    status: Optional[RentalStatus] = None
+    carId: Optional[int] = Field(None, gt=0)
+    customerId: Optional[int] = Field(None, gt=0)
+    startFrom: Optional[date] = Field(None, description="Earliest startDate (inclusive)")
+    startTo: Optional[date] = Field(None, description="Latest startDate (inclusive)")
+    endFrom: Optional[date] = Field(None, description="Earliest endDate (inclusive)")
+    endTo: Optional[date] = Field(None, description="Latest endDate (inclusive)")
+    sort: RentalSort = RentalSort.ID
+
+
+# ============= Bulk Import/Export Schemas =============
+
+class DataFormat(str, enum.Enum):
+    """Row formats for bulk import and export endpoints."""
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+class ImportRowError(BaseModel):
+    """Schema for a row rejected by a bulk import."""
+    row: int
+    errors: List[str]
+
+
+class ImportResult(BaseModel):
+    """Schema for bulk import response."""
+    inserted: int = 0
+    failed: int = 0
+    errors: List[ImportRowError] = []
+
+
+# ============= Analytics Schemas =============
+
+class DailyRevenue(BaseModel):
+    """Schema for one day of fleet revenue and utilization."""
+    day: date
+    revenue: float
+    rentedCars: int
+    utilization: float
+
+
+class CarRevenue(BaseModel):
+    """Schema for one car's revenue and utilization over a date range."""
+    carId: int
+    make: str
+    model: str
+    revenue: float
+    rentedDays: int
+    utilization: float
+
+
+class MakeRevenue(BaseModel):
+    """Schema for one make's revenue and utilization over a date range."""
+    make: str
+    cars: int
+    revenue: float
+    rentedDays: int
+    utilization: float
+
+
+class FleetUtilization(BaseModel):
+    """Schema for fleet-wide totals over a date range."""
+    start: date
+    end: date
+    fleetSize: int
+    revenue: float
+    rentedCarDays: int
+    utilization: float
+
+
+# ============= Quote Schemas =============
+
+class DateRange(BaseModel):
+    """Schema for a candidate rental period."""
+    startDate: date
+    endDate: date
+
+    @field_validator('endDate')
+    @classmethod
+    def validate_end_date(cls, v: date, info) -> date:
+        """Validate end date is not before start date."""
+        if 'startDate' in info.data and v < info.data['startDate']:
+            raise ValueError("endDate must be >= startDate")
+        return v
+
+
+class QuoteRequest(BaseModel):
+    """Schema for a batch quote: every car priced for every date range."""
+    carIds: Optional[List[int]] = Field(None, description="Cars to price; omit to price every car")
+    ranges: List[DateRange] = Field(..., min_length=1)
+
+
+class QuoteRead(BaseModel):
+    """Schema for the price of one car over one date range."""
+    carId: int
+    startDate: date
+    endDate: date
+    days: int
+    totalCost: float
+
+
+# ============= Pricing Rule Schemas =============
+
+# Days a SEASONAL rule may cover, and the most days one rule may cover
+MIN_RULE_DATE = date(2000, 1, 1)
+MAX_RULE_DATE = date(2999, 12, 31)
+MAX_SEASON_DAYS = 366
+
+class PricingRuleCreate(BaseModel):
+    """Schema for creating a pricing rule."""
+    name: str = Field(..., min_length=1, max_length=100)
+    kind: PricingRuleKind
+    multiplier: float = Field(..., gt=0, description="Rate multiplier, e.g. 1.2 for +20% or 0.9 for -10%")
+    startDate: Optional[date] = Field(None, description="First day of a SEASONAL rule")
+    endDate: Optional[date] = Field(None, description="Last day of a SEASONAL rule (inclusive)")
+    minDays: Optional[int] = Field(None, ge=1, description="Shortest rental a LONG_TERM rule applies to")
+
+    @model_validator(mode="after")
+    def validate_kind_fields(self) -> "PricingRuleCreate":
+        """Validate the fields each kind of rule needs."""
+        if self.kind == PricingRuleKind.SEASONAL:
+            if self.startDate is None or self.endDate is None:
+                raise ValueError("SEASONAL rules need startDate and endDate")
+            if self.endDate < self.startDate:
+                raise ValueError("endDate must be >= startDate")
+            if self.startDate < MIN_RULE_DATE or self.endDate > MAX_RULE_DATE:
+                raise ValueError(f"SEASONAL rules must fall between {MIN_RULE_DATE} and {MAX_RULE_DATE}")
+            if (self.endDate - self.startDate).days >= MAX_SEASON_DAYS:
+                raise ValueError(f"SEASONAL rules cannot cover more than {MAX_SEASON_DAYS} days")
+        if self.kind == PricingRuleKind.LONG_TERM and self.minDays is None:
+            raise ValueError("LONG_TERM rules need minDays")
+        return self
+
+
+class PricingRuleUpdate(BaseModel):
+    """Schema for updating a pricing rule."""
+    name: Optional[str] = Field(None, min_length=1, max_length=100)
+    kind: Optional[PricingRuleKind] = None
+    multiplier: Optional[float] = Field(None, gt=0)
+    startDate: Optional[date] = None
+    endDate: Optional[date] = None
+    minDays: Optional[int] = Field(None, ge=1)
+
+
+class PricingRuleRead(BaseModel):
+    """Schema for pricing rule response."""
+    id: int
+    name: str
+    kind: PricingRuleKind
+    multiplier: float
+    startDate: Optional[date]
+    endDate: Optional[date]
+    minDays: Optional[int]
+
+    model_config = ConfigDict(from_attributes=True)
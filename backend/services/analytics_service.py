@@ -0,0 +1,248 @@
+"""Analytics service reading and maintaining the daily rental rollups."""
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Tuple
+from fastapi import HTTPException
+from datetime import date, timedelta
+
+from backend.models import Car, Rental, RentalDailyRollup, RentalStatus
+from backend.schemas import CarRevenue, DailyRevenue, FleetUtilization, MakeRevenue
+
+# Longest date range an analytics query may cover
+MAX_RANGE_DAYS = 3660
+
+# Rollup rows inserted per statement when rebuilding
+REBUILD_BATCH_SIZE = 5000
+
+# INSERT constructs with ON CONFLICT DO UPDATE, by dialect name; other
+# databases add rollup rows with an update, then an insert if none matched
+UPSERT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+class AnalyticsService:
+    """Service for revenue and utilization analytics.
+
+    Queries read `rental_daily_rollups`, whose size depends on the date
+    range and fleet size but not on the number of rentals.
+    """
+
+    @staticmethod
+    def _rented_days(start_date: date, end_date: date) -> List[date]:
+        """Get the days a rental occupies: [start, end), minimum one day."""
+        days = max((end_date - start_date).days, 1)
+        return [start_date + timedelta(days=i) for i in range(days)]
+
+    @staticmethod
+    def _contribution(rental: Any) -> List[Dict[str, Any]]:
+        """Get the rollup rows a rental adds; cancelled rentals add none."""
+        if rental.status == RentalStatus.CANCELLED:
+            return []
+        days = AnalyticsService._rented_days(rental.startDate, rental.endDate)
+        revenue = rental.totalCost / len(days)
+        return [{"day": day, "carId": rental.carId, "revenue": revenue, "rentals": 1} for day in days]
+
+    @staticmethod
+    def _upsert(db: Session, rows: List[Dict[str, Any]]) -> None:
+        """Add rows to the rollups, summing into existing (day, car) rows."""
+        if not rows:
+            return
+        upsert = UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if upsert is None:
+            AnalyticsService._add_rows(db, rows)
+            return
+        stmt = upsert(RentalDailyRollup)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RentalDailyRollup.day, RentalDailyRollup.carId],
+            set_={
+                "revenue": RentalDailyRollup.revenue + stmt.excluded.revenue,
+                "rentals": RentalDailyRollup.rentals + stmt.excluded.rentals,
+            }
+        )
+        db.execute(stmt, rows)
+
+    @staticmethod
+    def _add_rows(db: Session, rows: List[Dict[str, Any]]) -> None:
+        """Add rows to the rollups without ON CONFLICT: update, else insert."""
+        totals: Dict[Tuple[date, int], List[float]] = {}
+        for row in rows:
+            total = totals.setdefault((row["day"], row["carId"]), [0.0, 0])
+            total[0] += row["revenue"]
+            total[1] += row["rentals"]
+        for (day, car_id), (revenue, rentals) in totals.items():
+            result = db.execute(
+                update(RentalDailyRollup)
+                .where(RentalDailyRollup.day == day, RentalDailyRollup.carId == car_id)
+                .values(revenue=RentalDailyRollup.revenue + revenue, rentals=RentalDailyRollup.rentals + rentals)
+            )
+            if result.rowcount == 0:
+                db.execute(
+                    insert(RentalDailyRollup),
+                    {"day": day, "carId": car_id, "revenue": revenue, "rentals": rentals}
+                )
+
+    @staticmethod
+    def record_change(db: Session, old: Any = None, new: Any = None) -> None:
+        """Move a rental's contribution from its old to its new state.
+
+        `old` and `new` are rental-like objects (carId, startDate, endDate,
+        status, totalCost), or None for a created or deleted rental. Runs in
+        the caller's transaction, so the rollups commit with the rental.
+        """
+        removed = AnalyticsService._contribution(old) if old is not None else []
+        added = AnalyticsService._contribution(new) if new is not None else []
+        if removed == added:
+            return
+        AnalyticsService._upsert(
+            db,
+            [{**row, "revenue": -row["revenue"], "rentals": -1} for row in removed] + added
+        )
+        if removed:
+            # Drop (day, car) rows no rental covers any more
+            db.execute(
+                delete(RentalDailyRollup).where(
+                    RentalDailyRollup.carId == old.carId,
+                    RentalDailyRollup.day.in_([row["day"] for row in removed]),
+                    RentalDailyRollup.rentals <= 0
+                )
+            )
+
+    @staticmethod
+    def rebuild(db: Session) -> int:
+        """Recompute all rollups from the rentals table; returns the row count."""
+        totals: Dict[Tuple[date, int], List[float]] = {}
+        stmt = select(
+            Rental.carId, Rental.startDate, Rental.endDate, Rental.status, Rental.totalCost
+        ).execution_options(yield_per=REBUILD_BATCH_SIZE)
+        for rental in db.execute(stmt):
+            for row in AnalyticsService._contribution(rental):
+                total = totals.setdefault((row["day"], row["carId"]), [0.0, 0])
+                total[0] += row["revenue"]
+                total[1] += 1
+
+        db.execute(delete(RentalDailyRollup))
+        rows = [
+            {"day": day, "carId": car_id, "revenue": revenue, "rentals": rentals}
+            for (day, car_id), (revenue, rentals) in sorted(totals.items())
+        ]
+        for i in range(0, len(rows), REBUILD_BATCH_SIZE):
+            db.execute(RentalDailyRollup.__table__.insert(), rows[i:i + REBUILD_BATCH_SIZE])
+        db.commit()
+        return len(rows)
+
+    @staticmethod
+    def _check_range(start: date, end: date) -> int:
+        """Validate a [start, end) range and get its length in days."""
+        days = (end - start).days
+        if days < 1:
+            raise HTTPException(status_code=400, detail="end must be after start")
+        if days > MAX_RANGE_DAYS:
+            raise HTTPException(status_code=400, detail=f"Date range cannot exceed {MAX_RANGE_DAYS} days")
+        return days
+
+    @staticmethod
+    def _in_range(start: date, end: date) -> list:
+        """Criteria for rollup rows in [start, end)."""
+        return [RentalDailyRollup.day >= start, RentalDailyRollup.day < end]
+
+    @staticmethod
+    def _fleet_size(db: Session) -> int:
+        """Count the cars in the fleet."""
+        return db.scalar(select(func.count(Car.id)))
+
+    @staticmethod
+    def get_daily(db: Session, start: date, end: date) -> List[DailyRevenue]:
+        """Get revenue and utilization for every day in [start, end)."""
+        days = AnalyticsService._check_range(start, end)
+        fleet = AnalyticsService._fleet_size(db)
+        stmt = (
+            select(RentalDailyRollup.day, func.sum(RentalDailyRollup.revenue), func.count())
+            .where(*AnalyticsService._in_range(start, end))
+            .group_by(RentalDailyRollup.day)
+        )
+        totals = {day: (revenue, cars) for day, revenue, cars in db.execute(stmt)}
+        series = []
+        for i in range(days):
+            day = start + timedelta(days=i)
+            revenue, cars = totals.get(day, (0.0, 0))
+            series.append(DailyRevenue(
+                day=day,
+                revenue=round(revenue, 2),
+                rentedCars=cars,
+                utilization=round(cars / fleet, 4) if fleet else 0.0
+            ))
+        return series
+
+    @staticmethod
+    def get_by_car(db: Session, start: date, end: date) -> List[CarRevenue]:
+        """Get revenue and utilization per car over [start, end), highest revenue first."""
+        days = AnalyticsService._check_range(start, end)
+        totals = (
+            select(
+                RentalDailyRollup.carId,
+                func.sum(RentalDailyRollup.revenue).label("revenue"),
+                func.count().label("rentedDays")
+            )
+            .where(*AnalyticsService._in_range(start, end))
+            .group_by(RentalDailyRollup.carId)
+            .subquery()
+        )
+        stmt = (
+            select(Car.id, Car.make, Car.model, totals.c.revenue, totals.c.rentedDays)
+            .join(totals, totals.c.carId == Car.id)
+            .order_by(totals.c.revenue.desc(), Car.id)
+        )
+        return [
+            CarRevenue(
+                carId=car_id,
+                make=make,
+                model=model,
+                revenue=round(revenue, 2),
+                rentedDays=rented_days,
+                utilization=round(rented_days / days, 4)
+            )
+            for car_id, make, model, revenue, rented_days in db.execute(stmt)
+        ]
+
+    @staticmethod
+    def get_by_make(db: Session, start: date, end: date) -> List[MakeRevenue]:
+        """Get revenue and utilization per make over [start, end), highest revenue first."""
+        days = AnalyticsService._check_range(start, end)
+        fleet = dict(db.execute(select(Car.make, func.count(Car.id)).group_by(Car.make)).all())
+        stmt = (
+            select(Car.make, func.sum(RentalDailyRollup.revenue), func.count())
+            .join(Car, Car.id == RentalDailyRollup.carId)
+            .where(*AnalyticsService._in_range(start, end))
+            .group_by(Car.make)
+        )
+        totals = {make: (revenue, rented_days) for make, revenue, rented_days in db.execute(stmt)}
+        makes = [
+            MakeRevenue(
+                make=make,
+                cars=cars,
+                revenue=round(totals.get(make, (0.0, 0))[0], 2),
+                rentedDays=totals.get(make, (0.0, 0))[1],
+                utilization=round(totals.get(make, (0.0, 0))[1] / (cars * days), 4)
+            )
+            for make, cars in fleet.items()
+        ]
+        return sorted(makes, key=lambda m: (-m.revenue, m.make))
+
+    @staticmethod
+    def get_utilization(db: Session, start: date, end: date) -> FleetUtilization:
+        """Get fleet-wide revenue and utilization over [start, end)."""
+        days = AnalyticsService._check_range(start, end)
+        fleet = AnalyticsService._fleet_size(db)
+        revenue, rented_car_days = db.execute(
+            select(func.coalesce(func.sum(RentalDailyRollup.revenue), 0.0), func.count())
+            .where(*AnalyticsService._in_range(start, end))
+        ).one()
+        return FleetUtilization(
+            start=start,
+            end=end,
+            fleetSize=fleet,
+            revenue=round(revenue, 2),
+            rentedCarDays=rented_car_days,
+            utilization=round(rented_car_days / (fleet * days), 4) if fleet else 0.0
+        )
@@ -0,0 +1,119 @@
+"""Async car service for the AsyncSession-based endpoints."""
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from fastapi import HTTPException
+from datetime import date
+
+from backend.models import Car
+from backend.schemas import CarCreate, CarUpdate, CarRead, CarFacets, CarSearchFilter, CarSearchResult
+from backend.pagination import keyset, split_page
+from backend.records import CarRecord, fetch_records_async, record_select
+from backend.cache import car_cache, car_facet_cache
+from backend.db import is_replica_session
+from backend.serialization import list_serializer
+from backend.services.car_service import CAR_LIST_KEY, SEARCH_PAGE_SIZE, CarService
+
+
+class AsyncCarService:
+    """Async counterpart of CarService.
+
+    Reads are native async queries built from the same criteria as
+    CarService. Writes run CarService's own logic through run_sync, so the
+    business rules stay in one place while database I/O still yields to the
+    event loop.
+    """
+
+    @staticmethod
+    async def get_all_json(db: AsyncSession) -> bytes:
+        """Get the JSON of all cars, from the car cache when warm."""
+        async def load() -> bytes:
+            cars = await fetch_records_async(db, record_select(CarRecord, Car), CarRecord)
+            return list_serializer(CarRead).dump(cars)
+
+        return await car_cache.aget_or_load(CAR_LIST_KEY, load, store=not is_replica_session(db))
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CarRecord], Optional[str]]:
+        """Get a page of cars ordered by id and the cursor of the next page."""
+        keys = (Car.id,)
+        stmt = keyset(record_select(CarRecord, Car), keys, limit=limit, cursor=cursor)
+        return split_page(await fetch_records_async(db, stmt, CarRecord), keys, limit)
+
+    @staticmethod
+    async def get_available(
+        db: AsyncSession,
+        start: date,
+        end: date,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CarRecord], Optional[str]]:
+        """Get cars that can be booked for the whole [start, end) window."""
+        keys = (Car.id,)
+        stmt = record_select(CarRecord, Car).where(*CarService._available_criteria(start, end))
+        stmt = keyset(stmt, keys, limit=limit, cursor=cursor)
+        return split_page(await fetch_records_async(db, stmt, CarRecord), keys, limit)
+
+    @staticmethod
+    async def get_facets(db: AsyncSession, filters: CarSearchFilter) -> CarFacets:
+        """Get the facet counts of a filter selection, from the facet cache when warm."""
+        async def load() -> CarFacets:
+            return CarService._facets({
+                name: (await db.execute(stmt)).all()
+                for name, stmt in CarService._facet_selects(filters).items()
+            })
+
+        return await car_facet_cache.aget_or_load(
+            CarService._facets_key(filters),
+            load,
+            store=not is_replica_session(db)
+        )
+
+    @staticmethod
+    async def search(
+        db: AsyncSession,
+        filters: CarSearchFilter,
+        limit: int = SEARCH_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Tuple[CarSearchResult, Optional[str]]:
+        """Get a page of cars matching the filters, with the facet counts, and the next cursor."""
+        keys = (Car.id,)
+        stmt = record_select(CarRecord, Car).where(*CarService._search_criteria(filters))
+        stmt = keyset(stmt, keys, limit=limit, cursor=cursor)
+        cars, next_cursor = split_page(await fetch_records_async(db, stmt, CarRecord), keys, limit)
+        facets = await AsyncCarService.get_facets(db, filters)
+        return CarService._search_result(filters, cars, facets), next_cursor
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, car_id: int) -> Car:
+        """Get car by ID."""
+        car = await db.get(Car, car_id)
+        if not car:
+            raise HTTPException(status_code=404, detail=f"Car with id {car_id} not found")
+        return car
+
+    @staticmethod
+    async def get_snapshot(db: AsyncSession, car_id: int) -> CarRead:
+        """Get a detached copy of a car, from the car cache when warm."""
+        async def load() -> CarRead:
+            return CarRead.model_validate(await AsyncCarService.get_by_id(db, car_id))
+
+        return await car_cache.aget_or_load(car_id, load, store=not is_replica_session(db))
+
+    @staticmethod
+    async def create(db: AsyncSession, car_data: CarCreate) -> Car:
+        """Create a new car."""
+        return await db.run_sync(CarService.create, car_data)
+
+    @staticmethod
+    async def update(db: AsyncSession, car_id: int, car_data: CarUpdate) -> Car:
+        """Update an existing car."""
+        return await db.run_sync(CarService.update, car_id, car_data)
+
+    @staticmethod
+    async def delete(db: AsyncSession, car_id: int) -> None:
+        """Delete a car."""
+        await db.run_sync(CarService.delete, car_id)
@@ -0,0 +1,58 @@
+"""Async customer service for the AsyncSession-based endpoints."""
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Tuple
+from fastapi import HTTPException
+
+from backend.models import Customer
+from backend.schemas import CustomerCreate, CustomerUpdate
+from backend.pagination import keyset, split_page
+from backend.records import CustomerRecord, fetch_records_async, record_select
+from backend.services.customer_service import CustomerService
+
+
+class AsyncCustomerService:
+    """Async counterpart of CustomerService.
+
+    Reads are native async queries; writes run CustomerService's logic
+    (including the uniqueness checks) through run_sync.
+    """
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CustomerRecord], Optional[str]]:
+        """Get a page of customers ordered by id and the cursor of the next page."""
+        keys = (Customer.id,)
+        stmt = keyset(record_select(CustomerRecord, Customer), keys, limit=limit, cursor=cursor)
+        return split_page(await fetch_records_async(db, stmt, CustomerRecord), keys, limit)
+
+    @staticmethod
+    async def search(db: AsyncSession, q: str, limit: int) -> List[CustomerRecord]:
+        """Get up to `limit` customers matching the search text, best first."""
+        stmt = CustomerService._search_select(db.get_bind().dialect.name, q, limit)
+        return await fetch_records_async(db, stmt, CustomerRecord) if stmt is not None else []
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, customer_id: int) -> Customer:
+        """Get customer by ID."""
+        customer = await db.get(Customer, customer_id)
+        if not customer:
+            raise HTTPException(status_code=404, detail=f"Customer with id {customer_id} not found")
+        return customer
+
+    @staticmethod
+    async def create(db: AsyncSession, customer_data: CustomerCreate) -> Customer:
+        """Create a new customer."""
+        return await db.run_sync(CustomerService.create, customer_data)
+
+    @staticmethod
+    async def update(db: AsyncSession, customer_id: int, customer_data: CustomerUpdate) -> Customer:
+        """Update an existing customer."""
+        return await db.run_sync(CustomerService.update, customer_id, customer_data)
+
+    @staticmethod
+    async def delete(db: AsyncSession, customer_id: int) -> None:
+        """Delete a customer."""
+        await db.run_sync(CustomerService.delete, customer_id)
@@ -0,0 +1,68 @@
+"""Async rental service for the AsyncSession-based endpoints."""
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional, Sequence, Tuple, Union
+from fastapi import HTTPException
+
+from backend.models import Rental
+from backend.schemas import RentalCreate, RentalUpdate, RentalFilter
+from backend.pagination import keyset, split_page
+from backend.records import RentalRecord, fetch_records_async, record_select
+from backend.services.rental_service import RentalService, RENTAL_EXPANSIONS
+
+
+class AsyncRentalService:
+    """Async counterpart of RentalService.
+
+    Reads are native async queries built from RentalService's filter
+    criteria and sort keys. Writes run RentalService's logic, including the
+    atomic booking, through run_sync.
+    """
+
+    @staticmethod
+    def _expanded_select(expand: Sequence[str] = ()):
+        """Build a rental select that eager-loads the requested relationships."""
+        return select(Rental).options(*[RENTAL_EXPANSIONS[name] for name in expand])
+
+    @staticmethod
+    async def get_page(
+        db: AsyncSession,
+        filters: Optional[RentalFilter] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        expand: Sequence[str] = ()
+    ) -> Tuple[Union[List[RentalRecord], List[Rental]], Optional[str]]:
+        """Get a page of filtered, sorted rentals and the cursor of the next page."""
+        filters = filters or RentalFilter()
+        keys, descending = RentalService._sort_keys(filters)
+        if not expand:
+            stmt = record_select(RentalRecord, Rental).where(*RentalService._filter_criteria(filters))
+            stmt = keyset(stmt, keys, limit=limit, cursor=cursor, descending=descending)
+            return split_page(await fetch_records_async(db, stmt, RentalRecord), keys, limit)
+        stmt = AsyncRentalService._expanded_select(expand).where(*RentalService._filter_criteria(filters))
+        rentals = await db.scalars(keyset(stmt, keys, limit=limit, cursor=cursor, descending=descending))
+        return split_page(list(rentals), keys, limit)
+
+    @staticmethod
+    async def get_by_id(db: AsyncSession, rental_id: int, expand: Sequence[str] = ()) -> Rental:
+        """Get rental by ID."""
+        stmt = AsyncRentalService._expanded_select(expand).where(Rental.id == rental_id)
+        rental = (await db.scalars(stmt)).first()
+        if not rental:
+            raise HTTPException(status_code=404, detail=f"Rental with id {rental_id} not found")
+        return rental
+
+    @staticmethod
+    async def create(db: AsyncSession, rental_data: RentalCreate) -> Rental:
+        """Create a new rental."""
+        return await db.run_sync(RentalService.create, rental_data)
+
+    @staticmethod
+    async def update(db: AsyncSession, rental_id: int, rental_data: RentalUpdate) -> Rental:
+        """Update an existing rental."""
+        return await db.run_sync(RentalService.update, rental_id, rental_data)
+
+    @staticmethod
+    async def delete(db: AsyncSession, rental_id: int) -> None:
+        """Delete a rental."""
+        await db.run_sync(RentalService.delete, rental_id)
@@ -1,19 +1,212 @@
 """Car service with business logic."""
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import Select, case, func, insert, or_, select
+from sqlalchemy.orm import Session, aliased
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import HTTPException
+from datetime import date, timedelta
 
-from backend.models import Car
-from backend.schemas import CarCreate, CarUpdate
+from backend.models import Car, CarStatus, Rental, RentalStatus
+from backend.schemas import (
+    CarCreate, CarUpdate, CarRead, CarFacets, CarSearchFilter, CarSearchResult, FacetCount, PriceBand
+)
+from backend.pagination import keyset, split_page
+from backend.records import CarRecord, fetch_records, record_select
+from backend.cache import car_cache, car_facet_cache, table_versions
+from backend.db import is_replica_session
+from backend.serialization import list_serializer
+
+# car_cache key of the serialized full car list
+CAR_LIST_KEY = "list"
+
+# Default page size of car search results
+SEARCH_PAGE_SIZE = 20
+
+# Daily rate range [low, high) of each price band; None is unbounded
+PRICE_BAND_BOUNDS = {
+    PriceBand.UNDER_50: (None, 50.0),
+    PriceBand.FROM_50: (50.0, 100.0),
+    PriceBand.FROM_100: (100.0, 200.0),
+    PriceBand.FROM_200: (200.0, None),
+}
 
 
 class CarService:
     """Service for car-related operations."""
 
     @staticmethod
-    def get_all(db: Session) -> List[Car]:
-        """Get all cars."""
-        return db.query(Car).all()
+    def get_all(db: Session) -> List[CarRecord]:
+        """Get all cars as read-only records."""
+        return fetch_records(db, record_select(CarRecord, Car), CarRecord)
+
+    @staticmethod
+    def get_all_json(db: Session) -> bytes:
+        """Get the JSON of all cars, from the car cache when warm."""
+        return car_cache.get_or_load(
+            CAR_LIST_KEY,
+            lambda: list_serializer(CarRead).dump(CarService.get_all(db)),
+            store=not is_replica_session(db)
+        )
+
+    @staticmethod
+    def get_page(
+        db: Session,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CarRecord], Optional[str]]:
+        """Get a page of cars ordered by id and the cursor of the next page."""
+        keys = (Car.id,)
+        stmt = keyset(record_select(CarRecord, Car), keys, limit=limit, cursor=cursor)
+        return split_page(fetch_records(db, stmt, CarRecord), keys, limit)
+
+    @staticmethod
+    def _overlapping_rental(car_id: Any, start: date, end: date, exclude_id: Optional[int] = None):
+        """Build an EXISTS probe for an ACTIVE rental of a car overlapping [start, end).
+
+        `car_id` is a car id, or a column to correlate with. Like cost
+        calculation, a window (or rental) ending on its start day counts as
+        one day. The rentals table is aliased so the probe also works inside
+        statements on rentals, where `exclude_id` skips the rental itself.
+        """
+        end = max(end, start + timedelta(days=1))
+        booked = aliased(Rental)
+
+        # Probe on ix_rentals_car_interval (carId, status, startDate, endDate)
+        criteria = [
+            booked.carId == car_id,
+            booked.status == RentalStatus.ACTIVE,
+            booked.startDate < end,
+            or_(booked.endDate > start, booked.startDate >= start)
+        ]
+        if exclude_id is not None:
+            criteria.append(booked.id != exclude_id)
+        return select(booked.id).where(*criteria).exists()
+
+    @staticmethod
+    def _available_criteria(start: date, end: date) -> list:
+        """Build the criteria for cars with no ACTIVE rental overlapping [start, end).
+
+        Cars in maintenance are never available. Otherwise only the window
+        matters, as it does when booking: a car rented next month can be
+        booked today.
+        """
+        if end < start:
+            raise HTTPException(status_code=400, detail="end must be >= start")
+        return [
+            Car.status != CarStatus.MAINTENANCE,
+            ~CarService._overlapping_rental(Car.id, start, end)
+        ]
+
+    @staticmethod
+    def get_available(
+        db: Session,
+        start: date,
+        end: date,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CarRecord], Optional[str]]:
+        """Get cars that can be booked for the whole [start, end) window."""
+        keys = (Car.id,)
+        stmt = record_select(CarRecord, Car).where(*CarService._available_criteria(start, end))
+        stmt = keyset(stmt, keys, limit=limit, cursor=cursor)
+        return split_page(fetch_records(db, stmt, CarRecord), keys, limit)
+
+    @staticmethod
+    def _facet_columns() -> Dict[str, Any]:
+        """Get the expression each search facet groups by, by facet name."""
+        bands = [
+            (Car.dailyRate < high, band.value)
+            for band, (_, high) in PRICE_BAND_BOUNDS.items()
+            if high is not None
+        ]
+        return {
+            "make": Car.make,
+            "model": Car.model,
+            "year": Car.year,
+            "status": Car.status,
+            "priceBand": case(*bands, else_=PriceBand.FROM_200.value),
+        }
+
+    @staticmethod
+    def _search_criteria(filters: CarSearchFilter, exclude: Optional[str] = None) -> list:
+        """Build the WHERE criteria for the search filters, leaving out `exclude`."""
+        criteria = []
+        for name in ("make", "model", "year", "status"):
+            value = getattr(filters, name)
+            if value is not None and name != exclude:
+                criteria.append(getattr(Car, name) == value)
+        if filters.priceBand is not None and exclude != "priceBand":
+            # A rate range rather than the band expression, so it can use indexes
+            low, high = PRICE_BAND_BOUNDS[filters.priceBand]
+            if low is not None:
+                criteria.append(Car.dailyRate >= low)
+            if high is not None:
+                criteria.append(Car.dailyRate < high)
+        return criteria
+
+    @staticmethod
+    def _facet_selects(filters: CarSearchFilter) -> Dict[str, Select]:
+        """Build one grouped count per facet, filtered by every other facet.
+
+        Values are ordered by value, and price bands from cheapest up.
+        """
+        selects = {}
+        for name, column in CarService._facet_columns().items():
+            order = func.min(Car.dailyRate) if name == "priceBand" else column
+            selects[name] = (
+                select(column, func.count())
+                .where(*CarService._search_criteria(filters, exclude=name))
+                .group_by(column)
+                .order_by(order)
+            )
+        return selects
+
+    @staticmethod
+    def _facets_key(filters: CarSearchFilter) -> tuple:
+        """Get the car_facet_cache key of a filter selection."""
+        return tuple(filters.model_dump().values())
+
+    @staticmethod
+    def _facets(counts: Dict[str, list]) -> CarFacets:
+        """Build CarFacets from (value, count) rows by facet name."""
+        return CarFacets(**{
+            name: [FacetCount(value=value, count=count) for value, count in rows]
+            for name, rows in counts.items()
+        })
+
+    @staticmethod
+    def _search_result(
+        filters: CarSearchFilter,
+        cars: List[CarRecord],
+        facets: CarFacets
+    ) -> CarSearchResult:
+        """Assemble a search result; the total is read off the make facet."""
+        total = sum(facet.count for facet in facets.make if filters.make in (None, facet.value))
+        return CarSearchResult(total=total, items=cars, facets=facets)
+
+    @staticmethod
+    def get_facets(db: Session, filters: CarSearchFilter) -> CarFacets:
+        """Get the facet counts of a filter selection, from the facet cache when warm."""
+        return car_facet_cache.get_or_load(
+            CarService._facets_key(filters),
+            lambda: CarService._facets({
+                name: db.execute(stmt).all() for name, stmt in CarService._facet_selects(filters).items()
+            }),
+            store=not is_replica_session(db)
+        )
+
+    @staticmethod
+    def search(
+        db: Session,
+        filters: CarSearchFilter,
+        limit: int = SEARCH_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Tuple[CarSearchResult, Optional[str]]:
+        """Get a page of cars matching the filters, with the facet counts, and the next cursor."""
+        keys = (Car.id,)
+        stmt = record_select(CarRecord, Car).where(*CarService._search_criteria(filters))
+        stmt = keyset(stmt, keys, limit=limit, cursor=cursor)
+        cars, next_cursor = split_page(fetch_records(db, stmt, CarRecord), keys, limit)
+        return CarService._search_result(filters, cars, CarService.get_facets(db, filters)), next_cursor
 
     @staticmethod
     def get_by_id(db: Session, car_id: int) -> Car:
@@ -23,6 +216,26 @@ class CarService:
             raise HTTPException(status_code=404, detail=f"Car with id {car_id} not found")
         return car
 
+    @staticmethod
+    def get_snapshot(db: Session, car_id: int) -> CarRead:
+        """Get a detached copy of a car, from the car cache when warm.
+
+        Snapshots may be up to the cache TTL old if the car was changed
+        outside this process; decisions that must be exact, such as booking
+        a car, are made by the database.
+        """
+        return car_cache.get_or_load(
+            car_id,
+            lambda: CarRead.model_validate(CarService.get_by_id(db, car_id)),
+            store=not is_replica_session(db)
+        )
+
+    @staticmethod
+    def invalidate(*car_ids: int) -> None:
+        """Drop cached data of changed cars; call after committing."""
+        car_cache.invalidate(*car_ids, CAR_LIST_KEY)
+        car_facet_cache.clear()
+
     @staticmethod
     def create(db: Session, car_data: CarCreate) -> Car:
         """Create a new car."""
@@ -33,9 +246,24 @@ class CarService:
         car = Car(**data)
         db.add(car)
         db.commit()
+        table_versions.bump("cars")
         db.refresh(car)
+        CarService.invalidate(car.id)
         return car
 
+    @staticmethod
+    def bulk_create(db: Session, cars: List[Tuple[int, CarCreate]]) -> List[Tuple[int, str]]:
+        """Insert a batch of (row, car) in one executemany transaction.
+
+        Returns the rejected rows, which for cars is always empty.
+        """
+        if cars:
+            db.execute(insert(Car), [car.model_dump(mode="json") for _, car in cars])
+            db.commit()
+            table_versions.bump("cars")
+            CarService.invalidate()
+        return []
+
     @staticmethod
     def update(db: Session, car_id: int, car_data: CarUpdate) -> Car:
         """Update an existing car."""
@@ -49,6 +277,8 @@ class CarService:
             setattr(car, field, value)
         
         db.commit()
+        table_versions.bump("cars")
+        CarService.invalidate(car_id)
         db.refresh(car)
         return car
 
@@ -58,3 +288,5 @@ class CarService:
         car = CarService.get_by_id(db, car_id)
         db.delete(car)
         db.commit()
+        table_versions.bump("cars")
+        CarService.invalidate(car_id)
@@ -1,19 +1,87 @@
 """Customer service with business logic."""
+import re
+
+from sqlalchemy import Select, and_, column, func, insert, literal_column, or_, select, table
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from fastapi import HTTPException
 
-from backend.models import Customer
+from backend.models import CUSTOMER_SEARCH_COLUMNS, CUSTOMER_SEARCH_TABLE, Customer
 from backend.schemas import CustomerCreate, CustomerUpdate
+from backend.pagination import keyset, split_page
+from backend.records import CustomerRecord, fetch_records, record_select
+from backend.cache import table_versions
+
+# Default and maximum number of customer search results
+SEARCH_LIMIT = 10
+MAX_SEARCH_LIMIT = 50
+
+# Search terms are runs of letters and digits, like the FTS tokens
+SEARCH_TERM = re.compile(r"[^\W_]+")
+
+# bm25 weights of the search columns: name matches rank above email
+# matches, which rank above phone and license number matches
+SEARCH_WEIGHTS = (4.0, 2.0, 1.0, 1.0)
+
+# The FTS5 index of customers, joined on its rowid (the customer id)
+customers_fts = table(CUSTOMER_SEARCH_TABLE, column("rowid"))
 
 
 class CustomerService:
     """Service for customer-related operations."""
 
     @staticmethod
-    def get_all(db: Session) -> List[Customer]:
-        """Get all customers."""
-        return db.query(Customer).all()
+    def get_all(db: Session) -> List[CustomerRecord]:
+        """Get all customers as read-only records."""
+        return fetch_records(db, record_select(CustomerRecord, Customer), CustomerRecord)
+
+    @staticmethod
+    def get_page(
+        db: Session,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[CustomerRecord], Optional[str]]:
+        """Get a page of customers ordered by id and the cursor of the next page."""
+        keys = (Customer.id,)
+        stmt = keyset(record_select(CustomerRecord, Customer), keys, limit=limit, cursor=cursor)
+        return split_page(fetch_records(db, stmt, CustomerRecord), keys, limit)
+
+    @staticmethod
+    def _search_select(dialect: str, q: str, limit: int) -> Optional[Select]:
+        """Build the ranked search query for `q`, or None if it has no terms.
+
+        Every term must match the start of a word in one of the search
+        columns, so each keystroke narrows the results. On SQLite this is a
+        prefix query on the customers_fts index ranked by bm25; other
+        databases fall back to prefix LIKE on whole column values.
+        """
+        terms = SEARCH_TERM.findall(q)
+        if not terms:
+            return None
+        stmt = record_select(CustomerRecord, Customer)
+        if dialect == "sqlite":
+            # Quoted prefix terms, implicitly ANDed: "ann"* "smi"*
+            query = " ".join(f'"{term}"*' for term in terms)
+            index = literal_column(CUSTOMER_SEARCH_TABLE)
+            return (
+                stmt.join(customers_fts, customers_fts.c.rowid == Customer.id)
+                .where(index.op("MATCH")(query))
+                .order_by(func.bm25(index, *SEARCH_WEIGHTS), Customer.id)
+                .limit(limit)
+            )
+        fields = [getattr(Customer, name) for name in CUSTOMER_SEARCH_COLUMNS]
+        return (
+            stmt.where(and_(*(or_(*(field.ilike(f"{term}%") for field in fields)) for term in terms)))
+            .order_by(Customer.name, Customer.id)
+            .limit(limit)
+        )
+
+    @staticmethod
+    def search(db: Session, q: str, limit: int) -> List[CustomerRecord]:
+        """Get up to `limit` customers matching the search text, best first."""
+        stmt = CustomerService._search_select(db.get_bind().dialect.name, q, limit)
+        return fetch_records(db, stmt, CustomerRecord) if stmt is not None else []
 
     @staticmethod
     def get_by_id(db: Session, customer_id: int) -> Customer:
@@ -39,9 +107,67 @@ class CustomerService:
         customer = Customer(**customer_data.model_dump())
         db.add(customer)
         db.commit()
+        table_versions.bump("customers")
         db.refresh(customer)
         return customer
 
+    @staticmethod
+    def _find_conflicts(db: Session, customers: List[Tuple[int, CustomerCreate]]) -> Dict[int, str]:
+        """Map row numbers to the reason they clash with this batch or existing customers.
+
+        Duplicates inside the batch are found in one pass over it, and clashes
+        with stored customers with one set-based query for the whole batch.
+        """
+        emails = {customer.email for _, customer in customers}
+        licenses = {customer.licenseNumber for _, customer in customers}
+        existing = db.execute(
+            select(Customer.email, Customer.licenseNumber).where(
+                or_(Customer.email.in_(emails), Customer.licenseNumber.in_(licenses))
+            )
+        ).all()
+        taken_emails = {email for email, _ in existing}
+        taken_licenses = {license for _, license in existing}
+
+        conflicts: Dict[int, str] = {}
+        first_email_row: Dict[str, int] = {}
+        first_license_row: Dict[str, int] = {}
+        for row, customer in customers:
+            if customer.email in taken_emails:
+                conflicts[row] = "Email already registered"
+            elif customer.licenseNumber in taken_licenses:
+                conflicts[row] = "License number already registered"
+            elif customer.email in first_email_row:
+                conflicts[row] = f"Email duplicates row {first_email_row[customer.email]}"
+            elif customer.licenseNumber in first_license_row:
+                conflicts[row] = f"License number duplicates row {first_license_row[customer.licenseNumber]}"
+            else:
+                first_email_row[customer.email] = row
+                first_license_row[customer.licenseNumber] = row
+        return conflicts
+
+    @staticmethod
+    def bulk_create(db: Session, customers: List[Tuple[int, CustomerCreate]]) -> List[Tuple[int, str]]:
+        """Insert a batch of (row, customer) in one transaction, skipping conflicts.
+
+        Returns the rejected rows with the reason. If a concurrent writer
+        inserts a clashing customer between the check and the insert, the
+        batch is rolled back and checked again once.
+        """
+        for attempt in range(2):
+            conflicts = CustomerService._find_conflicts(db, customers) if customers else {}
+            rows = [customer.model_dump() for row, customer in customers if row not in conflicts]
+            try:
+                if rows:
+                    db.execute(insert(Customer), rows)
+                    db.commit()
+                    table_versions.bump("customers")
+                break
+            except IntegrityError:
+                db.rollback()
+                if attempt == 1:
+                    raise
+        return sorted(conflicts.items())
+
     @staticmethod
     def update(db: Session, customer_id: int, customer_data: CustomerUpdate) -> Customer:
         """Update an existing customer."""
@@ -71,6 +197,7 @@ class CustomerService:
             setattr(customer, field, value)
         
         db.commit()
+        table_versions.bump("customers")
         db.refresh(customer)
         return customer
 
@@ -80,3 +207,4 @@ class CustomerService:
         customer = CustomerService.get_by_id(db, customer_id)
         db.delete(customer)
         db.commit()
+        table_versions.bump("customers")
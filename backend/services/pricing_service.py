@@ -0,0 +1,95 @@
+"""Pricing service managing pricing rules and their compiled calendar."""
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List
+from fastapi import HTTPException
+from pydantic import ValidationError
+from datetime import date
+
+from backend.models import PricingRule
+from backend.schemas import PricingRuleCreate, PricingRuleUpdate
+from backend.cache import TTLCache, table_versions
+from backend.db import is_replica_session
+from backend.pricing import PricingCalendar
+
+# Compiled calendars by pricing_rules version. Rule changes in this process
+# bump the version; the TTL bounds how long changes made by another process
+# go unnoticed.
+calendar_cache = TTLCache(maxsize=4, ttl=300.0, name="pricing_calendar")
+
+
+class PricingService:
+    """Service for pricing rules and rental prices."""
+
+    @staticmethod
+    def get_all(db: Session) -> List[PricingRule]:
+        """Get all pricing rules."""
+        return db.query(PricingRule).order_by(PricingRule.id).all()
+
+    @staticmethod
+    def get_by_id(db: Session, rule_id: int) -> PricingRule:
+        """Get a pricing rule by ID."""
+        rule = db.query(PricingRule).filter(PricingRule.id == rule_id).first()
+        if not rule:
+            raise HTTPException(status_code=404, detail=f"Pricing rule with id {rule_id} not found")
+        return rule
+
+    @staticmethod
+    def get_calendar(db: Session) -> PricingCalendar:
+        """Get the calendar compiled from the current rules, compiling it on a miss."""
+        return calendar_cache.get_or_load(
+            table_versions.get("pricing_rules"),
+            lambda: PricingCalendar(db.execute(select(PricingRule)).scalars().all()),
+            store=not is_replica_session(db)
+        )
+
+    @staticmethod
+    def calculate_total_cost(db: Session, start_date: date, end_date: date, daily_rate: float) -> float:
+        """Calculate a rental's total cost under the pricing rules."""
+        return PricingService.get_calendar(db).price(start_date, end_date, daily_rate)
+
+    @staticmethod
+    def _committed(db: Session) -> None:
+        """Commit a rule change and drop the compiled calendars."""
+        db.commit()
+        table_versions.bump("pricing_rules")
+        calendar_cache.clear()
+
+    @staticmethod
+    def create(db: Session, rule_data: PricingRuleCreate) -> PricingRule:
+        """Create a new pricing rule."""
+        rule = PricingRule(**rule_data.model_dump())
+        db.add(rule)
+        PricingService._committed(db)
+        db.refresh(rule)
+        return rule
+
+    @staticmethod
+    def update(db: Session, rule_id: int, rule_data: PricingRuleUpdate) -> PricingRule:
+        """Update an existing pricing rule."""
+        rule = PricingService.get_by_id(db, rule_id)
+
+        # The updated rule must still have the fields its kind needs
+        values = {field: getattr(rule, field) for field in PricingRuleCreate.model_fields}
+        values.update(rule_data.model_dump(exclude_unset=True))
+        try:
+            PricingRuleCreate.model_validate(values)
+        except ValidationError as e:
+            raise HTTPException(
+                status_code=400,
+                detail="; ".join(error["msg"] for error in e.errors(include_url=False))
+            )
+
+        for field, value in values.items():
+            setattr(rule, field, value)
+
+        PricingService._committed(db)
+        db.refresh(rule)
+        return rule
+
+    @staticmethod
+    def delete(db: Session, rule_id: int) -> None:
+        """Delete a pricing rule."""
+        rule = PricingService.get_by_id(db, rule_id)
+        db.delete(rule)
+        PricingService._committed(db)
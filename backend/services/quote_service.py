@@ -0,0 +1,91 @@
+"""Quote service pricing many cars over many date ranges at once."""
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+from fastapi import HTTPException
+from datetime import date
+
+from backend.models import Car
+from backend.schemas import QuoteRequest
+from backend.pricing import PricingCalendar
+from backend.services.pricing_service import PricingService
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# Most quotes (cars x ranges) one request may ask for
+MAX_QUOTES = 100_000
+
+
+class QuoteRecord(NamedTuple):
+    """Price of one car over one date range."""
+    carId: int
+    startDate: date
+    endDate: date
+    days: int
+    totalCost: float
+
+
+class QuoteService:
+    """Service for batch price quotes."""
+
+    @staticmethod
+    def _daily_rates(db: Session, car_ids: Optional[Sequence[int]] = None) -> List[Tuple[int, float]]:
+        """Get (id, dailyRate) of the cars, in request order, or of all cars by id."""
+        stmt = select(Car.id, Car.dailyRate)
+        if car_ids is None:
+            return [tuple(row) for row in db.execute(stmt.order_by(Car.id))]
+        car_ids = list(dict.fromkeys(car_ids))
+        rates = dict(db.execute(stmt.where(Car.id.in_(car_ids))).all())
+        missing = [car_id for car_id in car_ids if car_id not in rates]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Cars not found: {', '.join(map(str, missing))}")
+        return [(car_id, rates[car_id]) for car_id in car_ids]
+
+    @staticmethod
+    def price(
+        calendar: PricingCalendar,
+        daily_rates: Sequence[float],
+        ranges: Sequence[Tuple[date, date]]
+    ) -> Tuple[List[int], List[List[float]]]:
+        """Price every rate over every range.
+
+        Returns the day count of each range and a rates x ranges matrix of
+        total costs, equal to PricingCalendar.price for each pair: the
+        per-range terms are computed once, and each total uses the same
+        float64 operations in the same order. With numpy the matrix is
+        built with outer products; without it, pair by pair.
+        """
+        days, extras, multipliers = calendar.adjustments(ranges)
+        if np is None:
+            totals = [
+                [(count * rate + extra * rate) * multiplier for count, extra, multiplier in zip(days, extras, multipliers)]
+                for rate in daily_rates
+            ]
+            return days, totals
+        rates = np.asarray(daily_rates, dtype=np.float64)
+        totals = (
+            np.multiply.outer(rates, np.asarray(days, dtype=np.int64))
+            + np.multiply.outer(rates, np.asarray(extras, dtype=np.float64))
+        ) * np.asarray(multipliers, dtype=np.float64)
+        return days, totals.tolist()
+
+    @staticmethod
+    def quote(db: Session, request: QuoteRequest) -> List[QuoteRecord]:
+        """Price each requested car (car-major order) over each date range."""
+        cars = QuoteService._daily_rates(db, request.carIds)
+        if len(cars) * len(request.ranges) > MAX_QUOTES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Cannot quote more than {MAX_QUOTES} car/range combinations per request"
+            )
+        ranges = [(r.startDate, r.endDate) for r in request.ranges]
+        calendar = PricingService.get_calendar(db)
+        days, totals = QuoteService.price(calendar, [rate for _, rate in cars], ranges)
+        return [
+            QuoteRecord(car_id, start, end, range_days, total)
+            for (car_id, _), car_totals in zip(cars, totals)
+            for (start, end), range_days, total in zip(ranges, days, car_totals)
+        ]
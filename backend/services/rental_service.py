@@ -1,83 +1,275 @@
 """Rental service with business logic."""
-from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy import Row, insert, literal, select, update
+from sqlalchemy.orm import Session, joinedload
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
 from fastapi import HTTPException
 from datetime import date
 
 from backend.models import Rental, RentalStatus, Car, CarStatus, Customer
-from backend.schemas import RentalCreate, RentalUpdate
+from backend.schemas import RentalCreate, RentalUpdate, RentalFilter
+from backend.pagination import keyset, paginate, split_page
+from backend.records import RentalRecord, fetch_records, record_select
+from backend.cache import table_versions
+from backend.services.analytics_service import AnalyticsService
+from backend.services.car_service import CarService
+from backend.services.pricing_service import PricingService
+
+
+# Columns written by the rental export, in order
+EXPORT_COLUMNS = RentalRecord._fields
+
+# Rows fetched from the database per export batch
+EXPORT_BATCH_SIZE = 1000
+
+# Longest rental in days; every rented day is a rollup row and is priced
+MAX_RENTAL_DAYS = 365
+
+# Fields whose change re-checks an ACTIVE rental's window for overlaps
+BOOKING_FIELDS = {"carId", "startDate", "endDate", "status"}
+
+# Relationships that can be embedded in rental responses, loaded with a join
+RENTAL_EXPANSIONS = {
+    "car": joinedload(Rental.car, innerjoin=True),
+    "customer": joinedload(Rental.customer, innerjoin=True),
+}
 
 
 class RentalService:
     """Service for rental-related operations."""
 
     @staticmethod
-    def get_all(db: Session) -> List[Rental]:
-        """Get all rentals."""
-        return db.query(Rental).all()
+    def get_all(db: Session) -> List[RentalRecord]:
+        """Get all rentals as read-only records."""
+        return fetch_records(db, record_select(RentalRecord, Rental), RentalRecord)
 
     @staticmethod
-    def get_by_id(db: Session, rental_id: int) -> Rental:
+    def _expanded_query(db: Session, expand: Sequence[str] = ()):
+        """Build a rental query that eager-loads the requested relationships."""
+        return db.query(Rental).options(*[RENTAL_EXPANSIONS[name] for name in expand])
+
+    @staticmethod
+    def _filter_criteria(filters: RentalFilter) -> list:
+        """Build the WHERE criteria for the given filters."""
+        criteria = []
+        if filters.status is not None:
+            criteria.append(Rental.status == filters.status)
+        if filters.carId is not None:
+            criteria.append(Rental.carId == filters.carId)
+        if filters.customerId is not None:
+            criteria.append(Rental.customerId == filters.customerId)
+        if filters.startFrom is not None:
+            criteria.append(Rental.startDate >= filters.startFrom)
+        if filters.startTo is not None:
+            criteria.append(Rental.startDate <= filters.startTo)
+        if filters.endFrom is not None:
+            criteria.append(Rental.endDate >= filters.endFrom)
+        if filters.endTo is not None:
+            criteria.append(Rental.endDate <= filters.endTo)
+        return criteria
+
+    @staticmethod
+    def _filtered_query(db: Session, filters: RentalFilter, expand: Sequence[str] = ()):
+        """Build a rental query restricted by the given filters."""
+        return RentalService._expanded_query(db, expand).filter(*RentalService._filter_criteria(filters))
+
+    @staticmethod
+    def _sort_keys(filters: RentalFilter) -> Tuple[tuple, bool]:
+        """Get the keyset ordering columns and direction for the sort order."""
+        field = filters.sort.value.lstrip("-")
+        descending = filters.sort.value.startswith("-")
+        if field == "id":
+            return (Rental.id,), descending
+        return (getattr(Rental, field), Rental.id), descending
+
+    @staticmethod
+    def get_page(
+        db: Session,
+        filters: Optional[RentalFilter] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+        expand: Sequence[str] = ()
+    ) -> Tuple[Union[List[RentalRecord], List[Rental]], Optional[str]]:
+        """Get a page of filtered, sorted rentals and the cursor of the next page.
+
+        Without expansions the page is read as RentalRecord rows; embedding
+        the car or customer needs ORM instances with their relationships.
+        """
+        filters = filters or RentalFilter()
+        keys, descending = RentalService._sort_keys(filters)
+        if not expand:
+            stmt = record_select(RentalRecord, Rental).where(*RentalService._filter_criteria(filters))
+            stmt = keyset(stmt, keys, limit=limit, cursor=cursor, descending=descending)
+            return split_page(fetch_records(db, stmt, RentalRecord), keys, limit)
+        return paginate(
+            RentalService._filtered_query(db, filters, expand),
+            keys,
+            limit=limit,
+            cursor=cursor,
+            descending=descending
+        )
+
+    @staticmethod
+    def iter_export(db: Session, filters: RentalFilter) -> Iterator[Sequence[Row]]:
+        """Stream filtered, sorted rental rows in batches of EXPORT_BATCH_SIZE.
+
+        Selects plain columns through Core with yield_per, so rows are
+        fetched from the cursor batch by batch instead of being loaded and
+        tracked as ORM objects all at once.
+        """
+        keys, descending = RentalService._sort_keys(filters)
+        stmt = (
+            record_select(RentalRecord, Rental)
+            .where(*RentalService._filter_criteria(filters))
+            .order_by(*[k.desc() if descending else k.asc() for k in keys])
+            .execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        yield from db.execute(stmt).partitions()
+
+    @staticmethod
+    def get_by_id(db: Session, rental_id: int, expand: Sequence[str] = ()) -> Rental:
         """Get rental by ID."""
-        rental = db.query(Rental).filter(Rental.id == rental_id).first()
+        rental = RentalService._expanded_query(db, expand).filter(Rental.id == rental_id).first()
         if not rental:
             raise HTTPException(status_code=404, detail=f"Rental with id {rental_id} not found")
         return rental
 
     @staticmethod
     def _calculate_total_cost(start_date: date, end_date: date, daily_rate: float) -> float:
-        """Calculate total cost based on date range and daily rate."""
+        """Calculate the base cost, days * daily rate, before any pricing rules."""
         # Inclusive of start, exclusive of end
         days = (end_date - start_date).days
         if days < 1:
             days = 1  # Minimum 1 day
         return days * daily_rate
 
+    @staticmethod
+    def _check_dates(start_date: date, end_date: date) -> None:
+        """Validate a rental's dates: end not before start, at most MAX_RENTAL_DAYS days."""
+        if end_date < start_date:
+            raise HTTPException(status_code=400, detail="endDate must be >= startDate")
+        if (end_date - start_date).days > MAX_RENTAL_DAYS:
+            raise HTTPException(status_code=400, detail=f"Rentals cannot exceed {MAX_RENTAL_DAYS} days")
+
+    @staticmethod
+    def _conflict(db: Session, car_id: int, start_date: date, end_date: date) -> HTTPException:
+        """Roll back a booking that lost its window and build the 409 for it."""
+        db.rollback()
+        return HTTPException(
+            status_code=409,
+            detail=f"Car with id {car_id} already has an active rental overlapping {start_date} to {end_date}"
+        )
+
+    @staticmethod
+    def _insert(db: Session, values: dict) -> int:
+        """Insert a rental and return its id; an ACTIVE one only if its window is free.
+
+        For an ACTIVE rental the overlap check and the write are a single
+        INSERT ... SELECT ... WHERE NOT EXISTS, probing the same index as the
+        availability search, so when two requests race for a car and window
+        exactly one of them inserts. The loser gets a 409 instead of
+        double-booking the car. Bookings of other cars, or of the same car in
+        other windows, never conflict.
+        """
+        source = select(*[literal(value, Rental.__table__.c[name].type) for name, value in values.items()])
+        if values["status"] == RentalStatus.ACTIVE:
+            source = source.where(
+                ~CarService._overlapping_rental(values["carId"], values["startDate"], values["endDate"])
+            )
+        rental_id = db.execute(
+            insert(Rental).from_select(list(values), source).returning(Rental.id)
+        ).scalar()
+        if rental_id is None:
+            raise RentalService._conflict(db, values["carId"], values["startDate"], values["endDate"])
+        return rental_id
+
+    @staticmethod
+    def _rebook(db: Session, rental: Rental) -> None:
+        """Check that an ACTIVE rental's new window is free, like _insert.
+
+        A conditional UPDATE of the rental's booking columns that matches no
+        row when another ACTIVE rental of the car overlaps the window.
+        """
+        result = db.execute(
+            update(Rental)
+            .where(
+                Rental.id == rental.id,
+                ~CarService._overlapping_rental(rental.carId, rental.startDate, rental.endDate, exclude_id=rental.id)
+            )
+            .values(carId=rental.carId, startDate=rental.startDate, endDate=rental.endDate, status=rental.status)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount != 1:
+            raise RentalService._conflict(db, rental.carId, rental.startDate, rental.endDate)
+
+    @staticmethod
+    def _mark_rented(db: Session, car_id: int) -> None:
+        """Show a car with an ACTIVE rental as RENTED, without loading it."""
+        db.execute(
+            update(Car)
+            .where(Car.id == car_id, Car.status == CarStatus.AVAILABLE)
+            .values(status=CarStatus.RENTED)
+        )
+
+    @staticmethod
+    def _release_car(db: Session, car_id: int, rental_id: int) -> None:
+        """Set a car back to AVAILABLE once no ACTIVE rental but `rental_id` is left."""
+        others = select(Rental.id).where(
+            Rental.carId == car_id,
+            Rental.status == RentalStatus.ACTIVE,
+            Rental.id != rental_id
+        ).exists()
+        db.execute(
+            update(Car)
+            .where(Car.id == car_id, Car.status == CarStatus.RENTED, ~others)
+            .values(status=CarStatus.AVAILABLE)
+        )
+
     @staticmethod
     def create(db: Session, rental_data: RentalCreate) -> Rental:
         """Create a new rental."""
-        # Verify car exists
-        car = db.query(Car).filter(Car.id == rental_data.carId).first()
-        if not car:
-            raise HTTPException(status_code=404, detail=f"Car with id {rental_data.carId} not found")
+        RentalService._check_dates(rental_data.startDate, rental_data.endDate)
+        
+        # Verify car exists; served from the car cache when warm
+        car = CarService.get_snapshot(db, rental_data.carId)
         
         # Verify customer exists
         customer = db.query(Customer).filter(Customer.id == rental_data.customerId).first()
         if not customer:
             raise HTTPException(status_code=404, detail=f"Customer with id {rental_data.customerId} not found")
         
-        # Check if car is available
-        if car.status != CarStatus.AVAILABLE:
+        # Cars in maintenance cannot be rented; otherwise only the window matters
+        if car.status == CarStatus.MAINTENANCE:
             raise HTTPException(
                 status_code=400,
                 detail=f"Car is not available for rental. Current status: {car.status.value}"
             )
         
-        # Calculate total cost
-        total_cost = RentalService._calculate_total_cost(
+        # Calculate total cost under the pricing rules
+        total_cost = PricingService.calculate_total_cost(
+            db,
             rental_data.startDate,
             rental_data.endDate,
             car.dailyRate
         )
         
-        # Create rental
-        rental = Rental(
-            carId=rental_data.carId,
-            customerId=rental_data.customerId,
-            startDate=rental_data.startDate,
-            endDate=rental_data.endDate,
-            status=rental_data.status,
-            totalCost=total_cost
-        )
-        
-        # Update car status to RENTED if rental is ACTIVE
-        if rental.status == RentalStatus.ACTIVE:
-            car.status = CarStatus.RENTED
+        # Create rental; an ACTIVE one only if no other ACTIVE rental overlaps it
+        values = {
+            "carId": rental_data.carId,
+            "customerId": rental_data.customerId,
+            "startDate": rental_data.startDate,
+            "endDate": rental_data.endDate,
+            "status": rental_data.status,
+            "totalCost": total_cost
+        }
+        rental_id = RentalService._insert(db, values)
+        if rental_data.status == RentalStatus.ACTIVE:
+            RentalService._mark_rented(db, car.id)
         
-        db.add(rental)
+        AnalyticsService.record_change(db, new=RentalRecord(id=rental_id, **values))
         db.commit()
-        db.refresh(rental)
-        return rental
+        table_versions.bump("rentals", "cars")
+        CarService.invalidate(car.id)
+        return db.get(Rental, rental_id)
 
     @staticmethod
     def update(db: Session, rental_id: int, rental_data: RentalUpdate) -> Rental:
@@ -85,12 +277,15 @@ class RentalService:
         rental = RentalService.get_by_id(db, rental_id)
         
         update_data = rental_data.model_dump(exclude_unset=True)
+        if "startDate" in update_data or "endDate" in update_data:
+            RentalService._check_dates(
+                update_data.get("startDate", rental.startDate),
+                update_data.get("endDate", rental.endDate)
+            )
         
         # If carId is being updated, verify the new car exists
         if "carId" in update_data:
-            car = db.query(Car).filter(Car.id == update_data["carId"]).first()
-            if not car:
-                raise HTTPException(status_code=404, detail=f"Car with id {update_data['carId']} not found")
+            CarService.get_snapshot(db, update_data["carId"])
         
         # If customerId is being updated, verify the new customer exists
         if "customerId" in update_data:
@@ -98,9 +293,10 @@ class RentalService:
             if not customer:
                 raise HTTPException(status_code=404, detail=f"Customer with id {update_data['customerId']} not found")
         
-        # Track old status and car
+        # Track old status and car, and the old state for the analytics rollups
         old_status = rental.status
         old_car_id = rental.carId
+        old_rental = RentalRecord(*(getattr(rental, field) for field in RentalRecord._fields))
         
         # Apply updates
         for field, value in update_data.items():
@@ -108,25 +304,34 @@ class RentalService:
         
         # Recalculate total cost if dates changed
         if "startDate" in update_data or "endDate" in update_data or "carId" in update_data:
-            car = db.query(Car).filter(Car.id == rental.carId).first()
-            rental.totalCost = RentalService._calculate_total_cost(
+            car = CarService.get_snapshot(db, rental.carId)
+            rental.totalCost = PricingService.calculate_total_cost(
+                db,
                 rental.startDate,
                 rental.endDate,
                 car.dailyRate
             )
         
-        # Update car status based on rental status changes
-        if "status" in update_data and update_data["status"] != old_status:
-            car = db.query(Car).filter(Car.id == rental.carId).first()
-            
-            if update_data["status"] in [RentalStatus.COMPLETED, RentalStatus.CANCELLED]:
-                # Set car back to available
-                car.status = CarStatus.AVAILABLE
-            elif update_data["status"] == RentalStatus.ACTIVE:
-                # Set car to rented
-                car.status = CarStatus.RENTED
+        # An ACTIVE rental moving to a new window or car, or reactivated, is
+        # booked like a new one: only if no other ACTIVE rental overlaps it
+        if rental.status == RentalStatus.ACTIVE and BOOKING_FIELDS.intersection(update_data):
+            RentalService._rebook(db, rental)
+        
+        # Update car status when an ACTIVE rental ends or moves to another
+        # car, and when a rental becomes ACTIVE on its (new) car; both cars
+        # change in this transaction
+        moved = rental.carId != old_car_id
+        if old_status == RentalStatus.ACTIVE and (rental.status != RentalStatus.ACTIVE or moved):
+            # Set car back to available
+            RentalService._release_car(db, old_car_id, rental.id)
+        if rental.status == RentalStatus.ACTIVE and (old_status != RentalStatus.ACTIVE or moved):
+            RentalService._mark_rented(db, rental.carId)
         
+        AnalyticsService.record_change(db, old=old_rental, new=rental)
+        car_id = rental.carId
         db.commit()
+        table_versions.bump("rentals", "cars")
+        CarService.invalidate(car_id, old_car_id)
         db.refresh(rental)
         return rental
 
@@ -136,10 +341,12 @@ class RentalService:
         rental = RentalService.get_by_id(db, rental_id)
         
         # If rental was active, set car back to available
+        car_id = rental.carId
         if rental.status == RentalStatus.ACTIVE:
-            car = db.query(Car).filter(Car.id == rental.carId).first()
-            if car:
-                car.status = CarStatus.AVAILABLE
+            RentalService._release_car(db, car_id, rental.id)
         
+        AnalyticsService.record_change(db, old=rental)
         db.delete(rental)
         db.commit()
+        table_versions.bump("rentals", "cars")
+        CarService.invalidate(car_id)
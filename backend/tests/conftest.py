@@ -1,41 +1,20 @@
 """Test configuration and fixtures."""
 import pytest
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
-from contextlib import asynccontextmanager
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
-from backend.db import Base, get_db
-from backend.routers import cars, customers, rentals
-
-
-# Create in-memory SQLite database for testing
-# Using file: scheme with memory mode and shared cache for multi-threaded access
-SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///file:testdb?mode=memory&cache=shared&uri=true"
-
-engine = create_engine(
-    SQLALCHEMY_TEST_DATABASE_URL,
-    connect_args={"check_same_thread": False, "uri": True}
+from backend import models  # noqa: F401  registers the tables on Base.metadata
+from backend.cache import car_cache, car_facet_cache
+from backend.config import ENGINE_PROFILES
+from backend.db import Base, apply_profile, get_db, get_read_db, get_async_db, get_async_read_db
+from backend.instrumentation import instrument_engine
+from backend.routers import api_routers
+from backend.services.pricing_service import calendar_cache
+from backend.tests.helpers import (
+    SQLALCHEMY_ASYNC_TEST_DATABASE_URL,
+    create_test_app,
+    engine,
+    override_get_db,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-
-def override_get_db():
-    """Override database dependency for tests."""
-    try:
-        db = TestingSessionLocal()
-        yield db
-    finally:
-        db.close()
-
-
-@asynccontextmanager
-async def test_lifespan(app):
-    """Test lifespan that doesn't seed data."""
-    # No startup/shutdown actions for tests
-    yield
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -44,40 +23,60 @@ def setup_database():
     # Create all tables
     Base.metadata.create_all(bind=engine)
     yield
-    # Drop all tables
+    # Drop all tables, and the cached rows and rules that were in them
     Base.metadata.drop_all(bind=engine)
+    car_cache.clear()
+    car_facet_cache.clear()
+    calendar_cache.clear()
 
 
 @pytest.fixture(scope="function")
 def client(setup_database):
     """Create a test client with overridden database."""
-    # Create a new app for testing without the production lifespan
-    test_app = FastAPI(
-        title="O-Rento Car Rental API",
-        description="API for managing car rentals, cars, and customers",
-        version="1.0.0",
-        lifespan=test_lifespan
-    )
-    
-    # Add CORS middleware
-    test_app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["http://localhost:5173"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    test_app = create_test_app()
     
     # Include routers
-    test_app.include_router(cars.router)
-    test_app.include_router(customers.router)
-    test_app.include_router(rentals.router)
+    for router in api_routers("sync"):
+        test_app.include_router(router)
     
-    # Override the get_db dependency
+    # Override the database dependencies; reads and writes share the test database
     test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_read_db] = override_get_db
     
     with TestClient(test_app) as test_client:
         yield test_client
     
     # Clean up
     test_app.dependency_overrides.clear()
+
+
+@pytest.fixture(scope="function")
+def async_client(setup_database):
+    """Create a test client running the async-mode routers."""
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.pool import NullPool
+    
+    # NullPool: each TestClient runs its own event loop, so async
+    # connections must not be pooled across tests
+    async_engine = create_async_engine(SQLALCHEMY_ASYNC_TEST_DATABASE_URL, poolclass=NullPool)
+    apply_profile(async_engine.sync_engine, ENGINE_PROFILES["test"])
+    instrument_engine(async_engine.sync_engine)
+    TestingAsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    
+    async def override_get_async_db():
+        """Override async database dependency for tests."""
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+    
+    test_app = create_test_app()
+    for router in api_routers("async"):
+        test_app.include_router(router)
+    test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_read_db] = override_get_db
+    test_app.dependency_overrides[get_async_db] = override_get_async_db
+    test_app.dependency_overrides[get_async_read_db] = override_get_async_db
+    
+    with TestClient(test_app) as test_client:
+        yield test_client
+    
+    test_app.dependency_overrides.clear()
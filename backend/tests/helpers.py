@@ -0,0 +1,99 @@
+"""Shared test database, app factory and helpers."""
+from contextlib import asynccontextmanager
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.config import ENGINE_PROFILES
+from backend.db import apply_profile
+from backend.instrumentation import QUERY_COUNT_HEADER, QueryStatsMiddleware, instrument_engine
+from backend.pagination import NEXT_CURSOR_HEADER
+
+
+# Create in-memory SQLite database for testing
+# Using file: scheme with memory mode and shared cache for multi-threaded access
+SQLALCHEMY_TEST_DATABASE_URL = "sqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+
+engine = create_engine(
+    SQLALCHEMY_TEST_DATABASE_URL,
+    connect_args={"check_same_thread": False, "uri": True}
+)
+apply_profile(engine, ENGINE_PROFILES["test"])
+instrument_engine(engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+# Async mode uses the same shared in-memory database through aiosqlite
+SQLALCHEMY_ASYNC_TEST_DATABASE_URL = "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+
+
+def override_get_db():
+    """Override database dependency for tests."""
+    try:
+        db = TestingSessionLocal()
+        yield db
+    finally:
+        db.close()
+
+
+@asynccontextmanager
+async def test_lifespan(app):
+    """Test lifespan that doesn't seed data."""
+    # No startup/shutdown actions for tests
+    yield
+
+
+def create_test_app() -> FastAPI:
+    """Create an app for testing without the production lifespan."""
+    test_app = FastAPI(
+        title="O-Rento Car Rental API",
+        description="API for managing car rentals, cars, and customers",
+        version="1.0.0",
+        lifespan=test_lifespan
+    )
+    
+    # Add CORS middleware
+    test_app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["http://localhost:5173"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
+    )
+    # Query stats headers, as in debug mode, for assert_max_queries
+    test_app.add_middleware(QueryStatsMiddleware, headers=True)
+    return test_app
+
+
+def assert_max_queries(response, limit: int) -> None:
+    """Assert that serving a response executed at most `limit` SQL queries."""
+    count = int(response.headers[QUERY_COUNT_HEADER])
+    assert count <= limit, f"{count} queries executed, expected at most {limit}"
+
+
+def create_car(client: TestClient, make: str = "Toyota", daily_rate: float = 50.0, status: str = "AVAILABLE") -> int:
+    """Helper function to create a car."""
+    response = client.post("/api/cars", json={
+        "make": make,
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "status": status,
+        "dailyRate": daily_rate
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def create_customer(client: TestClient) -> int:
+    """Helper function to create a customer."""
+    response = client.post("/api/customers", json={
+        "name": "John Doe",
+        "email": "john@example.com",
+        "phone": "+1-555-1234",
+        "licenseNumber": "JD-123456"
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
@@ -0,0 +1,131 @@
+"""Tests for analytics endpoints and the daily rollups."""
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from backend.models import RentalDailyRollup
+from backend.services.analytics_service import AnalyticsService
+from backend.tests.helpers import create_car, create_customer
+
+
+def create_rental(client: TestClient, car_id: int, customer_id: int, start: str, end: str, status: str = "COMPLETED") -> int:
+    """Helper function to create a rental."""
+    response = client.post("/api/rentals", json={
+        "carId": car_id,
+        "customerId": customer_id,
+        "startDate": start,
+        "endDate": end,
+        "status": status
+    })
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+def rollup_rows() -> list:
+    """Read all rollup rows."""
+    from backend.tests.helpers import TestingSessionLocal
+
+    db = TestingSessionLocal()
+    try:
+        stmt = select(
+            RentalDailyRollup.day, RentalDailyRollup.carId, RentalDailyRollup.revenue, RentalDailyRollup.rentals
+        ).order_by(RentalDailyRollup.day, RentalDailyRollup.carId)
+        return [(day, car_id, round(revenue, 6), rentals) for day, car_id, revenue, rentals in db.execute(stmt)]
+    finally:
+        db.close()
+
+
+def test_analytics_follow_rental_changes(client: TestClient):
+    """Test that analytics reflect created, updated, cancelled and deleted rentals."""
+    toyota = create_car(client, "Toyota", 50.0)
+    bmw = create_car(client, "BMW", 100.0)
+    customer_id = create_customer(client)
+    params = {"start": "2024-01-01", "end": "2024-01-06"}
+
+    create_rental(client, toyota, customer_id, "2024-01-01", "2024-01-04")
+    bmw_rental = create_rental(client, bmw, customer_id, "2024-01-03", "2024-01-05")
+
+    daily = client.get("/api/analytics/daily", params=params).json()
+    assert [day["revenue"] for day in daily] == [50.0, 50.0, 150.0, 100.0, 0.0]
+    assert [day["rentedCars"] for day in daily] == [1, 1, 2, 1, 0]
+    assert daily[2]["utilization"] == 1.0
+
+    cars = client.get("/api/analytics/cars", params=params).json()
+    assert [(car["carId"], car["revenue"], car["rentedDays"]) for car in cars] == [(bmw, 200.0, 2), (toyota, 150.0, 3)]
+    assert cars[1]["utilization"] == 0.6
+
+    # Moving the BMW rental off the range removes its revenue
+    response = client.put(f"/api/rentals/{bmw_rental}", json={"startDate": "2024-02-01", "endDate": "2024-02-02"})
+    assert response.status_code == 200
+    makes = client.get("/api/analytics/makes", params=params).json()
+    assert [(make["make"], make["revenue"], make["rentedDays"]) for make in makes] == [("Toyota", 150.0, 3), ("BMW", 0.0, 0)]
+
+    # Cancelled rentals earn nothing
+    client.put(f"/api/rentals/{bmw_rental}", json={"status": "CANCELLED"})
+    totals = client.get("/api/analytics/utilization", params={"start": "2024-01-01", "end": "2024-03-01"}).json()
+    assert totals["fleetSize"] == 2
+    assert totals["revenue"] == 150.0
+    assert totals["rentedCarDays"] == 3
+
+    client.put(f"/api/rentals/{bmw_rental}", json={"status": "COMPLETED"})
+    assert client.get("/api/analytics/utilization", params={"start": "2024-01-01", "end": "2024-03-01"}).json()["revenue"] == 250.0
+
+    client.delete(f"/api/rentals/{bmw_rental}")
+    assert client.get("/api/analytics/utilization", params={"start": "2024-01-01", "end": "2024-03-01"}).json()["revenue"] == 150.0
+    assert len(rollup_rows()) == 3
+
+
+def test_rebuild_matches_incremental_rollups(client: TestClient):
+    """Test that rebuilding from the rentals gives the incrementally maintained rows."""
+    from backend.tests.helpers import TestingSessionLocal
+
+    car_id = create_car(client, "Honda", 42.0)
+    other_car = create_car(client, "Ford", 29.5)
+    customer_id = create_customer(client)
+    create_rental(client, car_id, customer_id, "2024-03-01", "2024-03-05")
+    # Same-day rentals count as one day, like the cost calculation
+    create_rental(client, other_car, customer_id, "2024-03-02", "2024-03-02")
+    moved = create_rental(client, other_car, customer_id, "2024-03-10", "2024-03-12")
+    client.put(f"/api/rentals/{moved}", json={"carId": car_id, "endDate": "2024-03-15"})
+    cancelled = create_rental(client, car_id, customer_id, "2024-04-01", "2024-04-03")
+    client.put(f"/api/rentals/{cancelled}", json={"status": "CANCELLED"})
+
+    incremental = rollup_rows()
+    assert len(incremental) == 10
+
+    db = TestingSessionLocal()
+    try:
+        assert AnalyticsService.rebuild(db) == len(incremental)
+    finally:
+        db.close()
+    assert rollup_rows() == incremental
+
+
+def test_rollups_without_on_conflict(client: TestClient, monkeypatch):
+    """Test that databases without ON CONFLICT maintain the same rollups."""
+    from backend.services import analytics_service
+
+    car_id = create_car(client, "Honda", 42.0)
+    customer_id = create_customer(client)
+    first = create_rental(client, car_id, customer_id, "2024-03-01", "2024-03-05")
+    moved = create_rental(client, car_id, customer_id, "2024-03-03", "2024-03-06")
+    client.put(f"/api/rentals/{moved}", json={"endDate": "2024-03-08"})
+    expected = rollup_rows()
+    client.delete(f"/api/rentals/{moved}")
+    client.put(f"/api/rentals/{first}", json={"status": "CANCELLED"})
+    assert rollup_rows() == []
+
+    monkeypatch.setattr(analytics_service, "UPSERT_INSERTS", {})
+    client.put(f"/api/rentals/{first}", json={"status": "COMPLETED"})
+    moved = create_rental(client, car_id, customer_id, "2024-03-03", "2024-03-06")
+    client.put(f"/api/rentals/{moved}", json={"endDate": "2024-03-08"})
+    assert rollup_rows() == expected
+
+
+def test_analytics_validates_range(client: TestClient):
+    """Test that empty and oversized ranges are rejected."""
+    response = client.get("/api/analytics/daily", params={"start": "2024-01-05", "end": "2024-01-05"})
+    assert response.status_code == 400
+    response = client.get("/api/analytics/daily", params={"start": "2000-01-01", "end": "2024-01-01"})
+    assert response.status_code == 400
+    response = client.get("/api/analytics/cars", params={"start": "2024-01-01"})
+    assert response.status_code == 422
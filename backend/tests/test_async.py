@@ -0,0 +1,122 @@
+"""Tests for the async-mode endpoints."""
+import pytest
+from fastapi.testclient import TestClient
+from datetime import date, timedelta
+
+
+def test_async_routes_replace_sync_routes():
+    """Test that async mode swaps in async endpoints and keeps the sync-only ones."""
+    from backend.routers import api_routers
+    
+    routes = {
+        (route.path, method): route.endpoint
+        for router in api_routers("async")
+        for route in router.routes
+        for method in route.methods
+    }
+    assert routes[("/api/cars", "GET")].__module__ == "backend.routers.async_cars"
+    assert routes[("/api/rentals/{rental_id}", "PUT")].__module__ == "backend.routers.async_rentals"
+    assert routes[("/api/rentals/export", "GET")].__module__ == "backend.routers.rentals"
+    
+    paths = [route.path for route in api_routers("async")[2].routes]
+    assert paths.index("/api/rentals/export") < paths.index("/api/rentals/{rental_id}")
+
+
+def test_async_car_crud(async_client: TestClient):
+    """Test car CRUD through the async endpoints."""
+    car_data = {
+        "make": "Toyota",
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "status": "AVAILABLE",
+        "dailyRate": 45.00
+    }
+    
+    response = async_client.post("/api/cars", json=car_data)
+    assert response.status_code == 201
+    car_id = response.json()["id"]
+    
+    response = async_client.put(f"/api/cars/{car_id}", json={"dailyRate": 55.00})
+    assert response.status_code == 200
+    assert response.json()["dailyRate"] == 55.00
+    
+    response = async_client.get(f"/api/cars/{car_id}")
+    assert response.json()["model"] == "Camry"
+    
+    assert len(async_client.get("/api/cars").json()) == 1
+    
+    assert async_client.delete(f"/api/cars/{car_id}").status_code == 204
+    assert async_client.get(f"/api/cars/{car_id}").status_code == 404
+
+
+def test_async_customer_search(async_client: TestClient):
+    """Test customer search through the async endpoint."""
+    response = async_client.post("/api/customers", json={
+        "name": "Nora Quinn", "email": "nora@example.com", "phone": None, "licenseNumber": "NQ-1"
+    })
+    assert response.status_code == 201
+    
+    response = async_client.get("/api/customers/search", params={"q": "nor qui"})
+    assert response.status_code == 200
+    assert [customer["name"] for customer in response.json()] == ["Nora Quinn"]
+
+
+def test_async_car_search(async_client: TestClient):
+    """Test faceted car search through the async endpoint."""
+    for make, rate in (("Toyota", 45.00), ("Toyota", 120.00), ("Honda", 40.00)):
+        async_client.post("/api/cars", json={
+            "make": make,
+            "model": "Sedan",
+            "year": 2021,
+            "imageUrl": "https://example.com/car.jpg",
+            "dailyRate": rate
+        })
+    
+    data = async_client.get("/api/cars/search", params={"priceBand": "0-50"}).json()
+    assert data["total"] == 2
+    assert {f["value"]: f["count"] for f in data["facets"]["make"]} == {"Honda": 1, "Toyota": 1}
+    assert {f["value"]: f["count"] for f in data["facets"]["priceBand"]} == {"0-50": 2, "100-200": 1}
+
+
+def test_async_rental_flow(async_client: TestClient):
+    """Test booking, listing and completing a rental through the async endpoints."""
+    car_id = async_client.post("/api/cars", json={
+        "make": "Toyota",
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "dailyRate": 50.00
+    }).json()["id"]
+    customer_id = async_client.post("/api/customers", json={
+        "name": "John Doe",
+        "email": "john@example.com",
+        "licenseNumber": "JD-123456"
+    }).json()["id"]
+    
+    start_date = date.today()
+    rental_data = {
+        "carId": car_id,
+        "customerId": customer_id,
+        "startDate": start_date.isoformat(),
+        "endDate": (start_date + timedelta(days=3)).isoformat(),
+        "status": "ACTIVE"
+    }
+    response = async_client.post("/api/rentals", json=rental_data)
+    assert response.status_code == 201
+    assert response.json()["totalCost"] == 150.00
+    rental_id = response.json()["id"]
+    
+    assert async_client.post("/api/rentals", json=rental_data).status_code == 409
+    
+    rentals = async_client.get("/api/rentals", params={"status": "ACTIVE", "expand": "car,customer"}).json()
+    assert rentals[0]["car"]["id"] == car_id
+    assert rentals[0]["customer"]["name"] == "John Doe"
+    
+    response = async_client.put(f"/api/rentals/{rental_id}", json={"status": "COMPLETED"})
+    assert response.json()["status"] == "COMPLETED"
+    assert async_client.get(f"/api/cars/{car_id}").json()["status"] == "AVAILABLE"
+    
+    export = async_client.get("/api/rentals/export")
+    assert export.status_code == 200
+    assert len(export.text.strip().split("\n")) == 2
@@ -0,0 +1,68 @@
+"""Tests for the in-process caches."""
+from backend.cache import TTLCache, etag_matches
+
+
+def test_ttl_cache_expiry_and_eviction(monkeypatch):
+    """Test that entries expire after the TTL and the least recently used is evicted."""
+    import backend.cache
+    
+    now = [1000.0]
+    monkeypatch.setattr(backend.cache.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=2, ttl=10)
+    
+    cache.set("a", 1, cache.token())
+    cache.set("b", 2, cache.token())
+    assert cache.get("a") == 1
+    cache.set("c", 3, cache.token())
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    
+    now[0] += 11
+    assert cache.get("a") is None
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 2
+
+
+def test_ttl_cache_skips_values_loaded_across_invalidation():
+    """Test that a load racing with a write does not store stale data."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    
+    def load_during_write():
+        cache.invalidate(1)
+        return "stale"
+    
+    assert cache.get_or_load(1, load_during_write) == "stale"
+    assert cache.get(1) is None
+    
+    disabled = TTLCache(maxsize=10, ttl=60, enabled=False)
+    assert disabled.get_or_load(1, lambda: "fresh") == "fresh"
+    assert disabled.get(1) is None
+
+
+def test_ttl_cache_async_load():
+    """Test that async loads are cached and skip storing across invalidation, like sync ones."""
+    import asyncio
+    
+    cache = TTLCache(maxsize=10, ttl=60)
+    
+    async def load_during_write():
+        cache.invalidate(1)
+        return "stale"
+    
+    async def load_fresh():
+        return "fresh"
+    
+    assert asyncio.run(cache.aget_or_load(1, load_during_write)) == "stale"
+    assert cache.get(1) is None
+    assert asyncio.run(cache.aget_or_load(1, load_fresh, store=False)) == "fresh"
+    assert cache.get(1) is None
+    assert asyncio.run(cache.aget_or_load(1, load_fresh)) == "fresh"
+    assert asyncio.run(cache.aget_or_load(1, load_during_write)) == "fresh"
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing."""
+    assert etag_matches('"a-1"', '"a-1"')
+    assert etag_matches('W/"a-1", "a-2"', '"a-1"')
+    assert etag_matches("*", '"a-1"')
+    assert not etag_matches('"a-2"', '"a-1"')
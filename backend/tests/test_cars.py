@@ -1,6 +1,8 @@
 """Tests for car endpoints."""
+import base64
 import pytest
 from fastapi.testclient import TestClient
+from datetime import date, timedelta
 
 
 def test_create_car_success(client: TestClient):
@@ -182,3 +184,378 @@ def test_delete_car_not_found(client: TestClient):
     """Test deleting a non-existent car."""
     response = client.delete("/api/cars/9999")
     assert response.status_code == 404
+
+
+def test_get_cars_paginated(client: TestClient):
+    """Test walking the car list page by page with cursors."""
+    for i in range(5):
+        car_data = {
+            "make": "Toyota",
+            "model": f"Camry {i}",
+            "year": 2021,
+            "imageUrl": "https://example.com/camry.jpg",
+            "status": "AVAILABLE",
+            "dailyRate": 45.00
+        }
+        client.post("/api/cars", json=car_data)
+    
+    seen = []
+    cursor = None
+    pages = 0
+    while True:
+        params = {"limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/cars", params=params)
+        assert response.status_code == 200
+        seen.extend(car["id"] for car in response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+    
+    assert pages == 3
+    assert len(seen) == 5
+    assert seen == sorted(seen)
+
+
+def test_get_cars_invalid_cursor(client: TestClient):
+    """Test that a malformed cursor is rejected."""
+    response = client.get("/api/cars", params={"limit": 2, "cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_get_cars_out_of_range_cursor(client: TestClient):
+    """Test that cursors with non-finite or out-of-range numbers are rejected."""
+    for raw in ["[Infinity]", "[-Infinity]", "[NaN]", "[1e400]", "[9223372036854775808]", '["1e400"]']:
+        cursor = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        response = client.get("/api/cars", params={"limit": 2, "cursor": cursor})
+        assert response.status_code == 400, raw
+    
+    # Float keys, such as the daily rate, reject them too
+    from fastapi import HTTPException
+    from backend.models import Car
+    from backend.pagination import decode_cursor
+    for raw in ['[Infinity,1]', '["NaN",1]', '[1e400,1]']:
+        cursor = base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, [Car.dailyRate, Car.id])
+        assert exc_info.value.status_code == 400
+    assert decode_cursor(base64.urlsafe_b64encode(b"[49.5,3]").decode(), [Car.dailyRate, Car.id]) == [49.5, 3]
+
+
+def test_get_available_cars(client: TestClient):
+    """Test searching cars free of overlapping active rentals in a window."""
+    car_ids = {}
+    for model, status in [("Booked", "AVAILABLE"), ("Returned", "AVAILABLE"), ("Free", "AVAILABLE"), ("Repair", "MAINTENANCE")]:
+        car_data = {
+            "make": "Toyota",
+            "model": model,
+            "year": 2021,
+            "imageUrl": "https://example.com/camry.jpg",
+            "status": status,
+            "dailyRate": 45.00
+        }
+        car_ids[model] = client.post("/api/cars", json=car_data).json()["id"]
+    
+    customer_data = {
+        "name": "John Doe",
+        "email": "john@example.com",
+        "phone": "+1-555-1234",
+        "licenseNumber": "JD-123456"
+    }
+    customer_id = client.post("/api/customers", json=customer_data).json()["id"]
+    for model, status in [("Booked", "ACTIVE"), ("Returned", "COMPLETED")]:
+        client.post("/api/rentals", json={
+            "carId": car_ids[model],
+            "customerId": customer_id,
+            "startDate": "2030-01-10",
+            "endDate": "2030-01-15",
+            "status": status
+        })
+    
+    def available(start: str, end: str):
+        response = client.get("/api/cars/available", params={"start": start, "end": end})
+        assert response.status_code == 200
+        return sorted(car["model"] for car in response.json())
+    
+    assert available("2030-01-12", "2030-01-13") == ["Free", "Returned"]
+    assert available("2030-01-01", "2030-01-11") == ["Free", "Returned"]
+    assert available("2030-01-01", "2030-01-10") == ["Booked", "Free", "Returned"]
+    assert available("2030-01-15", "2030-01-20") == ["Booked", "Free", "Returned"]
+    assert available("2030-01-14", "2030-01-14") == ["Free", "Returned"]
+    
+    response = client.get("/api/cars/available", params={"start": "2030-01-20", "end": "2030-01-10"})
+    assert response.status_code == 400
+
+
+def test_book_car_rented_next_month(client: TestClient):
+    """Test that a car booked next month can be found and booked for today."""
+    car_id = client.post("/api/cars", json={
+        "make": "Toyota",
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "dailyRate": 45.00
+    }).json()["id"]
+    customer_id = client.post("/api/customers", json={
+        "name": "John Doe",
+        "email": "john@example.com",
+        "phone": "+1-555-1234",
+        "licenseNumber": "JD-123456"
+    }).json()["id"]
+    
+    def book(start: date, end: date):
+        return client.post("/api/rentals", json={
+            "carId": car_id,
+            "customerId": customer_id,
+            "startDate": start.isoformat(),
+            "endDate": end.isoformat(),
+            "status": "ACTIVE"
+        })
+    
+    def available(start: date, end: date):
+        response = client.get("/api/cars/available", params={"start": start.isoformat(), "end": end.isoformat()})
+        return [car["id"] for car in response.json()]
+    
+    today = date.today()
+    next_month = today + timedelta(days=30)
+    assert book(next_month, next_month + timedelta(days=5)).status_code == 201
+    assert client.get(f"/api/cars/{car_id}").json()["status"] == "RENTED"
+    
+    assert available(today, today + timedelta(days=3)) == [car_id]
+    assert book(today, today + timedelta(days=3)).status_code == 201
+    
+    # Both windows are taken now
+    assert available(today, today + timedelta(days=3)) == []
+    assert available(next_month, next_month + timedelta(days=1)) == []
+    assert book(today + timedelta(days=2), today + timedelta(days=4)).status_code == 409
+    assert book(next_month + timedelta(days=4), next_month + timedelta(days=8)).status_code == 409
+    assert book(today + timedelta(days=3), next_month).status_code == 201
+
+
+def test_import_cars_ndjson(client: TestClient):
+    """Test bulk importing cars from NDJSON with per-row errors."""
+    body = "\n".join([
+        '{"make": "Toyota", "model": "Camry", "year": 2021, "imageUrl": "https://example.com/camry.jpg", "dailyRate": 45.0}',
+        '{"make": "Honda", "model": "Accord", "year": 1800, "imageUrl": "https://example.com/accord.jpg", "dailyRate": 50.0}',
+        '',
+        'not json',
+        '{"make": "Ford", "model": "Focus", "year": 2019, "imageUrl": "https://example.com/focus.jpg", "status": "MAINTENANCE", "dailyRate": 29.5}',
+    ])
+    
+    response = client.post("/api/cars/import", content=body, headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["inserted"] == 2
+    assert data["failed"] == 2
+    assert [error["row"] for error in data["errors"]] == [2, 3]
+    assert "year" in data["errors"][0]["errors"][0]
+    
+    cars = client.get("/api/cars").json()
+    assert [car["model"] for car in cars] == ["Camry", "Focus"]
+    assert cars[1]["status"] == "MAINTENANCE"
+
+
+def test_import_cars_csv(client: TestClient):
+    """Test bulk importing cars from CSV."""
+    body = (
+        "make,model,year,imageUrl,status,dailyRate\r\n"
+        "Toyota,Camry,2021,https://example.com/camry.jpg,,45.00\r\n"
+        "\"BMW\",\"3 Series, Touring\",2023,https://example.com/bmw.jpg,RENTED,95\r\n"
+        "Tesla,Model 3,2022,not-a-url,AVAILABLE,89\r\n"
+    )
+    
+    response = client.post("/api/cars/import", content=body, headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["inserted"] == 2
+    assert data["failed"] == 1
+    assert data["errors"][0]["row"] == 3
+    
+    cars = client.get("/api/cars").json()
+    assert cars[0]["status"] == "AVAILABLE"
+    assert cars[1]["model"] == "3 Series, Touring"
+    assert cars[1]["dailyRate"] == 95.0
+
+
+def test_get_cars_not_modified(client: TestClient):
+    """Test that an unchanged car list is answered with 304 without a database session."""
+    from backend.db import get_read_db
+    
+    car_data = {
+        "make": "Toyota",
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "dailyRate": 45.00
+    }
+    client.post("/api/cars", json=car_data)
+    
+    response = client.get("/api/cars")
+    etag = response.headers["ETag"]
+    
+    def no_database():
+        raise AssertionError("database session opened for an unchanged resource")
+        yield
+    
+    overrides = client.app.dependency_overrides
+    read_db = overrides[get_read_db]
+    overrides[get_read_db] = no_database
+    response = client.get("/api/cars", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+    overrides[get_read_db] = read_db
+    
+    # Any car write changes the ETag
+    client.post("/api/cars", json=car_data)
+    response = client.get("/api/cars", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert len(response.json()) == 2
+
+
+def test_car_cache_invalidated_on_update(client: TestClient):
+    """Test that cached car responses are refreshed after a write."""
+    from backend.cache import car_cache
+    
+    response = client.post("/api/cars", json={
+        "make": "Toyota",
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "dailyRate": 45.00
+    })
+    car_id = response.json()["id"]
+    
+    hits = car_cache.hits
+    client.get("/api/cars")
+    client.get(f"/api/cars/{car_id}")
+    assert client.get("/api/cars").json()[0]["dailyRate"] == 45.00
+    assert client.get(f"/api/cars/{car_id}").json()["dailyRate"] == 45.00
+    assert car_cache.hits == hits + 2
+    
+    client.put(f"/api/cars/{car_id}", json={"dailyRate": 60.00})
+    assert client.get("/api/cars").json()[0]["dailyRate"] == 60.00
+    assert client.get(f"/api/cars/{car_id}").json()["dailyRate"] == 60.00
+
+
+def test_list_reads_untracked_records(client: TestClient):
+    """Test that list queries return immutable records, not tracked ORM objects."""
+    from backend.records import CarRecord
+    from backend.services.car_service import CarService
+    from backend.tests.helpers import TestingSessionLocal
+    
+    client.post("/api/cars", json={
+        "make": "Toyota",
+        "model": "Camry",
+        "year": 2021,
+        "imageUrl": "https://example.com/camry.jpg",
+        "dailyRate": 45.00
+    })
+    
+    db = TestingSessionLocal()
+    try:
+        cars, _ = CarService.get_page(db, limit=10)
+        assert isinstance(cars[0], CarRecord)
+        assert cars[0].make == "Toyota"
+        assert len(db.identity_map) == 0
+        with pytest.raises(AttributeError):
+            cars[0].make = "Honda"
+    finally:
+        db.close()
+
+
+def _create_fleet(client: TestClient) -> None:
+    """Create cars spread over makes, years, statuses and price bands."""
+    for make, model, year, status, rate in (
+        ("Toyota", "Camry", 2021, "AVAILABLE", 45.00),
+        ("Toyota", "Camry", 2022, "MAINTENANCE", 55.00),
+        ("Toyota", "Corolla", 2021, "AVAILABLE", 35.00),
+        ("Honda", "Civic", 2022, "AVAILABLE", 40.00),
+        ("BMW", "X5", 2023, "AVAILABLE", 150.00),
+        ("BMW", "M8", 2023, "RENTED", 250.00),
+    ):
+        response = client.post("/api/cars", json={
+            "make": make,
+            "model": model,
+            "year": year,
+            "imageUrl": "https://example.com/car.jpg",
+            "status": status,
+            "dailyRate": rate
+        })
+        assert response.status_code == 201
+
+
+def test_search_cars_facets(client: TestClient):
+    """Test that facet counts apply every filter but their own."""
+    _create_fleet(client)
+    
+    response = client.get("/api/cars/search")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 6
+    assert len(data["items"]) == 6
+    facets = {name: {f["value"]: f["count"] for f in counts} for name, counts in data["facets"].items()}
+    assert facets["make"] == {"BMW": 2, "Honda": 1, "Toyota": 3}
+    assert facets["year"] == {2021: 2, 2022: 2, 2023: 2}
+    assert facets["status"] == {"AVAILABLE": 4, "MAINTENANCE": 1, "RENTED": 1}
+    assert [f["value"] for f in data["facets"]["priceBand"]] == ["0-50", "50-100", "100-200", "200+"]
+    
+    response = client.get("/api/cars/search", params={"make": "Toyota", "year": 2021})
+    data = response.json()
+    assert data["total"] == 2
+    assert {car["model"] for car in data["items"]} == {"Camry", "Corolla"}
+    facets = {name: {f["value"]: f["count"] for f in counts} for name, counts in data["facets"].items()}
+    # Other makes are counted for 2021, other years for Toyota
+    assert facets["make"] == {"Toyota": 2}
+    assert facets["year"] == {2021: 2, 2022: 1}
+    assert facets["model"] == {"Camry": 1, "Corolla": 1}
+    assert facets["priceBand"] == {"0-50": 2}
+    
+    data = client.get("/api/cars/search", params={"priceBand": "100-200"}).json()
+    assert [car["model"] for car in data["items"]] == ["X5"]
+    assert {f["value"]: f["count"] for f in data["facets"]["priceBand"]} == {
+        "0-50": 3, "50-100": 1, "100-200": 1, "200+": 1
+    }
+    
+    assert client.get("/api/cars/search", params={"make": "Audi"}).json()["total"] == 0
+    assert client.get("/api/cars/search", params={"priceBand": "cheap"}).status_code == 422
+
+
+def test_search_cars_pagination(client: TestClient):
+    """Test that search results page by cursor while the facets cover every match."""
+    _create_fleet(client)
+    
+    response = client.get("/api/cars/search", params={"status": "AVAILABLE", "limit": 3})
+    first = response.json()
+    assert len(first["items"]) == 3
+    assert first["total"] == 4
+    cursor = response.headers["X-Next-Cursor"]
+    
+    response = client.get("/api/cars/search", params={"status": "AVAILABLE", "limit": 3, "cursor": cursor})
+    second = response.json()
+    assert [car["model"] for car in second["items"]] == ["X5"]
+    assert "X-Next-Cursor" not in response.headers
+    assert second["facets"] == first["facets"]
+
+
+def test_search_cars_facets_invalidated_on_write(client: TestClient):
+    """Test that cached facet counts are dropped when cars change."""
+    from backend.cache import car_facet_cache
+    
+    _create_fleet(client)
+    client.get("/api/cars/search", params={"make": "Honda"})
+    hits = car_facet_cache.hits
+    client.get("/api/cars/search", params={"make": "Honda"})
+    assert car_facet_cache.hits == hits + 1
+    
+    car_id = client.get("/api/cars/search", params={"make": "Honda"}).json()["items"][0]["id"]
+    client.put(f"/api/cars/{car_id}", json={"status": "MAINTENANCE"})
+    
+    data = client.get("/api/cars/search", params={"make": "Honda", "status": "AVAILABLE"}).json()
+    assert data["total"] == 0
+    assert {f["value"]: f["count"] for f in data["facets"]["status"]} == {"MAINTENANCE": 1}
@@ -191,3 +191,110 @@ def test_delete_customer(client: TestClient):
     # Verify customer is deleted
     get_response = client.get(f"/api/customers/{customer_id}")
     assert get_response.status_code == 404
+
+
+def test_get_customers_paginated(client: TestClient):
+    """Test getting customers one page at a time."""
+    for i in range(3):
+        customer_data = {
+            "name": f"John Doe {i}",
+            "email": f"john{i}@example.com",
+            "phone": "+1-555-1234",
+            "licenseNumber": f"JD-{i}"
+        }
+        client.post("/api/customers", json=customer_data)
+    
+    first = client.get("/api/customers", params={"limit": 2})
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    cursor = first.headers["X-Next-Cursor"]
+    
+    second = client.get("/api/customers", params={"limit": 2, "cursor": cursor})
+    assert second.status_code == 200
+    assert len(second.json()) == 1
+    assert second.json()[0]["name"] == "John Doe 2"
+    assert "X-Next-Cursor" not in second.headers
+
+
+def test_import_customers_with_conflicts(client: TestClient):
+    """Test bulk importing customers with duplicates in the batch and the database."""
+    client.post("/api/customers", json={
+        "name": "John Doe",
+        "email": "john@example.com",
+        "phone": "+1-555-1234",
+        "licenseNumber": "JD-123456"
+    })
+    
+    body = (
+        "name,email,phone,licenseNumber\n"
+        "Jane Smith,jane@example.com,+1-555-5678,JS-1\n"
+        "Johnny Doe,john@example.com,,JD-999\n"
+        "Jim Beam,jim@example.com,,JD-123456\n"
+        "Jane Twin,jane@example.com,,JS-2\n"
+        "Jake Twin,jake@example.com,,JS-1\n"
+        "Bad Email,not-an-email,,BE-1\n"
+        "Ann Lee,ann@example.com,,AL-1\n"
+    )
+    
+    response = client.post("/api/customers/import", content=body, headers={"Content-Type": "text/csv"})
+    assert response.status_code == 200
+    
+    data = response.json()
+    assert data["inserted"] == 2
+    assert data["failed"] == 5
+    errors = {error["row"]: error["errors"][0] for error in data["errors"]}
+    assert errors[2] == "Email already registered"
+    assert errors[3] == "License number already registered"
+    assert errors[4] == "Email duplicates row 1"
+    assert errors[5] == "License number duplicates row 1"
+    assert "email" in errors[6]
+    
+    names = sorted(customer["name"] for customer in client.get("/api/customers").json())
+    assert names == ["Ann Lee", "Jane Smith", "John Doe"]
+
+
+def test_search_customers_prefix_match(client: TestClient):
+    """Test typeahead search by word prefixes across name, email, phone and license."""
+    for customer in (
+        {"name": "Anna Smith", "email": "anna@example.com", "phone": "+1-555-1000", "licenseNumber": "AS-100"},
+        {"name": "Andrew Jones", "email": "drew@mailbox.org", "phone": "+1-555-2000", "licenseNumber": "AJ-200"},
+        {"name": "Sam Wu", "email": "smith@example.com", "phone": None, "licenseNumber": "SW-400"},
+        {"name": "Mary Anders", "email": "mary@example.com", "phone": None, "licenseNumber": "MA-300"},
+    ):
+        assert client.post("/api/customers", json=customer).status_code == 201
+    
+    def names(q, **params):
+        response = client.get("/api/customers/search", params={"q": q, **params})
+        assert response.status_code == 200
+        return [customer["name"] for customer in response.json()]
+    
+    assert set(names("an")) == {"Anna Smith", "Andrew Jones", "Mary Anders"}
+    assert names("ann smi") == ["Anna Smith"]
+    # Name matches rank above email matches
+    assert names("smith") == ["Anna Smith", "Sam Wu"]
+    assert names("mailb") == ["Andrew Jones"]
+    assert names("2000") == ["Andrew Jones"]
+    assert names("MA-3") == ["Mary Anders"]
+    assert names("zzz") == []
+    assert names("--") == []
+    assert len(names("an", limit=2)) == 2
+
+
+def test_search_customers_follows_writes(client: TestClient):
+    """Test that the search index follows creates, updates, deletes and imports."""
+    created = client.post("/api/customers", json={
+        "name": "Olivia Brown", "email": "olivia@example.com", "phone": None, "licenseNumber": "OB-1"
+    }).json()
+    client.post(
+        "/api/customers/import",
+        content="name,email,phone,licenseNumber\nOliver Green,oliver@example.com,,OG-1\n",
+        headers={"Content-Type": "text/csv"}
+    )
+    assert {c["name"] for c in client.get("/api/customers/search?q=oliv").json()} == {"Olivia Brown", "Oliver Green"}
+    
+    client.put(f"/api/customers/{created['id']}", json={"name": "Paula Brown", "email": "paula@example.com"})
+    assert [c["name"] for c in client.get("/api/customers/search?q=oliv").json()] == ["Oliver Green"]
+    assert [c["id"] for c in client.get("/api/customers/search?q=paul").json()] == [created["id"]]
+    
+    client.delete(f"/api/customers/{created['id']}")
+    assert client.get("/api/customers/search?q=brown").json() == []
@@ -0,0 +1,87 @@
+"""Tests for the synthetic dataset generator."""
+from collections import defaultdict
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+
+from backend.datagen import DatasetSpec, generate
+from backend.models import Car, CarStatus, Customer, Rental, RentalDailyRollup, RentalStatus
+from backend.services.rental_service import RentalService
+from backend.tests.helpers import TestingSessionLocal, engine
+
+SPEC = DatasetSpec(cars=20, customers=50, rentals=500, start=date(2024, 1, 1), end=date(2025, 1, 1), seed=7)
+
+
+def snapshot():
+    """Get every car, customer and rental as plain tuples."""
+    with TestingSessionLocal() as db:
+        return [
+            db.execute(select(model.__table__).order_by(model.id)).all()
+            for model in (Car, Customer, Rental)
+        ]
+
+
+def test_generate_counts():
+    """Test that the dataset has the requested sizes, and rollups."""
+    counts = generate(engine, SPEC, progress=lambda message: None)
+
+    assert counts["cars"] == 20
+    assert counts["customers"] == 50
+    assert counts["rentals"] == 500
+    with TestingSessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(Rental)) == 500
+        assert db.scalar(select(func.count()).select_from(RentalDailyRollup)) == counts["rollups"] > 0
+
+
+def test_generate_is_deterministic():
+    """Test that the same spec and seed give the same data, and another seed does not."""
+    generate(engine, SPEC, progress=lambda message: None)
+    first = snapshot()
+    generate(engine, SPEC, replace=True, progress=lambda message: None)
+    assert snapshot() == first
+
+    generate(engine, DatasetSpec(**{**SPEC.__dict__, "seed": 8}), replace=True, progress=lambda message: None)
+    assert snapshot() != first
+
+
+def test_generated_rentals_are_consistent():
+    """Test that rentals do not overlap per car and follow the pricing and status rules."""
+    generate(engine, SPEC, rollups=False, progress=lambda message: None)
+
+    with TestingSessionLocal() as db:
+        cars = {car.id: car for car in db.scalars(select(Car))}
+        rentals = db.scalars(select(Rental).order_by(Rental.carId, Rental.startDate)).all()
+
+    by_car = defaultdict(list)
+    for rental in rentals:
+        by_car[rental.carId].append(rental)
+        assert rental.totalCost == RentalService._calculate_total_cost(
+            rental.startDate, rental.endDate, cars[rental.carId].dailyRate
+        )
+        assert SPEC.start <= rental.startDate < SPEC.end
+        assert rental.endDate > rental.startDate
+
+    for car_id, car_rentals in by_car.items():
+        for previous, rental in zip(car_rentals, car_rentals[1:]):
+            assert previous.endDate <= rental.startDate
+        # Only a car's last rental can still be out, and then the car is rented
+        active = [rental for rental in car_rentals if rental.status == RentalStatus.ACTIVE]
+        assert active in ([], [car_rentals[-1]])
+        assert (cars[car_id].status == CarStatus.RENTED) == bool(active)
+
+
+def test_generate_refuses_existing_data():
+    """Test that generating into a database with data needs replace."""
+    generate(engine, SPEC, rollups=False, progress=lambda message: None)
+
+    with pytest.raises(ValueError):
+        generate(engine, SPEC, progress=lambda message: None)
+
+
+def test_generate_rejects_impossible_spec():
+    """Test that more rentals than the cars can hold are rejected."""
+    spec = DatasetSpec(cars=1, rentals=1000, start=date(2024, 1, 1), end=date(2024, 2, 1))
+
+    with pytest.raises(ValueError):
+        generate(engine, spec, progress=lambda message: None)
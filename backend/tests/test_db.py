@@ -0,0 +1,96 @@
+"""Tests for engine profiles."""
+import pytest
+from sqlalchemy import text
+
+from backend.config import ENGINE_PROFILES, load_engine_profile
+from backend.db import create_db_engine, engine_options
+
+
+def test_production_profile_pragmas(tmp_path):
+    """Test that the production profile configures every new connection."""
+    engine = create_db_engine(f"sqlite:///{tmp_path / 'orento.db'}", ENGINE_PROFILES["production"])
+    try:
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            # NORMAL
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+            assert connection.execute(text("PRAGMA mmap_size")).scalar() == 256 * 1024 * 1024
+            assert connection.execute(text("PRAGMA cache_size")).scalar() == -64 * 1024
+            assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert engine.pool.size() == 20
+    finally:
+        engine.dispose()
+
+
+def test_memory_database_skips_pool_options():
+    """Test that in-memory databases keep the per-thread connection pool."""
+    options = engine_options("sqlite:///file:x?mode=memory&cache=shared&uri=true", ENGINE_PROFILES["production"])
+    assert "pool_size" not in options
+    assert "pool_size" in engine_options("sqlite:///./orento.db", ENGINE_PROFILES["production"])
+
+
+def test_profile_overrides(monkeypatch):
+    """Test that ORENTO_DB_<FIELD> variables override profile values."""
+    monkeypatch.setenv("ORENTO_DB_POOL_SIZE", "50")
+    monkeypatch.setenv("ORENTO_DB_SYNCHRONOUS", "full")
+    profile = load_engine_profile("production")
+    assert profile.pool_size == 50
+    assert profile.synchronous == "FULL"
+    assert profile.journal_mode == "WAL"
+    
+    with pytest.raises(ValueError):
+        load_engine_profile("fastest")
+
+
+def test_reads_route_to_replicas(tmp_path, monkeypatch):
+    """Test that reads go to a replica unless the client reads its own writes."""
+    from fastapi.testclient import TestClient
+    from sqlalchemy.orm import sessionmaker
+    
+    from backend import db as db_module
+    from backend.db import Base, READ_YOUR_WRITES_COOKIE, READ_YOUR_WRITES_HEADER, configure_replicas
+    from backend.models import Car, CarStatus
+    from backend.routers import cars
+    from backend.tests.helpers import TestingSessionLocal, create_test_app
+    
+    replica_url = f"sqlite:///{tmp_path / 'replica.db'}"
+    replica_engine = create_db_engine(replica_url, ENGINE_PROFILES["test"])
+    Base.metadata.create_all(bind=replica_engine)
+    with sessionmaker(bind=replica_engine)() as replica:
+        replica.add(Car(make="Replica", model="Copy", year=2020, imageUrl="https://example.com/car.jpg",
+                        status=CarStatus.AVAILABLE, dailyRate=40.0))
+        replica.commit()
+    replica_engine.dispose()
+    
+    # The test database stands in for the primary
+    monkeypatch.setattr(db_module, "SessionLocal", TestingSessionLocal)
+    configure_replicas([replica_url])
+    try:
+        test_app = create_test_app()
+        test_app.include_router(cars.router)
+        with TestClient(test_app) as writer, TestClient(test_app) as reader:
+            response = writer.post("/api/cars", json={
+                "make": "Primary",
+                "model": "Original",
+                "year": 2021,
+                "imageUrl": "https://example.com/car.jpg",
+                "dailyRate": 45.00
+            })
+            assert response.status_code == 201
+            assert READ_YOUR_WRITES_COOKIE in response.cookies
+            
+            makes = lambda r: [car["make"] for car in r.json()]
+            assert makes(reader.get("/api/cars")) == ["Replica"]
+            assert makes(reader.get("/api/cars", headers={READ_YOUR_WRITES_HEADER: "1"})) == ["Primary"]
+            assert makes(writer.get("/api/cars")) == ["Primary"]
+            
+            # Replica reads carry no ETag, primary reads keep it
+            assert "ETag" not in reader.get("/api/cars").headers
+            etag = writer.get("/api/cars").headers["ETag"]
+            response = writer.get("/api/cars", headers={"If-None-Match": etag})
+            assert response.status_code == 304
+            response = reader.get("/api/cars", headers={"If-None-Match": etag})
+            assert response.status_code == 200
+            assert "ETag" not in response.headers
+    finally:
+        configure_replicas([])
@@ -0,0 +1,83 @@
+"""Tests for per-request SQL query stats."""
+from fastapi.testclient import TestClient
+
+from backend.instrumentation import (
+    QUERY_COUNT_HEADER, QUERY_TIME_HEADER, SLOWEST_QUERY_HEADER, QueryStats, route_query_stats
+)
+from backend.tests.helpers import assert_max_queries, create_car, create_customer
+
+
+def test_query_stats_record_slowest():
+    """Test that stats keep the count, total time and slowest statement."""
+    stats = QueryStats()
+    stats.record("SELECT 1", 0.002)
+    stats.record("SELECT 2", 0.005)
+    stats.record("SELECT 3", 0.001)
+    assert stats.count == 3
+    assert abs(stats.time - 0.008) < 1e-12
+    assert stats.slowest_statement == "SELECT 2"
+
+
+def test_query_stats_headers(client: TestClient):
+    """Test that responses carry their query count, SQL time and slowest query."""
+    create_car(client)
+    response = client.get("/api/cars?limit=10")
+    assert response.headers[QUERY_COUNT_HEADER] == "1"
+    assert float(response.headers[QUERY_TIME_HEADER]) > 0
+    assert response.headers[SLOWEST_QUERY_HEADER].startswith("SELECT cars.id")
+
+    # A 304 is answered from the table versions, without queries
+    response = client.get("/api/cars?limit=10", headers={"If-None-Match": response.headers["ETag"]})
+    assert response.status_code == 304
+    assert response.headers[QUERY_COUNT_HEADER] == "0"
+    assert SLOWEST_QUERY_HEADER not in response.headers
+
+
+def test_route_query_stats(client: TestClient):
+    """Test that stats are aggregated per route template."""
+    route_query_stats.clear()
+    first = create_car(client)
+    second = create_car(client)
+    client.put(f"/api/cars/{first}", json={"dailyRate": 60.0})
+    client.put(f"/api/cars/{second}", json={"dailyRate": 70.0})
+
+    routes = {route["route"]: route for route in route_query_stats.snapshot()}
+    assert routes["POST /api/cars"]["requests"] == 2
+    assert routes["PUT /api/cars/{car_id}"]["requests"] == 2
+    assert routes["PUT /api/cars/{car_id}"]["queries"] >= 2
+    assert routes["PUT /api/cars/{car_id}"]["slowestStatement"] is not None
+
+
+def test_query_budgets(client: TestClient):
+    """Test the query budgets of the main endpoints."""
+    car_id = create_car(client)
+    customer_id = create_customer(client)
+
+    # Car lookup (served from the car cache when warm), customer check, pricing
+    # rules, conditional insert, car status, rollup upsert and reload
+    response = client.post("/api/rentals", json={
+        "carId": car_id, "customerId": customer_id, "startDate": "2024-01-01", "endDate": "2024-01-04"
+    })
+    assert_max_queries(response, 7)
+    rental_id = response.json()["id"]
+
+    # Changing car and dates loads the rental and the car (its cache entry
+    # was invalidated by the booking) once each, re-checks the window with a
+    # conditional update, moves the rollups with an upsert and a cleanup,
+    # then updates and refreshes the rental
+    response = client.put(f"/api/rentals/{rental_id}", json={"carId": car_id, "startDate": "2024-01-02"})
+    assert response.status_code == 200
+    assert_max_queries(response, 7)
+
+    # Lists and embedded relations are single queries
+    assert_max_queries(client.get("/api/rentals?expand=car,customer"), 1)
+    assert_max_queries(client.get("/api/rentals?limit=10"), 1)
+    assert_max_queries(client.get("/api/cars"), 1)
+    assert_max_queries(client.get("/api/customers"), 1)
+
+
+def test_query_stats_async(async_client: TestClient):
+    """Test that async endpoints record their queries too."""
+    create_car(async_client)
+    response = async_client.get("/api/cars?limit=10")
+    assert response.headers[QUERY_COUNT_HEADER] == "1"
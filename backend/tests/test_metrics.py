@@ -0,0 +1,76 @@
+"""Tests for the Prometheus metrics endpoint."""
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.db import get_db, get_read_db
+from backend.metrics import CONTENT_TYPE, Histogram, MetricsMiddleware, render
+from backend.routers import api_routers, metrics
+from backend.tests.helpers import create_test_app, override_get_db
+
+
+@pytest.fixture
+def metrics_client(setup_database):
+    """Create a test client with the metrics middleware and endpoint."""
+    test_app = create_test_app()
+    test_app.add_middleware(MetricsMiddleware)
+    for router in api_routers("sync"):
+        test_app.include_router(router)
+    test_app.include_router(metrics.router)
+    test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_read_db] = override_get_db
+    with TestClient(test_app) as test_client:
+        yield test_client
+
+
+def sample(text: str, name: str) -> float:
+    """Get the value of one sample line, by its name and labels."""
+    for line in text.splitlines():
+        if line.startswith(name + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{name} not found")
+
+
+def test_histogram_render():
+    """Test cumulative buckets, sum and count of a histogram."""
+    histogram = Histogram("test_seconds", "Test latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, ("/a",))
+    assert histogram.render() == [
+        "# HELP test_seconds Test latency.",
+        "# TYPE test_seconds histogram",
+        'test_seconds_bucket{route="/a",le="0.1"} 2',
+        'test_seconds_bucket{route="/a",le="1.0"} 3',
+        'test_seconds_bucket{route="/a",le="+Inf"} 4',
+        'test_seconds_sum{route="/a"} 3.65',
+        'test_seconds_count{route="/a"} 4',
+    ]
+
+
+def test_metrics_endpoint(metrics_client: TestClient):
+    """Test request, status, pool and cache metrics after some traffic."""
+    before = render()
+    route = '{method="GET",route="/api/cars/{car_id}",status="404"}'
+    try:
+        not_found_before = sample(before, "orento_http_requests_total" + route)
+    except AssertionError:
+        not_found_before = 0
+
+    metrics_client.get("/api/cars")
+    metrics_client.get("/api/cars/999")
+    metrics_client.get("/api/cars/999")
+    metrics_client.get("/no/such/path")
+
+    response = metrics_client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    text = response.text
+
+    assert sample(text, "orento_http_requests_total" + route) == not_found_before + 2
+    assert sample(text, 'orento_http_request_duration_seconds_count{method="GET",route="/api/cars"}') >= 1
+    assert 'route="unmatched",status="404"' in text
+    # The scrape itself is in flight
+    assert sample(text, 'orento_http_requests_in_flight{method="GET"}') == 1
+    assert 'orento_cache_hit_ratio{cache="car"}' in text
+    assert 'orento_cache_entries{cache="pricing_calendar"}' in text
+    assert 'orento_db_queries_total{route="GET /api/cars"}' in text
+    assert "# TYPE orento_db_pool_checkout_seconds histogram" in text
@@ -0,0 +1,155 @@
+"""Tests for pricing rules and the compiled pricing calendar."""
+import math
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from backend.models import PricingRuleKind
+from backend.pricing import PricingCalendar, weekend_days
+from backend.services.rental_service import RentalService
+from backend.tests.helpers import create_car, create_customer
+
+
+def rule(kind: PricingRuleKind, multiplier: float, **fields) -> SimpleNamespace:
+    """Build a rule-like object for compiling calendars directly."""
+    values = {"startDate": None, "endDate": None, "minDays": None, **fields}
+    return SimpleNamespace(kind=kind, multiplier=multiplier, **values)
+
+
+def day_by_day_price(rules, start: date, end: date, rate: float) -> float:
+    """Price a rental by multiplying every day's rate separately."""
+    days = max((end - start).days, 1)
+    total = 0.0
+    for i in range(days):
+        day = start + timedelta(days=i)
+        multiplier = 1.0
+        for r in rules:
+            if r.kind == PricingRuleKind.WEEKEND and day.weekday() >= 5:
+                multiplier *= r.multiplier
+            if r.kind == PricingRuleKind.SEASONAL and r.startDate <= day <= r.endDate:
+                multiplier *= r.multiplier
+        total += rate * multiplier
+    tiers = [r for r in rules if r.kind == PricingRuleKind.LONG_TERM and r.minDays <= days]
+    if tiers:
+        longest = max(r.minDays for r in tiers)
+        for r in tiers:
+            if r.minDays == longest:
+                total *= r.multiplier
+    return total
+
+
+def test_weekend_days():
+    """Test the constant-time weekend count against counting day by day."""
+    start = date(2024, 1, 1)
+    for offset in range(7):
+        for days in range(0, 30):
+            first = start + timedelta(days=offset)
+            expected = sum(1 for i in range(days) if (first + timedelta(days=i)).weekday() >= 5)
+            assert weekend_days(first, first + timedelta(days=days)) == expected
+
+
+def test_calendar_matches_day_by_day_pricing():
+    """Test compiled prices against pricing each day, inside and outside the seasons."""
+    rules = [
+        rule(PricingRuleKind.WEEKEND, 1.25),
+        rule(PricingRuleKind.SEASONAL, 1.5, startDate=date(2024, 7, 1), endDate=date(2024, 8, 31)),
+        rule(PricingRuleKind.SEASONAL, 0.8, startDate=date(2024, 8, 15), endDate=date(2024, 9, 15)),
+        rule(PricingRuleKind.LONG_TERM, 0.9, minDays=7),
+        rule(PricingRuleKind.LONG_TERM, 0.8, minDays=30),
+    ]
+    calendar = PricingCalendar(rules)
+    rng = random.Random(18)
+    for _ in range(500):
+        start = date(2024, 5, 1) + timedelta(days=rng.randrange(200))
+        end = start + timedelta(days=rng.choice([0, 1, 2, 6, 7, 29, 30, 60, rng.randrange(200)]))
+        rate = round(rng.uniform(10, 300), 2)
+        assert math.isclose(calendar.price(start, end, rate), day_by_day_price(rules, start, end, rate), rel_tol=1e-12)
+
+
+def test_calendar_without_rules_is_base_cost():
+    """Test that rules that do not apply leave the base cost exactly unchanged."""
+    seasonal = PricingCalendar([rule(PricingRuleKind.SEASONAL, 1.3, startDate=date(2024, 12, 20), endDate=date(2025, 1, 5))])
+    for calendar in (PricingCalendar([]), seasonal):
+        for start, end, rate in [(date(2024, 3, 1), date(2024, 3, 4), 33.33), (date(2024, 3, 1), date(2024, 3, 1), 0.1)]:
+            assert calendar.price(start, end, rate) == RentalService._calculate_total_cost(start, end, rate)
+
+
+def test_rentals_priced_by_rules(client: TestClient):
+    """Test that rentals and quotes use the current rules."""
+    car_id = create_car(client, daily_rate=40.0)
+    customer_id = create_customer(client)
+    # Friday to Monday: Friday, Saturday and Sunday
+    booking = {"carId": car_id, "customerId": customer_id, "startDate": "2024-03-01", "endDate": "2024-03-04", "status": "COMPLETED"}
+
+    assert client.post("/api/rentals", json=booking).json()["totalCost"] == 120.0
+
+    response = client.post("/api/pricing-rules", json={"name": "Weekend", "kind": "WEEKEND", "multiplier": 1.5})
+    assert response.status_code == 201
+    weekend_id = response.json()["id"]
+    rental = client.post("/api/rentals", json=booking).json()
+    assert rental["totalCost"] == 160.0
+
+    quote = client.post("/api/quotes", json={"carIds": [car_id], "ranges": [{"startDate": "2024-03-01", "endDate": "2024-03-04"}]})
+    assert quote.json()[0]["totalCost"] == rental["totalCost"]
+
+    # Rule changes apply to rentals repriced afterwards
+    client.put(f"/api/pricing-rules/{weekend_id}", json={"multiplier": 2.0})
+    response = client.put(f"/api/rentals/{rental['id']}", json={"endDate": "2024-03-05"})
+    assert response.json()["totalCost"] == 240.0
+
+    client.delete(f"/api/pricing-rules/{weekend_id}")
+    assert client.post("/api/rentals", json=booking).json()["totalCost"] == 120.0
+
+
+def test_pricing_rule_validation(client: TestClient):
+    """Test that rules need the fields of their kind."""
+    response = client.post("/api/pricing-rules", json={"name": "Summer", "kind": "SEASONAL", "multiplier": 1.2})
+    assert response.status_code == 422
+    response = client.post("/api/pricing-rules", json={"name": "Week", "kind": "LONG_TERM", "multiplier": 0.9})
+    assert response.status_code == 422
+
+    response = client.post("/api/pricing-rules", json={"name": "Weekend", "kind": "WEEKEND", "multiplier": 1.1})
+    rule_id = response.json()["id"]
+    response = client.put(f"/api/pricing-rules/{rule_id}", json={"kind": "SEASONAL"})
+    assert response.status_code == 400
+    assert client.get(f"/api/pricing-rules/{rule_id}").json()["kind"] == "WEEKEND"
+    assert client.get("/api/pricing-rules/999").status_code == 404
+
+
+def test_pricing_rule_date_bounds(client: TestClient):
+    """Test that seasons must fall in the rule date range and cannot overflow the calendar."""
+    season = {"name": "Forever", "kind": "SEASONAL", "multiplier": 1.2}
+    for start, end in [("2024-01-01", "9999-12-31"), ("9999-12-31", "9999-12-31"), ("2024-01-01", "2025-01-01")]:
+        response = client.post("/api/pricing-rules", json={**season, "startDate": start, "endDate": end})
+        assert response.status_code == 422
+
+    response = client.post("/api/pricing-rules", json={**season, "startDate": "2024-01-01", "endDate": "2024-12-31"})
+    assert response.status_code == 201
+    rule_id = response.json()["id"]
+    response = client.put(f"/api/pricing-rules/{rule_id}", json={"endDate": "9999-12-31"})
+    assert response.status_code == 400
+    assert client.get(f"/api/pricing-rules/{rule_id}").json()["endDate"] == "2024-12-31"
+
+    # Rentals are still priced
+    car_id = create_car(client, daily_rate=40.0)
+    customer_id = create_customer(client)
+    response = client.post("/api/rentals", json={
+        "carId": car_id, "customerId": customer_id, "startDate": "2024-03-04", "endDate": "2024-03-06"
+    })
+    assert math.isclose(response.json()["totalCost"], 96.0)
+
+
+def test_calendar_seasons_years_apart():
+    """Test that seasons far apart compile to a few segments and price exactly."""
+    rules = [
+        rule(PricingRuleKind.WEEKEND, 1.1),
+        rule(PricingRuleKind.SEASONAL, 1.5, startDate=date(2000, 1, 1), endDate=date(2000, 12, 31)),
+        rule(PricingRuleKind.SEASONAL, 2.0, startDate=date(2999, 1, 1), endDate=date(2999, 12, 31)),
+    ]
+    calendar = PricingCalendar(rules)
+    assert len(calendar._factors) == 3
+    for start, days in [(date(2000, 12, 25), 14), (date(2500, 6, 1), 10), (date(2999, 12, 20), 11)]:
+        end = start + timedelta(days=days)
+        assert math.isclose(calendar.price(start, end, 50.0), day_by_day_price(rules, start, end, 50.0), rel_tol=1e-12)
@@ -0,0 +1,73 @@
+"""Tests for batch quotes."""
+import random
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from backend.pricing import PricingCalendar
+from backend.services import quote_service
+from backend.services.quote_service import QuoteService
+from backend.services.rental_service import RentalService
+from backend.tests.helpers import create_car
+
+
+def random_cases(count: int):
+    """Generate random rates and date ranges, including same-day ranges."""
+    rng = random.Random(17)
+    rates = [round(rng.uniform(0, 500), 2) for _ in range(count)] + [0.1, 0.7, 33.33, 1e-3]
+    ranges = []
+    for _ in range(count):
+        start = date(2024, 1, 1) + timedelta(days=rng.randrange(730))
+        ranges.append((start, start + timedelta(days=rng.choice([0, 1, 3, 7, 30, rng.randrange(400)]))))
+    return rates, ranges
+
+
+def test_price_matches_scalar_cost(monkeypatch):
+    """Test that vectorized and fallback prices equal the scalar cost exactly."""
+    rates, ranges = random_cases(60)
+    expected = [[RentalService._calculate_total_cost(start, end, rate) for start, end in ranges] for rate in rates]
+
+    days, totals = QuoteService.price(PricingCalendar([]), rates, ranges)
+    assert totals == expected
+    assert days == [max((end - start).days, 1) for start, end in ranges]
+
+    monkeypatch.setattr(quote_service, "np", None)
+    assert QuoteService.price(PricingCalendar([]), rates, ranges) == (days, expected)
+
+
+def test_create_quotes(client: TestClient):
+    """Test quoting requested cars over several ranges, car-major."""
+    camry = create_car(client, daily_rate=50.0)
+    other = create_car(client, daily_rate=33.33)
+    ranges = [
+        {"startDate": "2024-01-01", "endDate": "2024-01-04"},
+        {"startDate": "2024-01-01", "endDate": "2024-01-01"},
+    ]
+
+    response = client.post("/api/quotes", json={"carIds": [other, camry, other], "ranges": ranges})
+    assert response.status_code == 200
+    assert [(q["carId"], q["days"], q["totalCost"]) for q in response.json()] == [
+        (other, 3, 3 * 33.33), (other, 1, 33.33), (camry, 3, 150.0), (camry, 1, 50.0),
+    ]
+    assert response.json()[0] == {"carId": other, "startDate": "2024-01-01", "endDate": "2024-01-04", "days": 3, "totalCost": 99.99}
+
+    # Without carIds every car is quoted, by id
+    response = client.post("/api/quotes", json={"ranges": ranges[:1]})
+    assert [q["carId"] for q in response.json()] == [camry, other]
+
+
+def test_create_quotes_errors(client: TestClient, monkeypatch):
+    """Test unknown cars, invalid ranges and oversized batches."""
+    car_id = create_car(client, daily_rate=50.0)
+    ranges = [{"startDate": "2024-01-05", "endDate": "2024-01-06"}]
+
+    response = client.post("/api/quotes", json={"carIds": [car_id, 999], "ranges": ranges})
+    assert response.status_code == 404
+    assert "999" in response.json()["detail"]
+
+    response = client.post("/api/quotes", json={"ranges": [{"startDate": "2024-01-05", "endDate": "2024-01-04"}]})
+    assert response.status_code == 422
+    assert client.post("/api/quotes", json={"ranges": []}).status_code == 422
+
+    monkeypatch.setattr(quote_service, "MAX_QUOTES", 1)
+    assert client.post("/api/quotes", json={"ranges": ranges * 2}).status_code == 400
@@ -1,7 +1,9 @@
 """Tests for rental endpoints."""
 import pytest
 from fastapi.testclient import TestClient
+import json
 from datetime import date, timedelta
+from sqlalchemy import text
 
 
 def create_test_car(client: TestClient, status: str = "AVAILABLE") -> int:
@@ -80,6 +82,36 @@ def test_create_rental_invalid_date_range(client: TestClient):
     assert response.status_code == 422  # Validation error
 
 
+def test_rental_length_is_capped(client: TestClient):
+    """Test that rentals longer than MAX_RENTAL_DAYS are rejected on create and update."""
+    from backend.services.rental_service import MAX_RENTAL_DAYS
+    
+    car_id = create_test_car(client)
+    customer_id = create_test_customer(client)
+    
+    start_date = date(2030, 1, 1)
+    rental_data = {
+        "carId": car_id,
+        "customerId": customer_id,
+        "startDate": start_date.isoformat(),
+        "endDate": date(9999, 12, 31).isoformat(),
+        "status": "COMPLETED"
+    }
+    response = client.post("/api/rentals", json=rental_data)
+    assert response.status_code == 400
+    
+    rental_data["endDate"] = (start_date + timedelta(days=MAX_RENTAL_DAYS)).isoformat()
+    response = client.post("/api/rentals", json=rental_data)
+    assert response.status_code == 201
+    rental_id = response.json()["id"]
+    
+    response = client.put(f"/api/rentals/{rental_id}", json={"startDate": (start_date - timedelta(days=1)).isoformat()})
+    assert response.status_code == 400
+    response = client.put(f"/api/rentals/{rental_id}", json={"startDate": "9999-12-31"})
+    assert response.status_code == 400
+    assert client.get(f"/api/rentals/{rental_id}").json()["startDate"] == start_date.isoformat()
+
+
 def test_create_rental_car_not_found(client: TestClient):
     """Test rental creation with non-existent car."""
     customer_id = create_test_customer(client)
@@ -276,3 +308,332 @@ def test_delete_rental(client: TestClient):
     # Verify car status changed back to AVAILABLE
     car_response = client.get(f"/api/cars/{car_id}")
     assert car_response.json()["status"] == "AVAILABLE"
+
+
+def test_get_rentals_paginated(client: TestClient):
+    """Test getting rentals one page at a time."""
+    customer_id = create_test_customer(client)
+    start_date = date.today()
+    
+    for _ in range(3):
+        car_id = create_test_car(client)
+        rental_data = {
+            "carId": car_id,
+            "customerId": customer_id,
+            "startDate": start_date.isoformat(),
+            "endDate": (start_date + timedelta(days=2)).isoformat(),
+            "status": "ACTIVE"
+        }
+        client.post("/api/rentals", json=rental_data)
+    
+    first = client.get("/api/rentals", params={"limit": 2})
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    
+    second = client.get("/api/rentals", params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]})
+    assert len(second.json()) == 1
+    assert second.json()[0]["id"] > first.json()[-1]["id"]
+
+
+def test_filter_rentals(client: TestClient):
+    """Test filtering rentals by status, car and date range."""
+    customer_id = create_test_customer(client)
+    start_date = date(2024, 1, 1)
+    car_ids = []
+    
+    for offset in range(3):
+        car_id = create_test_car(client)
+        car_ids.append(car_id)
+        rental_data = {
+            "carId": car_id,
+            "customerId": customer_id,
+            "startDate": (start_date + timedelta(days=offset * 10)).isoformat(),
+            "endDate": (start_date + timedelta(days=offset * 10 + 3)).isoformat(),
+            "status": "ACTIVE"
+        }
+        client.post("/api/rentals", json=rental_data)
+    
+    rentals = client.get("/api/rentals").json()
+    client.put(f"/api/rentals/{rentals[0]['id']}", json={"status": "COMPLETED"})
+    
+    response = client.get("/api/rentals", params={"status": "ACTIVE"})
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+    assert all(r["status"] == "ACTIVE" for r in response.json())
+    
+    response = client.get("/api/rentals", params={"carId": car_ids[1]})
+    assert [r["carId"] for r in response.json()] == [car_ids[1]]
+    
+    response = client.get("/api/rentals", params={"startFrom": "2024-01-05", "startTo": "2024-01-15"})
+    assert [r["startDate"] for r in response.json()] == ["2024-01-11"]
+    
+    response = client.get("/api/rentals", params={"status": "INVALID"})
+    assert response.status_code == 422
+
+
+def test_sort_rentals_paginated(client: TestClient):
+    """Test sorting rentals by start date descending across pages."""
+    customer_id = create_test_customer(client)
+    start_dates = [date(2024, 3, 1), date(2024, 1, 1), date(2024, 2, 1)]
+    
+    for start_date in start_dates:
+        car_id = create_test_car(client)
+        rental_data = {
+            "carId": car_id,
+            "customerId": customer_id,
+            "startDate": start_date.isoformat(),
+            "endDate": (start_date + timedelta(days=2)).isoformat(),
+            "status": "COMPLETED"
+        }
+        client.post("/api/rentals", json=rental_data)
+    
+    first = client.get("/api/rentals", params={"sort": "-startDate", "limit": 2})
+    assert [r["startDate"] for r in first.json()] == ["2024-03-01", "2024-02-01"]
+    
+    second = client.get("/api/rentals", params={
+        "sort": "-startDate",
+        "limit": 2,
+        "cursor": first.headers["X-Next-Cursor"]
+    })
+    assert [r["startDate"] for r in second.json()] == ["2024-01-01"]
+
+
+def test_filtered_rental_query_uses_index():
+    """Test that a status filter with date sort is served by a composite index."""
+    from backend.models import RentalStatus
+    from backend.schemas import RentalFilter, RentalSort
+    from backend.services.rental_service import RentalService
+    from backend.tests.helpers import TestingSessionLocal
+    
+    db = TestingSessionLocal()
+    try:
+        filters = RentalFilter(status=RentalStatus.ACTIVE, sort=RentalSort.START_DATE)
+        keys, _ = RentalService._sort_keys(filters)
+        query = RentalService._filtered_query(db, filters).order_by(*keys)
+        sql = str(query.statement.compile(db.bind, compile_kwargs={"literal_binds": True}))
+        plan = " ".join(row[-1] for row in db.execute(text(f"EXPLAIN QUERY PLAN {sql}")))
+    finally:
+        db.close()
+    
+    assert "ix_rentals_status_start" in plan
+
+
+def test_get_rentals_expanded(client: TestClient):
+    """Test embedding car and customer data in the rental listing."""
+    car_id = create_test_car(client)
+    customer_id = create_test_customer(client)
+    
+    start_date = date.today()
+    rental_data = {
+        "carId": car_id,
+        "customerId": customer_id,
+        "startDate": start_date.isoformat(),
+        "endDate": (start_date + timedelta(days=3)).isoformat(),
+        "status": "ACTIVE"
+    }
+    rental_id = client.post("/api/rentals", json=rental_data).json()["id"]
+    
+    plain = client.get("/api/rentals").json()[0]
+    assert "car" not in plain
+    assert "customer" not in plain
+    
+    response = client.get("/api/rentals", params={"expand": "car,customer"})
+    assert response.status_code == 200
+    expanded = response.json()[0]
+    assert expanded["car"]["id"] == car_id
+    assert expanded["car"]["make"] == "Toyota"
+    assert expanded["customer"]["id"] == customer_id
+    assert expanded["customer"]["name"] == "John Doe"
+    
+    single = client.get(f"/api/rentals/{rental_id}", params={"expand": "car"}).json()
+    assert single["car"]["id"] == car_id
+    assert "customer" not in single
+
+
+def test_get_rentals_expand_invalid(client: TestClient):
+    """Test that unknown expansions are rejected."""
+    response = client.get("/api/rentals", params={"expand": "car,invoices"})
+    assert response.status_code == 400
+    assert "invoices" in response.json()["detail"]
+
+
+def test_create_rental_lost_race_returns_conflict():
+    """Test that a booking losing the race for a car's window gets a 409."""
+    from fastapi import HTTPException
+    from sqlalchemy import insert
+    from backend.models import Car, CarStatus, Customer, Rental
+    from backend.schemas import RentalCreate
+    from backend.services.rental_service import RentalService
+    from backend.tests.helpers import TestingSessionLocal
+    
+    db = TestingSessionLocal()
+    try:
+        car = Car(make="Toyota", model="Camry", year=2021, imageUrl="https://example.com/camry.jpg",
+                  status=CarStatus.AVAILABLE, dailyRate=50.00)
+        customer = Customer(name="John Doe", email="john@example.com", licenseNumber="JD-1")
+        db.add_all([car, customer])
+        db.commit()
+        assert car.status == CarStatus.AVAILABLE  # loaded into this session
+        
+        # Another request books an overlapping window after this session has read the car
+        db.connection().execute(
+            insert(Rental.__table__).values(
+                carId=car.id,
+                customerId=customer.id,
+                startDate=date.today() + timedelta(days=2),
+                endDate=date.today() + timedelta(days=5),
+                status="ACTIVE",
+                totalCost=150.00
+            )
+        )
+        
+        rental_data = RentalCreate(
+            carId=car.id,
+            customerId=customer.id,
+            startDate=date.today(),
+            endDate=date.today() + timedelta(days=3)
+        )
+        with pytest.raises(HTTPException) as exc_info:
+            RentalService.create(db, rental_data)
+        assert exc_info.value.status_code == 409
+    finally:
+        db.close()
+
+
+def test_reactivate_rental_for_rented_car_conflicts(client: TestClient):
+    """Test that reactivating a rental cannot double-book its car."""
+    car_id = create_test_car(client)
+    customer_id = create_test_customer(client)
+    
+    start_date = date.today()
+    rental_data = {
+        "carId": car_id,
+        "customerId": customer_id,
+        "startDate": start_date.isoformat(),
+        "endDate": (start_date + timedelta(days=3)).isoformat(),
+        "status": "ACTIVE"
+    }
+    first_id = client.post("/api/rentals", json=rental_data).json()["id"]
+    client.put(f"/api/rentals/{first_id}", json={"status": "CANCELLED"})
+    client.post("/api/rentals", json=rental_data)
+    
+    response = client.put(f"/api/rentals/{first_id}", json={"status": "ACTIVE"})
+    assert response.status_code == 409
+    assert client.get(f"/api/rentals/{first_id}").json()["status"] == "CANCELLED"
+
+
+def test_move_active_rental_to_another_car(client: TestClient):
+    """Test that moving an ACTIVE rental books the new car and releases the old one."""
+    old_car_id = create_test_car(client)
+    booked_car_id = create_test_car(client)
+    new_car_id = create_test_car(client)
+    customer_id = create_test_customer(client)
+    
+    start_date = date.today()
+    rental_data = {
+        "customerId": customer_id,
+        "startDate": start_date.isoformat(),
+        "endDate": (start_date + timedelta(days=3)).isoformat(),
+        "status": "ACTIVE"
+    }
+    rental_id = client.post("/api/rentals", json={**rental_data, "carId": old_car_id}).json()["id"]
+    client.post("/api/rentals", json={**rental_data, "carId": booked_car_id})
+    
+    # The other car is taken for the window: nothing changes
+    response = client.put(f"/api/rentals/{rental_id}", json={"carId": booked_car_id})
+    assert response.status_code == 409
+    assert client.get(f"/api/rentals/{rental_id}").json()["carId"] == old_car_id
+    assert client.get(f"/api/cars/{old_car_id}").json()["status"] == "RENTED"
+    
+    response = client.put(f"/api/rentals/{rental_id}", json={"carId": new_car_id})
+    assert response.status_code == 200
+    assert client.get(f"/api/cars/{old_car_id}").json()["status"] == "AVAILABLE"
+    assert client.get(f"/api/cars/{new_car_id}").json()["status"] == "RENTED"
+    
+    # The old car is free again for the window
+    response = client.post("/api/rentals", json={**rental_data, "carId": old_car_id})
+    assert response.status_code == 201
+
+
+def test_export_rentals(client: TestClient):
+    """Test streaming filtered rentals as CSV and NDJSON."""
+    customer_id = create_test_customer(client)
+    start_date = date(2024, 1, 1)
+    
+    for offset in range(3):
+        car_id = create_test_car(client)
+        rental_data = {
+            "carId": car_id,
+            "customerId": customer_id,
+            "startDate": (start_date + timedelta(days=offset)).isoformat(),
+            "endDate": (start_date + timedelta(days=offset + 2)).isoformat(),
+            "status": "COMPLETED" if offset == 1 else "ACTIVE"
+        }
+        client.post("/api/rentals", json=rental_data)
+    
+    response = client.get("/api/rentals/export", params={"status": "ACTIVE", "sort": "-startDate"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.strip().split("\n")
+    assert lines[0] == "id,carId,customerId,startDate,endDate,status,totalCost"
+    assert len(lines) == 3
+    assert lines[1].split(",")[3:6] == ["2024-01-03", "2024-01-05", "ACTIVE"]
+    
+    response = client.get("/api/rentals/export", params={"format": "ndjson"})
+    assert response.status_code == 200
+    records = [json.loads(line) for line in response.text.strip().split("\n")]
+    assert len(records) == 3
+    assert records[1]["status"] == "COMPLETED"
+    assert records[1]["totalCost"] == 100.0
+
+
+def test_rental_changes_car_etag(client: TestClient):
+    """Test that booking a car invalidates cached car responses."""
+    car_id = create_test_car(client)
+    customer_id = create_test_customer(client)
+    etag = client.get(f"/api/cars/{car_id}").headers["ETag"]
+    assert client.get(f"/api/cars/{car_id}", headers={"If-None-Match": etag}).status_code == 304
+    
+    client.post("/api/rentals", json={
+        "carId": car_id,
+        "customerId": customer_id,
+        "startDate": date.today().isoformat(),
+        "endDate": (date.today() + timedelta(days=2)).isoformat(),
+        "status": "ACTIVE"
+    })
+    
+    response = client.get(f"/api/cars/{car_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["status"] == "RENTED"
+
+
+def test_create_rental_with_warm_car_cache_skips_car_select(client: TestClient):
+    """Test that booking a cached car only touches the cars table to mark it rented."""
+    from sqlalchemy import event
+    from backend.tests.helpers import engine
+    
+    car_id = create_test_car(client)
+    customer_id = create_test_customer(client)
+    client.get(f"/api/cars/{car_id}")
+    
+    statements = []
+    capture = lambda conn, cursor, statement, *args: statements.append(statement)
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        response = client.post("/api/rentals", json={
+            "carId": car_id,
+            "customerId": customer_id,
+            "startDate": date.today().isoformat(),
+            "endDate": (date.today() + timedelta(days=2)).isoformat(),
+            "status": "ACTIVE"
+        })
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    
+    assert response.status_code == 201
+    car_statements = [s for s in statements if "cars" in s]
+    assert len(car_statements) == 1
+    assert car_statements[0].startswith("UPDATE cars")
+    
+    # The booking invalidated the cached car
+    assert client.get(f"/api/cars/{car_id}").json()["status"] == "RENTED"
@@ -0,0 +1,69 @@
+"""Tests for the fast list serialization."""
+import dataclasses
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+import backend.serialization
+from backend.serialization import list_serializer
+from backend.schemas import CarRead, RentalExpandedRead, RentalRead
+
+
+def test_flat_schemas_skip_validation():
+    """Test that scalar-only schemas use the direct encoder."""
+    assert list_serializer(CarRead).flat
+    assert list_serializer(RentalRead).flat
+    assert not list_serializer(RentalExpandedRead, exclude_unset=True).flat
+
+
+def test_fast_json_matches_response_model(client: TestClient, monkeypatch):
+    """Test that list payloads are byte-identical to FastAPI's serialization."""
+    car_ids = [
+        client.post("/api/cars", json={
+            "make": make,
+            "model": "Modèle \"X\"  ",
+            "year": 2021,
+            "imageUrl": "https://example.com/car.jpg",
+            "dailyRate": rate
+        }).json()["id"]
+        for make, rate in [("Škoda", 45), ("Tesla", 0.1 + 0.2), ("BMW", 1e16)]
+    ]
+    customer_ids = [
+        client.post("/api/customers", json={
+            "name": f"Zoë {i}",
+            "email": f"zoe{i}@example.com",
+            "phone": "+1 555 0100" if i else None,
+            "licenseNumber": f"LIC-{i}"
+        }).json()["id"]
+        for i in range(2)
+    ]
+    for i, car_id in enumerate(car_ids[:2]):
+        client.post("/api/rentals", json={
+            "carId": car_id,
+            "customerId": customer_ids[i],
+            "startDate": date.today().isoformat(),
+            "endDate": (date.today() + timedelta(days=3)).isoformat(),
+            "status": "ACTIVE"
+        })
+    
+    urls = [
+        "/api/cars",
+        "/api/cars?limit=2",
+        f"/api/cars/available?start={date.today()}&end={date.today() + timedelta(days=1)}",
+        "/api/customers?limit=5",
+        "/api/rentals",
+        "/api/rentals?expand=car,customer",
+    ]
+    fast = [client.get(url) for url in urls]
+    
+    settings = dataclasses.replace(backend.serialization.settings, fast_json=False)
+    monkeypatch.setattr(backend.serialization, "settings", settings)
+    backend.cache.car_cache.clear()
+    default = [client.get(url) for url in urls]
+    
+    for url, fast_response, default_response in zip(urls, fast, default):
+        assert fast_response.content == default_response.content, url
+        assert fast_response.headers["content-type"] == default_response.headers["content-type"]
+        assert fast_response.headers.get("X-Next-Cursor") == default_response.headers.get("X-Next-Cursor")
+        assert fast_response.headers["ETag"] == default_response.headers["ETag"]
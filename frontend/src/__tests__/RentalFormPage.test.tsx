@@ -30,6 +30,21 @@ describe("RentalFormPage", () => {
     });
   });
 
+  it("searches customers as the user types", async () => {
+    const user = userEvent.setup();
+    renderWithRouter(<RentalFormPage />);
+
+    const customerInput = await screen.findByLabelText(/customer/i);
+    await user.type(customerInput, "ali");
+
+    expect(
+      await screen.findByText("Alice Johnson (alice@example.com)"),
+    ).toBeInTheDocument();
+    expect(
+      screen.queryByText("Bob Smith (bob@example.com)"),
+    ).not.toBeInTheDocument();
+  });
+
   it("validates date range", async () => {
     renderWithRouter(<RentalFormPage />);
 
@@ -1,4 +1,10 @@
-import type { Car, CarCreate, CarUpdate } from "../types";
+import type {
+  Car,
+  CarCreate,
+  CarSearchQuery,
+  CarSearchResult,
+  CarUpdate,
+} from "../types";
 
 const API_BASE_URL = "http://localhost:8000";
 
@@ -11,6 +17,23 @@ export const carsApi = {
     return response.json();
   },
 
+  async search(query: CarSearchQuery = {}): Promise<CarSearchResult> {
+    const params = new URLSearchParams();
+    for (const [key, value] of Object.entries(query)) {
+      if (value !== undefined) {
+        params.set(key, String(value));
+      }
+    }
+    const search = params.toString();
+    const response = await fetch(
+      `${API_BASE_URL}/api/cars/search${search ? `?${search}` : ""}`,
+    );
+    if (!response.ok) {
+      throw new Error(`Failed to search cars: ${response.statusText}`);
+    }
+    return response.json();
+  },
+
   async getById(id: number): Promise<Car> {
     const response = await fetch(`${API_BASE_URL}/api/cars/${id}`);
     if (!response.ok) {
@@ -11,6 +11,17 @@ export const customersApi = {
     return response.json();
   },
 
+  async search(q: string, limit = 10): Promise<Customer[]> {
+    const params = new URLSearchParams({ q, limit: String(limit) });
+    const response = await fetch(
+      `${API_BASE_URL}/api/customers/search?${params}`,
+    );
+    if (!response.ok) {
+      throw new Error(`Failed to search customers: ${response.statusText}`);
+    }
+    return response.json();
+  },
+
   async getById(id: number): Promise<Customer> {
     const response = await fetch(`${API_BASE_URL}/api/customers/${id}`);
     if (!response.ok) {
@@ -1,10 +1,24 @@
-import type { Rental, RentalCreate, RentalUpdate } from "../types";
+import type {
+  Rental,
+  RentalCreate,
+  RentalListQuery,
+  RentalUpdate,
+} from "../types";
 
 const API_BASE_URL = "http://localhost:8000";
 
 export const rentalsApi = {
-  async getAll(): Promise<Rental[]> {
-    const response = await fetch(`${API_BASE_URL}/api/rentals`);
+  async getAll(query: RentalListQuery = {}): Promise<Rental[]> {
+    const params = new URLSearchParams();
+    for (const [key, value] of Object.entries(query)) {
+      if (value !== undefined) {
+        params.set(key, String(value));
+      }
+    }
+    const search = params.toString();
+    const response = await fetch(
+      `${API_BASE_URL}/api/rentals${search ? `?${search}` : ""}`,
+    );
     if (!response.ok) {
       throw new Error(`Failed to fetch rentals: ${response.statusText}`);
     }
@@ -9,6 +9,7 @@ import {
   MenuItem,
   Paper,
   Alert,
+  Autocomplete,
 } from "@mui/material";
 import type { RentalCreate, RentalStatus, Car, Customer } from "../types";
 import { rentalsApi } from "../api/rentals";
@@ -17,6 +18,9 @@ import { customersApi } from "../api/customers";
 import { LoadingSpinner } from "../components/LoadingSpinner";
 import { ErrorAlert } from "../components/ErrorAlert";
 
+// Delay after the last keystroke before searching customers
+const CUSTOMER_SEARCH_DELAY_MS = 300;
+
 export function RentalFormPage() {
   const { id } = useParams<{ id: string }>();
   const navigate = useNavigate();
@@ -25,7 +29,9 @@ export function RentalFormPage() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [cars, setCars] = useState<Car[]>([]);
-  const [customers, setCustomers] = useState<Customer[]>([]);
+  const [customer, setCustomer] = useState<Customer | null>(null);
+  const [customerQuery, setCustomerQuery] = useState("");
+  const [customerOptions, setCustomerOptions] = useState<Customer[]>([]);
   const [formData, setFormData] = useState<RentalCreate>({
     carId: 0,
     customerId: 0,
@@ -39,18 +45,43 @@ export function RentalFormPage() {
     loadData();
   }, [id]);
 
+  // Typeahead: search customers once typing pauses, ignoring stale results
+  useEffect(() => {
+    const query = customerQuery.trim();
+    if (!query) {
+      setCustomerOptions([]);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(async () => {
+      try {
+        const results = await customersApi.search(query);
+        if (!cancelled) setCustomerOptions(results);
+      } catch (err) {
+        if (!cancelled) {
+          setError(
+            err instanceof Error ? err.message : "Failed to search customers",
+          );
+        }
+      }
+    }, CUSTOMER_SEARCH_DELAY_MS);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
+  }, [customerQuery]);
+
   const loadData = async () => {
     try {
       setLoading(true);
-      const [carsData, customersData] = await Promise.all([
-        carsApi.getAll(),
-        customersApi.getAll(),
-      ]);
+      const carsData = await carsApi.getAll();
       setCars(carsData);
-      setCustomers(customersData);
 
       if (isEditMode) {
         const rental = await rentalsApi.getById(Number(id));
+        const rentalCustomer = await customersApi.getById(rental.customerId);
+        setCustomer(rentalCustomer);
+        setCustomerOptions([rentalCustomer]);
         setFormData({
           carId: rental.carId,
           customerId: rental.customerId,
@@ -186,26 +217,36 @@ export function RentalFormPage() {
             ))}
           </TextField>
 
-          <TextField
-            fullWidth
-            select
-            label="Customer"
-            value={formData.customerId || ""}
-            onChange={(e) => handleChange("customerId", Number(e.target.value))}
-            error={!!errors.customerId}
-            helperText={errors.customerId}
-            margin="normal"
-            required
-          >
-            <MenuItem value="">
-              <em>Select a customer</em>
-            </MenuItem>
-            {customers.map((customer) => (
-              <MenuItem key={customer.id} value={customer.id}>
-                {customer.name} ({customer.email})
-              </MenuItem>
-            ))}
-          </TextField>
+          <Autocomplete
+            options={customerOptions}
+            value={customer}
+            onChange={(_, value) => {
+              setCustomer(value);
+              handleChange("customerId", value?.id ?? 0);
+            }}
+            onInputChange={(_, value, reason) => {
+              // "reset" is the input showing the selected customer
+              if (reason !== "reset") setCustomerQuery(value);
+            }}
+            getOptionLabel={(option) => `${option.name} (${option.email})`}
+            isOptionEqualToValue={(option, value) => option.id === value.id}
+            filterOptions={(options) => options}
+            noOptionsText={
+              customerQuery.trim() ? "No matching customers" : "Type to search"
+            }
+            renderInput={(params) => (
+              <TextField
+                {...params}
+                label="Customer"
+                error={!!errors.customerId}
+                helperText={
+                  errors.customerId || "Search by name, email or phone"
+                }
+                margin="normal"
+                required
+              />
+            )}
+          />
 
           <TextField
             fullWidth
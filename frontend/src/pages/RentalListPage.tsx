@@ -21,10 +21,8 @@ import {
   Delete as DeleteIcon,
 } from "@mui/icons-material";
 import { useNavigate } from "react-router-dom";
-import type { Rental, RentalStatus, Car, Customer } from "../types";
+import type { Rental, RentalStatus } from "../types";
 import { rentalsApi } from "../api/rentals";
-import { carsApi } from "../api/cars";
-import { customersApi } from "../api/customers";
 import { LoadingSpinner } from "../components/LoadingSpinner";
 import { ErrorAlert } from "../components/ErrorAlert";
 import { SuccessAlert } from "../components/SuccessAlert";
@@ -32,9 +30,6 @@ import { ConfirmDialog } from "../components/ConfirmDialog";
 
 export function RentalListPage() {
   const [rentals, setRentals] = useState<Rental[]>([]);
-  const [filteredRentals, setFilteredRentals] = useState<Rental[]>([]);
-  const [cars, setCars] = useState<Car[]>([]);
-  const [customers, setCustomers] = useState<Customer[]>([]);
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [success, setSuccess] = useState<string | null>(null);
@@ -51,23 +46,17 @@ export function RentalListPage() {
 
   useEffect(() => {
     loadData();
-  }, []);
-
-  useEffect(() => {
-    filterRentals();
-  }, [rentals, statusFilter]);
+  }, [statusFilter]);
 
   const loadData = async () => {
     try {
       setLoading(true);
-      const [rentalsData, carsData, customersData] = await Promise.all([
-        rentalsApi.getAll(),
-        carsApi.getAll(),
-        customersApi.getAll(),
-      ]);
+      // Filter server-side and embed car/customer data in the same request
+      const rentalsData = await rentalsApi.getAll({
+        ...(statusFilter !== "ALL" && { status: statusFilter }),
+        expand: "car,customer",
+      });
       setRentals(rentalsData);
-      setCars(carsData);
-      setCustomers(customersData);
     } catch (err) {
       setError(err instanceof Error ? err.message : "Failed to load rentals");
     } finally {
@@ -75,16 +64,6 @@ export function RentalListPage() {
     }
   };
 
-  const filterRentals = () => {
-    if (statusFilter === "ALL") {
-      setFilteredRentals(rentals);
-    } else {
-      setFilteredRentals(
-        rentals.filter((rental) => rental.status === statusFilter),
-      );
-    }
-  };
-
   const handleDelete = async () => {
     if (!deleteDialog.rental) return;
 
@@ -99,13 +78,13 @@ export function RentalListPage() {
     }
   };
 
-  const getCarName = (carId: number) => {
-    const car = cars.find((c) => c.id === carId);
+  const getCarName = (rental: Rental) => {
+    const car = rental.car;
     return car ? `${car.make} ${car.model}` : "Unknown";
   };
 
-  const getCustomerName = (customerId: number) => {
-    const customer = customers.find((c) => c.id === customerId);
+  const getCustomerName = (rental: Rental) => {
+    const customer = rental.customer;
     return customer ? customer.name : "Unknown";
   };
 
@@ -189,10 +168,10 @@ export function RentalListPage() {
             </TableRow>
           </TableHead>
           <TableBody>
-            {filteredRentals.map((rental) => (
+            {rentals.map((rental) => (
               <TableRow key={rental.id}>
-                <TableCell>{getCarName(rental.carId)}</TableCell>
-                <TableCell>{getCustomerName(rental.customerId)}</TableCell>
+                <TableCell>{getCarName(rental)}</TableCell>
+                <TableCell>{getCustomerName(rental)}</TableCell>
                 <TableCell>
                   {new Date(rental.startDate).toLocaleDateString()}
                 </TableCell>
@@ -232,7 +211,7 @@ export function RentalListPage() {
         </Table>
       </TableContainer>
 
-      {filteredRentals.length === 0 && (
+      {rentals.length === 0 && (
         <Box textAlign="center" py={4}>
           <Typography variant="body1" color="text.secondary">
             No rentals found
@@ -94,6 +94,21 @@ export const handlers = [
   http.get(`${BASE_URL}/customers`, () => {
     return HttpResponse.json(mockCustomers);
   }),
+  http.get(`${BASE_URL}/customers/search`, ({ request }) => {
+    const params = new URL(request.url).searchParams;
+    const words = (params.get("q") ?? "").toLowerCase().split(/\s+/);
+    const limit = Number(params.get("limit") ?? 10);
+    const matches = mockCustomers.filter((c) =>
+      words.every((word) =>
+        [c.name, c.email, c.phone ?? "", c.licenseNumber]
+          .join(" ")
+          .toLowerCase()
+          .split(/[\s@.-]+/)
+          .some((token) => token.startsWith(word)),
+      ),
+    );
+    return HttpResponse.json(matches.slice(0, limit));
+  }),
   http.get(`${BASE_URL}/customers/:id`, ({ params }) => {
     const customer = mockCustomers.find((c) => c.id === Number(params.id));
     if (!customer) {
@@ -126,8 +141,24 @@ export const handlers = [
   }),
 
   // Rentals
-  http.get(`${BASE_URL}/rentals`, () => {
-    return HttpResponse.json(mockRentals);
+  http.get(`${BASE_URL}/rentals`, ({ request }) => {
+    const params = new URL(request.url).searchParams;
+    const status = params.get("status");
+    const expand = (params.get("expand") ?? "").split(",");
+    const rentals = status
+      ? mockRentals.filter((r) => r.status === status)
+      : mockRentals;
+    return HttpResponse.json(
+      rentals.map((r) => ({
+        ...r,
+        ...(expand.includes("car") && {
+          car: mockCars.find((c) => c.id === r.carId),
+        }),
+        ...(expand.includes("customer") && {
+          customer: mockCustomers.find((c) => c.id === r.customerId),
+        }),
+      })),
+    );
   }),
   http.get(`${BASE_URL}/rentals/:id`, ({ params }) => {
     const rental = mockRentals.find((r) => r.id === Number(params.id));
@@ -33,6 +33,35 @@ export interface CarUpdate {
   dailyRate?: number;
 }
 
+export type PriceBand = "0-50" | "50-100" | "100-200" | "200+";
+
+export interface CarSearchQuery {
+  make?: string;
+  model?: string;
+  year?: number;
+  status?: CarStatus;
+  priceBand?: PriceBand;
+  limit?: number;
+  cursor?: string;
+}
+
+export interface FacetCount {
+  value: string | number;
+  count: number;
+}
+
+export interface CarSearchResult {
+  total: number;
+  items: Car[];
+  facets: {
+    make: FacetCount[];
+    model: FacetCount[];
+    year: FacetCount[];
+    status: FacetCount[];
+    priceBand: FacetCount[];
+  };
+}
+
 export interface Customer {
   id: number;
   name: string;
@@ -63,6 +92,8 @@ export interface Rental {
   endDate: string; // ISO date string
   status: RentalStatus;
   totalCost: number;
+  car?: Car; // present when requested with expand=car
+  customer?: Customer; // present when requested with expand=customer
 }
 
 export interface RentalCreate {
@@ -80,3 +111,23 @@ export interface RentalUpdate {
   endDate?: string;
   status?: RentalStatus;
 }
+
+export type RentalSort =
+  | "id"
+  | "-id"
+  | "startDate"
+  | "-startDate"
+  | "endDate"
+  | "-endDate";
+
+export interface RentalListQuery {
+  status?: RentalStatus;
+  carId?: number;
+  customerId?: number;
+  startFrom?: string;
+  startTo?: string;
+  endFrom?: string;
+  endTo?: string;
+  sort?: RentalSort;
+  expand?: string; // comma-separated: "car", "customer"
+}